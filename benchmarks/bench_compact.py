@@ -0,0 +1,81 @@
+"""Benchmark for the compact positional form against dict unstructuring.
+
+Compares encoded JSON size and the time to encode and decode an order
+with many lines, with and without default elision.
+
+    python benchmarks/bench_compact.py [--lines N] [--rounds N]
+"""
+
+import argparse
+import json
+import time
+import typing as ty
+
+import attr
+
+from typecats import Cat
+
+
+@Cat
+class Line:
+    sku: str
+    qty: int = 1
+    price_cents: int = 0
+    note: str = ""
+    tags: ty.List[str] = attr.Factory(list)
+
+
+@Cat
+class Order:
+    id: str
+    customer: str
+    lines: ty.List[Line]
+    gift: bool = False
+
+
+def _time(fn: ty.Callable[[], ty.Any], rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--lines", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    order = Order(
+        "o1",
+        "c1",
+        [Line(f"sku{i}", qty=i % 3 + 1, price_cents=i * 10) for i in range(args.lines)],
+    )
+    forms: ty.Dict[
+        str, ty.Tuple[ty.Callable[[], ty.Any], ty.Callable[[ty.Any], ty.Any]]
+    ] = {
+        "dict": (order.unstruc, Order.struc),
+        "dict, strip_defaults": (
+            lambda: order.unstruc(strip_defaults=True),
+            Order.struc,
+        ),
+        "compact": (order.unstruc_compact, Order.struc_compact),
+        "compact, strip_defaults": (
+            lambda: order.unstruc_compact(strip_defaults=True),
+            Order.struc_compact,
+        ),
+    }
+    for name, (encode, decode) in forms.items():
+        payload = encode()
+        assert decode(payload) == order
+        size = len(json.dumps(payload))
+        encode_s = _time(encode, args.rounds)
+        decode_s = _time(lambda: decode(payload), args.rounds)
+        print(
+            f"{name:24} {size:8} bytes  encode {encode_s * 1e6:8.1f} us"
+            f"  decode {decode_s * 1e6:8.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Benchmark for generic-heavy models: an envelope Cat parameterized over many payload Cats.
+
+Measures the cost of the first structure per parameterization, of
+pre-building them with TypecatsConverter.specialize, and steady-state
+throughput once every parameterization's hooks exist.
+
+    python benchmarks/bench_generics.py [--payload-types N] [--items N]
+"""
+
+import argparse
+import time
+import typing as ty
+
+import attr
+
+from typecats import Cat, TypecatsConverter
+
+T = ty.TypeVar("T")
+
+
+def _models(converter: TypecatsConverter, n: int) -> ty.Tuple[type, ty.List[type]]:
+    @Cat(converter=converter)
+    class Page(ty.Generic[T]):
+        items: ty.List[T]
+        cursor: str = ""
+        total: int = 0
+
+    payloads = [
+        Cat(converter=converter)(
+            attr.make_class(
+                f"Payload{i}",
+                {
+                    "id": attr.ib(type=str),
+                    "value": attr.ib(type=int, default=0),
+                    "labels": attr.ib(type=ty.List[str], factory=list),
+                },
+            )
+        )
+        for i in range(n)
+    ]
+    return Page, payloads
+
+
+def _page(i: int, items: int) -> dict:
+    return dict(
+        items=[dict(id=f"{i}-{j}", value=str(j), labels=["x"]) for j in range(items)],
+        cursor="next",
+        total=items,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--payload-types", type=int, default=200)
+    parser.add_argument("--items", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    cold = TypecatsConverter()
+    Page, payloads = _models(cold, args.payload_types)
+    pages = [_page(i, args.items) for i in range(args.payload_types)]
+    start = time.perf_counter()
+    for payload, page in zip(payloads, pages):
+        cold.structure(page, Page[payload])
+    cold_s = time.perf_counter() - start
+    print(
+        f"first structure of {len(payloads)} parameterizations: {cold_s * 1000:8.1f} ms"
+    )
+
+    warm = TypecatsConverter()
+    Page, payloads = _models(warm, args.payload_types)
+    start = time.perf_counter()
+    types = warm.specialize(Page, *payloads)
+    print(
+        f"specialize {len(types)} parameterizations:        "
+        f"{(time.perf_counter() - start) * 1000:8.1f} ms"
+    )
+
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        for typ, page in zip(types, pages):
+            warm.unstructure(warm.structure(page, typ), typ)
+    steady_s = time.perf_counter() - start
+    n = args.rounds * len(types)
+    print(
+        f"steady state struc+unstruc:             {steady_s / n * 1e6:8.1f} us/page"
+        f"  ({n / steady_s:8.0f} pages/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
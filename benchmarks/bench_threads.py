@@ -0,0 +1,106 @@
+"""Contention benchmark for Cat.struc_many across threads.
+
+Run with a free-threaded build (e.g. python3.14t) to see scaling across
+cores; on builds with a GIL the thread counts should perform about the same.
+
+    python benchmarks/bench_threads.py [--items N] [--repeat R]
+"""
+
+import argparse
+import sys
+import threading
+import time
+import typing as ty
+from concurrent.futures import ThreadPoolExecutor
+
+import attr
+
+from typecats import Cat, TypecatsConverter
+
+
+@Cat
+class Address:
+    street: str
+    city: str
+    zip: str = ""
+
+
+@Cat
+class Person:
+    name: str
+    age: int
+    emails: ty.List[str] = attr.Factory(list)
+    address: ty.Optional[Address] = None
+
+
+def _payloads(n: int) -> ty.List[dict]:
+    return [
+        dict(
+            name=f"person {i}",
+            age=i % 90,
+            emails=[f"p{i}@example.com"],
+            address=dict(street=f"{i} Main St", city="Springfield"),
+        )
+        for i in range(n)
+    ]
+
+
+def bench_struc_many(items: ty.List[dict], repeat: int) -> None:
+    baseline = None
+    for threads in (1, 2, 4, 8):
+        best = min(
+            _timed(lambda: Person.struc_many(items, threads=threads))
+            for _ in range(repeat)
+        )
+        baseline = baseline or best
+        print(
+            f"struc_many threads={threads}: {best * 1000:8.1f} ms"
+            f"  ({len(items) / best:10.0f} items/s, {baseline / best:4.2f}x)"
+        )
+
+
+def bench_first_use(threads: int) -> None:
+    """Many threads structuring on a fresh converter whose hooks are not yet generated."""
+    converter = TypecatsConverter()
+
+    @Cat(converter=converter)
+    class Fresh:
+        name: str
+        values: ty.Dict[str, ty.List[int]]
+
+    barrier = threading.Barrier(threads)
+
+    def work() -> None:
+        barrier.wait()
+        for _ in range(1000):
+            Fresh.struc(dict(name="x", values=dict(a=[1, 2])))
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        for future in [pool.submit(work) for _ in range(threads)]:
+            future.result()
+    print(
+        f"first use, {threads} threads:  {(time.perf_counter() - start) * 1000:8.1f} ms"
+    )
+
+
+def _timed(fn: ty.Callable[[], ty.Any]) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+    bench_struc_many(_payloads(args.items), args.repeat)
+    bench_first_use(8)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Benchmark for memoized unstruc of frozen Cats.
+
+Unstructures the same instances repeatedly, as a service handing out
+long-lived reference data would, with and without `cache_unstruc`.
+
+    python benchmarks/bench_unstruc_cache.py [--items N] [--rounds N]
+"""
+
+import argparse
+import time
+import typing as ty
+
+from typecats import Cat
+
+
+def _cats(cache_unstruc: bool) -> ty.Tuple[type, type]:
+    @Cat(frozen=True, cache_unstruc=cache_unstruc)
+    class Currency:
+        code: str
+        symbol: str = ""
+        decimals: int = 2
+
+    @Cat(frozen=True, cache_unstruc=cache_unstruc)
+    class Country:
+        code: str
+        name: str
+        currency: Currency
+        languages: ty.Tuple[str, ...] = ()
+        region: str = ""
+
+    return Currency, Country
+
+
+def _time(fn: ty.Callable[[], ty.Any], rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=100)
+    args = parser.parse_args()
+
+    for cache_unstruc in (False, True):
+        Currency, Country = _cats(cache_unstruc)
+        currencies = [Currency(f"C{i}", "$") for i in range(args.items)]
+        countries = [
+            Country(f"K{i}", f"Country {i}", Currency(f"C{i}"), ("en", "fr"))
+            for i in range(args.items)
+        ]
+        label = "cached" if cache_unstruc else "uncached"
+        for name, items in (("flat", currencies), ("nested", countries)):
+            seconds = _time(lambda: [item.unstruc() for item in items], args.rounds)
+            print(f"{name:7} {label:9} {seconds:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
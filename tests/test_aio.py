@@ -0,0 +1,75 @@
+import asyncio
+import pickle
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from typecats import Cat, StructuringError, astruc_iter, astruc_many
+from typecats.aio import StrucMethod
+
+
+@Cat
+class Event:
+    name: str
+    seq: int = 0
+
+
+ITEMS = [dict(name=f"e{i}", seq=i) for i in range(200)]
+
+
+def test_astruc_many_matches_struc():
+    res = asyncio.run(Event.astruc_many(ITEMS, budget_ms=0.01))
+    assert res == [Event.struc(item) for item in ITEMS]
+
+
+def test_astruc_iter_yields_to_the_loop():
+    ticks = list()
+
+    async def ticker():
+        while True:
+            ticks.append(time.perf_counter())
+            await asyncio.sleep(0)
+
+    async def run():
+        task = asyncio.create_task(ticker())
+        await asyncio.sleep(0)
+        ticks.clear()
+        res = [e async for e in Event.astruc_iter(ITEMS, budget_ms=0)]
+        task.cancel()
+        return res
+
+    res = asyncio.run(run())
+    assert len(res) == len(ITEMS)
+    # with a zero budget, the loop gets a turn after every item
+    assert len(ticks) >= len(ITEMS) - 1
+
+
+def test_struc_errors_are_raised():
+    with pytest.raises(StructuringError):
+        asyncio.run(Event.astruc_many([dict(name="ok"), dict(name="")]))
+
+
+def test_try_struc_semantics():
+    res = asyncio.run(astruc_many(Event.try_struc, [dict(name="ok"), dict(name="")]))
+    assert res == [Event("ok"), None]
+
+    async def collect():
+        return [e async for e in astruc_iter(Event.try_struc, [None, dict(name="x")])]
+
+    assert asyncio.run(collect()) == [None, Event("x")]
+
+
+def test_offloads_to_an_executor_above_threshold():
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        res = asyncio.run(Event.astruc_many(ITEMS, executor=pool, offload_above=10))
+        assert res == [Event.struc(item) for item in ITEMS]
+
+        with pytest.raises(StructuringError):
+            asyncio.run(Event.astruc_many([dict(name="")], executor=pool))
+
+
+def test_struc_method_is_picklable():
+    method = pickle.loads(pickle.dumps(StrucMethod(Event, "try_struc")))
+    assert method(dict(name="")) is None
+    assert method(dict(name="p")) == Event("p")
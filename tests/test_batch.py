@@ -0,0 +1,97 @@
+import threading
+import typing as ty
+from concurrent.futures import ThreadPoolExecutor
+
+import attr
+import pytest
+
+from typecats import Cat, StructuringError, TypecatsConverter, struc_many
+
+
+@Cat
+class Item:
+    name: str
+    seq: int = 0
+    tags: ty.List[str] = attr.Factory(list)
+
+
+ITEMS = [dict(name=f"i{i}", seq=str(i), tags=["a"]) for i in range(500)]
+
+
+def test_struc_many_preserves_order():
+    expected = [Item.struc(item) for item in ITEMS]
+    assert Item.struc_many(ITEMS) == expected
+    assert Item.struc_many(iter(ITEMS), threads=4) == expected
+    assert Item.struc_many(list(), threads=4) == list()
+    assert Item.struc_many(ITEMS[:1], threads=4) == expected[:1]
+
+
+def test_struc_many_with_an_executor():
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        assert struc_many(Item.try_struc, [dict(name="x"), None], executor=pool) == [
+            Item("x"),
+            None,
+        ]
+
+
+def test_struc_many_raises_errors():
+    bad = ITEMS[:100] + [dict(name="")] + ITEMS[100:]
+    with pytest.raises(StructuringError):
+        Item.struc_many(bad, threads=4)
+    with pytest.raises(ValueError):
+        Item.struc_many(ITEMS, threads=0)
+
+
+def test_hooks_are_generated_once_under_contention():
+    converter = TypecatsConverter()
+    generated = list()
+    barrier = threading.Barrier(8)
+
+    @Cat(converter=converter)
+    class Contended:
+        x: int
+
+    original = converter._structure_func.dispatch._generate
+
+    def counting(typ):
+        generated.append(typ)
+        return original(typ)
+
+    converter._structure_func.dispatch._generate = counting
+
+    def work():
+        barrier.wait()
+        return Contended.struc(dict(x="1"))
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = [f.result() for f in [pool.submit(work) for _ in range(8)]]
+
+    assert results == [Contended(1)] * 8
+    assert generated.count(Contended) == 1
+
+
+def test_registering_hooks_replaces_generated_ones():
+    converter = TypecatsConverter()
+
+    @Cat(converter=converter)
+    class Hooked:
+        x: int
+
+    assert Hooked.struc(dict(x=1)) == Hooked(1)
+    converter.register_structure_hook(Hooked, lambda d, _t: Hooked(d["x"] + 1))
+    assert Hooked.struc(dict(x=1)) == Hooked(2)
+
+
+def test_set_detailed_validation():
+    converter = TypecatsConverter()
+
+    @Cat(converter=converter)
+    class Validated:
+        x: int
+
+    with pytest.raises(StructuringError):
+        Validated.struc(dict(x="x"))
+    converter.set_detailed_validation(False)
+    assert not converter.detailed_validation
+    with pytest.raises(StructuringError):
+        Validated.struc(dict(x="x"))
@@ -0,0 +1,124 @@
+import gc
+import json
+import os
+import typing as ty
+
+import attr
+import pytest
+
+import typecats.catfile as catfile
+from typecats import Cat, CatFile, StructuringError
+
+
+@Cat
+class Record:
+    id: int
+    name: str
+    tags: ty.List[str] = attr.Factory(list)
+
+
+def _write(path, records) -> None:
+    with open(path, "w") as f:
+        for r in records:
+            f.write((json.dumps(r) if isinstance(r, dict) else r) + "\n")
+
+
+@pytest.fixture
+def path(tmp_path):
+    path = str(tmp_path / "records.jsonl")
+    _write(
+        path,
+        [
+            dict(id=i, name=f"r{i}", tags=["even"] if i % 2 == 0 else [])
+            for i in range(10)
+        ],
+    )
+    return path
+
+
+def test_random_access_and_slicing(path):
+    with CatFile(path, Record) as records:
+        assert len(records) == 10
+        assert records[3] == Record(3, "r3")
+        assert records[-1].id == 9
+        assert [r.id for r in records[2:8:2]] == [2, 4, 6]
+        assert [r.id for r in records][:3] == [0, 1, 2]
+        with pytest.raises(IndexError):
+            records[10]
+
+
+def test_filtered_iteration(path):
+    with CatFile(path, Record) as records:
+        evens = records.filter(lambda r: r.id > 2, contains=b'"even"')
+        assert [r.id for r in evens] == [4, 6, 8]
+        assert len(list(records.filter(lambda r: r.name == "r1"))) == 1
+
+
+def test_index_is_persisted_and_refreshed(path):
+    CatFile(path, Record).close()
+    index_path = path + ".idx"
+    assert os.path.exists(index_path)
+    with open(index_path, "rb") as f:
+        saved = f.read()
+    with CatFile(path, Record) as records:
+        assert len(records) == 10
+    with open(index_path, "rb") as f:
+        assert f.read() == saved
+
+    _write(path, ["", json.dumps(dict(id=1, name="new")), "   ", ""])
+    with CatFile(path, Record) as records:
+        assert len(records) == 1
+        assert records[0].name == "new"
+
+
+def test_cache_keeps_recent_cats(path):
+    with CatFile(path, Record, cache_size=2) as records:
+        first = records[0]
+        assert records[0] is first
+        records[1]
+        records[2]
+        assert records[0] is not first
+    with CatFile(path, Record) as uncached:
+        assert uncached[0] is not uncached[0]
+
+
+def test_invalid_records_raise_when_accessed(tmp_path):
+    path = str(tmp_path / "bad.jsonl")
+    _write(path, [dict(id=1, name="ok"), dict(id=2, name="")])
+    with CatFile(path, Record) as records:
+        assert records[0].id == 1
+        with pytest.raises(StructuringError):
+            records[1]
+
+
+def test_empty_file(tmp_path):
+    path = str(tmp_path / "empty.jsonl")
+    open(path, "w").close()
+    with CatFile(path, Record) as records:
+        assert len(records) == 0
+        assert list(records) == []
+
+
+def test_file_is_closed_on_errors_and_collection(path, monkeypatch):
+    closed = list()
+    close = catfile._close
+
+    def recording_close(file, data):
+        close(file, data)
+        closed.append(file)
+
+    def failing_build_index(data):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(catfile, "_close", recording_close)
+    monkeypatch.setattr(catfile, "_build_index", failing_build_index)
+    with pytest.raises(RuntimeError):
+        CatFile(path, Record)
+    assert len(closed) == 1 and closed[0].closed
+
+    monkeypatch.undo()
+    records = CatFile(path, Record)
+    file = records._file
+    del records
+    gc.collect()
+    assert file.closed
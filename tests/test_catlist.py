@@ -0,0 +1,120 @@
+import pickle
+
+import attr
+import pytest
+from cattrs.errors import IterableValidationError
+
+from typecats import Cat, CatList, StructuringError, TypecatsConverter
+
+
+@Cat
+class File:
+    name: str
+    size: int = 0
+
+
+@Cat
+class Folder:
+    name: str
+    files: CatList[File]
+
+
+def _folder(n: int = 5) -> dict:
+    return dict(name="f", files=[dict(name=f"file{i}", size=i) for i in range(n)])
+
+
+def test_structures_items_on_access():
+    payload = _folder()
+    folder = Folder.struc(payload)
+    files = folder.files
+    assert isinstance(files, CatList)
+    assert len(files) == 5
+    assert files.structured_count == 0
+
+    assert files[1] == File("file1", 1)
+    assert files[1] is files[1]
+    assert files.structured_count == 1
+    assert [f.size for f in files[3:]] == [3, 4]
+    assert files == [File(f"file{i}", i) for i in range(5)]
+
+
+def test_unstruc_passes_untouched_items_through():
+    payload = _folder(3)
+    folder = Folder.struc(payload)
+    folder.files[0].size = 100  # mutating an accessed item is kept
+
+    res = folder.unstruc()
+    assert res["files"][0] == dict(name="file0", size=100)
+    assert res["files"][1] == payload["files"][1]
+    res["files"][1]["name"] = "changed"  # a copy, not the CatList's own item
+    assert folder.unstruc()["files"][1]["name"] == "file1"
+
+
+def test_unstruc_strips_defaults_of_untouched_items():
+    folder = Folder.struc(
+        dict(name="f", files=[dict(name="a", size=0), dict(name="b", size=0)])
+    )
+    folder.files[0].name = "A"
+    assert folder.unstruc(strip_defaults=True) == dict(
+        name="f", files=[dict(name="A"), dict(name="b")]
+    )
+    assert folder.files.structured_count == 1
+
+
+def test_validate():
+    folder = Folder.struc(dict(name="f", files=[dict(name="ok"), dict(size=1), {}]))
+    assert folder.files[0].name == "ok"
+    with pytest.raises(IterableValidationError) as e:
+        folder.files.validate()
+    assert len(e.value.exceptions) == 2
+    with pytest.raises(StructuringError):
+        folder.files[1]
+
+    ok = Folder.struc(_folder(3))
+    ok.files.validate()
+    assert ok.files.structured_count == 3
+
+
+def test_standalone_and_plain_lists():
+    files = CatList([dict(name="a")], File)
+    assert files[0] == File("a")
+    assert repr(files) == "CatList[File](1 items, 1 structured)"
+
+    # attributes may also be given plain lists of Cats in code
+    folder = Folder("f", [File("a")])  # type: ignore[arg-type]
+    assert folder.unstruc()["files"] == [dict(name="a", size=0)]
+
+    with pytest.raises(StructuringError):
+        Folder.struc(dict(name="f", files="nope"))
+
+
+def test_uses_the_converters_hooks_and_recursion():
+    converter = TypecatsConverter()
+
+    @Cat(converter=converter)
+    class Node:
+        name: str
+        children: CatList["Node"] = attr.Factory(lambda: CatList([], Node))
+
+    attr.resolve_types(Node, localns=dict(Node=Node, CatList=CatList))
+    converter.register_structure_hook(str, lambda v, _t: str(v).upper())
+
+    tree = Node.struc(dict(name="a", children=[dict(name="b", children=[])]))
+    assert tree.children[0].name == "B"
+    assert tree.children[0].children.unstruc_items(lambda n: n) == []
+
+
+def test_pickles():
+    folder = Folder.struc(_folder(3))
+    assert folder.files[1] == File("file1", 1)
+
+    unpickled = pickle.loads(pickle.dumps(folder))
+    files = unpickled.files
+    assert isinstance(files, CatList)
+    assert files.structured_count == 1
+    assert files == folder.files
+    assert files.structured_count == 3
+    assert unpickled.unstruc() == folder.unstruc()
+
+    plain = pickle.loads(pickle.dumps(CatList([dict(a=1)], dict, structure=dict)))
+    assert plain[0] == dict(a=1)
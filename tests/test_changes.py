@@ -0,0 +1,146 @@
+import typing as ty
+
+import attr
+import pytest
+
+from typecats import Cat, clear_changes, get_changes
+
+
+@Cat
+class Address:
+    city: str = ""
+
+
+@Cat(track_changes=True)
+class Item:
+    id: str
+    count: int = 0
+    address: Address = attr.Factory(Address)
+    tags: ty.List[str] = attr.Factory(list)
+
+
+@Cat(track_changes=True)
+class WildItem(dict):
+    id: str
+    count: int = 0
+
+
+def test_nothing_changed_after_struc():
+    item = Item.struc(dict(id="a", count=3))
+    assert get_changes(item) == frozenset()
+    assert item.unstruc_changes() == dict()
+
+
+def test_attribute_assignment_is_recorded():
+    item = Item.struc(dict(id="a", count=3))
+    item.count = 4
+    item.address = Address("Atlanta")
+
+    assert get_changes(item) == {"count", "address"}
+    assert item.unstruc_changes() == dict(count=4, address=dict(city="Atlanta"))
+
+    clear_changes(item)
+    assert item.unstruc_changes() == dict()
+
+
+def test_unstruc_changes_strips_defaults_only_inside_changed_values():
+    item = Item.struc(dict(id="a", count=3, address=dict(city="Atlanta")))
+    item.address = Address()
+    item.tags = ["x"]
+
+    assert item.unstruc_changes() == dict(address=dict(city=""), tags=["x"])
+    assert item.unstruc_changes(strip_defaults=True) == dict(address={}, tags=["x"])
+
+
+def test_unstruc_changes_keeps_changes_back_to_defaults():
+    item = Item.struc(dict(id="a", count=3))
+    item.count = 0
+
+    assert item.unstruc_changes() == dict(count=0)
+    assert item.unstruc_changes(strip_defaults=True) == dict(count=0)
+
+
+def test_wildcat_extras_are_recorded():
+    wi = WildItem.struc(dict(id="a", color="red", size=1, shape="round"))
+    assert get_changes(wi) == frozenset()
+
+    wi["color"] = "blue"
+    wi.update(dict(weight=2))
+    wi.pop("size")
+    del wi["shape"]
+    wi["count"] = 5  # an attribute, assigned via the dict interface
+
+    assert get_changes(wi) == {"color", "weight", "size", "shape", "count"}
+    assert wi.unstruc_changes() == dict(color="blue", weight=2, count=5)
+
+
+def test_composes_with_user_on_setattr():
+    @Cat(track_changes=True, on_setattr=attr.setters.validate)
+    class Validated:
+        name: str
+
+    val = Validated("a")
+    with pytest.raises(ValueError):
+        val.name = ""
+    val.name = "b"
+    assert get_changes(val) == {"name"}
+
+
+def test_untracked_cats_report_no_changes():
+    addr = Address("x")
+    addr.city = "y"
+    assert get_changes(addr) == frozenset()
+    assert not hasattr(addr, "unstruc_changes")
+
+
+def test_rejects_frozen_and_slotted():
+    with pytest.raises(TypeError):
+
+        @Cat(track_changes=True, frozen=True)
+        class Frozen:
+            name: str
+
+    with pytest.raises(TypeError):
+
+        @Cat(track_changes=True, slots=True)
+        class Slotted:
+            name: str
+
+
+def test_cat_subclasses_track_changes():
+    @Cat
+    class SubItem(Item):
+        note: str = ""
+
+    sub = SubItem.struc(dict(id="s"))
+    sub.note = "n"
+    sub.count = 2
+    assert sub.unstruc_changes() == dict(note="n", count=2)
+
+    class Plain(Item):
+        pass
+
+    plain = Plain("p")
+    plain.count = 1
+    assert plain.unstruc_changes() == dict(count=1)
+
+    @attr.s(auto_attribs=True)
+    class AttrsOnly(Item):
+        note: str = ""
+
+    attrs_only = AttrsOnly("a")
+    attrs_only.note = "n"
+    with pytest.raises(TypeError, match="does not track changes"):
+        attrs_only.unstruc_changes()
+
+
+def test_rejects_frozen_parents():
+    @Cat(frozen=True)
+    class FrozenBase:
+        name: str
+
+    with pytest.raises(TypeError, match="subclasses frozen FrozenBase"):
+
+        @Cat(track_changes=True)
+        class Tracked(FrozenBase):
+            count: int = 0
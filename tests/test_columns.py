@@ -0,0 +1,85 @@
+import typing as ty
+
+import attr
+import pytest
+
+from typecats import Cat, StructuringError
+
+np = pytest.importorskip("numpy")
+
+
+@Cat
+class Point:
+    x: int
+    y: int
+
+
+@Cat
+class Reading:
+    sensor: str
+    value: float
+    ok: bool = True
+    count: int = 0
+    location: ty.Optional[Point] = None
+    labels: ty.List[str] = attr.Factory(list)
+
+
+RECORDS = [
+    dict(sensor="a", value=1.5, location=dict(x=1, y=2)),
+    dict(sensor="b", value="2.5", ok=False, count=3, labels=["hot"]),
+    dict(sensor="a", value=3, count="4"),
+]
+
+
+def test_numeric_and_string_columns():
+    cols = Reading.struc_columns(RECORDS)
+
+    assert len(cols) == 3
+    assert cols.columns["value"].dtype == np.float64
+    assert cols.columns["value"].sum() == 7.0
+    assert cols.columns["count"].tolist() == [0, 3, 4]
+    assert cols.columns["ok"].tolist() == [True, False, True]
+    assert cols.columns["sensor"].dtype == object
+    # repeated strings share one object
+    assert cols.columns["sensor"][0] is cols.columns["sensor"][2]
+
+
+def test_nested_columns_use_converter_hooks():
+    cols = Reading.struc_columns(iter(RECORDS))
+    assert cols.columns["location"] == [Point(1, 2), None, None]
+    assert cols.columns["labels"] == [[], ["hot"], []]
+
+
+def test_rows_are_built_on_demand():
+    cols = Reading.struc_columns(RECORDS)
+
+    assert cols[0] == Reading.struc(RECORDS[0])
+    assert cols[-1] == Reading.struc(RECORDS[2])
+    assert cols[1:] == [Reading.struc(r) for r in RECORDS[1:]]
+    assert list(cols) == [Reading.struc(r) for r in RECORDS]
+    assert type(cols[0].count) is int
+
+
+def test_unstruc_back_to_records():
+    cols = Reading.struc_columns(RECORDS)
+    assert cols.unstruc() == [Reading.struc(r).unstruc() for r in RECORDS]
+
+
+def test_wildcat_extras_round_trip():
+    @Cat
+    class Wild(dict):
+        id: str
+
+    cols = Wild.struc_columns([dict(id="a", extra=1), dict(id="b")])
+
+    assert cols[0] == Wild.struc(dict(id="a", extra=1))
+    assert cols.unstruc() == [dict(id="a", extra=1), dict(id="b")]
+
+
+def test_required_columns_are_checked():
+    with pytest.raises(StructuringError):
+        Reading.struc_columns([dict(sensor="a", value=1), dict(sensor="", value=1)])
+    with pytest.raises(StructuringError):
+        Reading.struc_columns([dict(sensor="a")])
+    with pytest.raises(StructuringError):
+        Reading.struc_columns([dict(sensor="a", value="heavy")])
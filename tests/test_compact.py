@@ -0,0 +1,138 @@
+import json
+import typing as ty
+
+import attr
+import pytest
+
+from typecats import Cat, CompactSchemaError, StructuringError, TypecatsConverter
+from typecats.compact import schema_fingerprint
+
+
+@Cat
+class Line:
+    sku: str
+    qty: int = 1
+    tags: ty.List[str] = attr.Factory(list)
+
+
+@Cat
+class Order:
+    id: str
+    lines: ty.List[Line]
+    by_sku: ty.Dict[str, Line] = attr.Factory(dict)
+    gift: ty.Optional[Line] = None
+
+
+@Cat
+class Extra(dict):
+    id: str
+
+
+def _order() -> Order:
+    line = Line("a", 2, ["x"])
+    return Order("o1", [line, Line("b")], by_sku=dict(a=line))
+
+
+def test_round_trips_positionally():
+    order = _order()
+    payload = order.unstruc_compact()
+    assert payload == [
+        schema_fingerprint(Order),
+        "o1",
+        [["a", 2, ["x"]], ["b", 1, []]],
+        {"a": ["a", 2, ["x"]]},
+        None,
+    ]
+    assert Order.struc_compact(json.loads(json.dumps(payload))) == order
+    assert len(json.dumps(payload)) < 0.6 * len(json.dumps(order.unstruc()))
+
+
+def test_default_elision():
+    order = _order()
+    payload = order.unstruc_compact(strip_defaults=True)
+    assert payload == [
+        "~" + schema_fingerprint(Order),
+        0b0111,
+        "o1",
+        [[0b111, "a", 2, ["x"]], [0b001, "b"]],
+        {"a": [0b111, "a", 2, ["x"]]},
+    ]
+    assert Order.struc_compact(payload) == order
+
+
+def test_wildcat_extras():
+    extra = Extra.struc(dict(id="e", color="red"))
+    payload = extra.unstruc_compact()
+    assert payload[1:] == ["e", dict(color="red")]
+    assert Extra.struc_compact(payload) == extra
+    assert Extra.struc_compact(payload)["color"] == "red"
+
+
+def test_pep_604_optionals():
+    @Cat
+    class Pep604Order:
+        id: str
+        lines: ty.List[Line]
+        by_sku: ty.Dict[str, Line] = attr.Factory(dict)
+        gift: Line | None = None
+
+    assert schema_fingerprint(Pep604Order) == schema_fingerprint(Order)
+    order = _order()
+    order.gift = Line("g")
+    payload = order.unstruc_compact()
+    pep604 = Pep604Order.struc_compact(payload)
+    assert pep604.gift == Line("g")
+    assert pep604.unstruc_compact() == payload
+    assert Pep604Order.struc_compact(_order().unstruc_compact()).gift is None
+
+
+def test_fingerprints_detect_schema_changes():
+    @Cat
+    class Swapped:
+        qty: int
+        sku: str
+
+    @Cat
+    class Outer:
+        lines: ty.List[Line]
+
+    @Cat
+    class OuterSwapped:
+        lines: ty.List[Swapped]
+
+    assert schema_fingerprint(Swapped) != schema_fingerprint(Line)
+    assert schema_fingerprint(Outer) != schema_fingerprint(OuterSwapped)
+
+    payload = Line("a").unstruc_compact()
+    with pytest.raises(CompactSchemaError):
+        Swapped.struc_compact(payload)
+    with pytest.raises(StructuringError):
+        Swapped.struc_compact([])
+
+
+def test_recursive_cats():
+    @Cat
+    class Node:
+        name: str
+        children: ty.List["Node"] = attr.Factory(list)
+
+    attr.resolve_types(Node, localns=dict(Node=Node))
+    tree = Node("root", [Node("a", [Node("b")])])
+    assert Node.struc_compact(tree.unstruc_compact()) == tree
+    assert Node.struc_compact(tree.unstruc_compact(strip_defaults=True)) == tree
+
+
+def test_validation_and_hooks():
+    converter = TypecatsConverter()
+
+    @Cat(converter=converter)
+    class Reading:
+        sensor: str
+        value: float
+
+    payload = Reading("s", 1.5).unstruc_compact()
+    with pytest.raises(StructuringError):
+        Reading.struc_compact([payload[0], "", 1.5])  # empty str disallowed
+
+    converter.register_structure_hook(float, lambda v, _t: float(v) * 2)
+    assert Reading.struc_compact(payload) == Reading("s", 3.0)
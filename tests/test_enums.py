@@ -0,0 +1,110 @@
+import enum
+import typing as ty
+
+import pytest
+
+from typecats import Cat, StructuringError, TypecatsConverter
+
+
+def test_structures_values_and_aliases_to_members():
+    @Cat
+    class Color(enum.Enum):
+        RED = "red"
+        GREEN = "green"
+        CRIMSON = "red"  # an alias of RED
+
+    @Cat
+    class Paint:
+        color: Color
+        colors: ty.List[Color]
+
+    paint = Paint.struc(dict(color="green", colors=["red", "green"]))
+    assert paint.color is Color.GREEN
+    assert paint.colors == [Color.RED, Color.GREEN]
+    assert Color.struc("red") is Color.CRIMSON is Color.RED
+    assert Color.struc(Color.GREEN) is Color.GREEN
+    assert paint.unstruc() == dict(color="green", colors=["red", "green"])
+    assert Color.GREEN.unstruc() == "green"  # type: ignore[attr-defined]
+
+
+def test_unknown_values_raise_by_default():
+    @Cat
+    class Size(enum.IntEnum):
+        S = 1
+        M = 2
+
+    @Cat
+    class Shirt:
+        size: Size
+
+    with pytest.raises(ValueError, match="3 is not a valid"):
+        Size.struc(3)
+    with pytest.raises(StructuringError):
+        Shirt.struc(dict(size=3))
+    with pytest.raises(ValueError):
+        Size.struc([1])  # unhashable
+
+
+@pytest.mark.parametrize("unknown", [None, "OTHER"])
+def test_unknown_value_policy(unknown):
+    converter = TypecatsConverter()
+
+    class Kind(enum.Enum):
+        A = "a"
+        OTHER = "other"
+
+    Cat(Kind, converter=converter, enum_unknown=unknown and Kind.OTHER)
+    expected = unknown and Kind.OTHER
+
+    @Cat(converter=converter)
+    class Thing:
+        kind: ty.Optional[Kind] = None
+
+    assert Thing.struc(dict(kind="b")).kind is expected
+    assert Thing.struc(dict(kind="a")).kind is Kind.A
+    assert Thing.struc(dict(kind=["a"])).kind is expected
+
+
+def test_missing_and_flags_still_work():
+    @Cat(enum_unknown=None)
+    class Level(enum.Enum):
+        LOW = "low"
+        HIGH = "high"
+
+        @classmethod
+        def _missing_(cls, value):
+            return cls.__members__.get(str(value).upper())
+
+    @Cat
+    class Perm(enum.Flag):
+        R = 1
+        W = 2
+
+    assert Level.struc("LOW") is Level.LOW
+    assert Level.struc("nope") is None
+    assert Perm.struc(3) == Perm.R | Perm.W
+    assert (Perm.R | Perm.W).unstruc() == 3  # type: ignore[attr-defined]
+
+
+def test_typed_values_are_structured_first():
+    @Cat
+    class Port(enum.Enum):
+        _value_: int
+        HTTP = 80
+        HTTPS = 443
+
+    assert Port.struc("443") is Port.HTTPS
+
+
+def test_enum_unknown_is_checked():
+    class Kind(enum.Enum):
+        A = "a"
+
+    with pytest.raises(TypeError):
+        Cat(Kind, enum_unknown="a")
+
+    with pytest.raises(TypeError):
+
+        @Cat(enum_unknown=None)
+        class NotAnEnum:
+            a: int
@@ -129,3 +129,40 @@ def test_generic_with_unstruc_strip_defaults():
     assert unstruc(mgc, strip_defaults=True) == dict(
         a=dict(t=dict(pig="babe")), b=dict(t=dict(bar=4))
     )
+
+
+def test_specialize_pregenerates_generic_hooks():
+    from typecats import TypecatsConverter
+
+    converter = TypecatsConverter()
+
+    @Cat(converter=converter)
+    class Page(ty.Generic[T]):
+        items: ty.List[T]
+        cursor: str = ""
+
+    @Cat(converter=converter)
+    class Pair(ty.Generic[T, M]):
+        first: T
+        second: ty.Optional[M] = None
+
+    @Cat(converter=converter)
+    class WildPage(dict, ty.Generic[T]):
+        items: ty.List[T]
+
+    page_real, page_int = converter.specialize(Page, RealMessage, int)
+    assert page_real == Page[RealMessage]
+    assert converter.specialize(Pair, (int, RealMessage)) == [Pair[int, RealMessage]]
+
+    generation = converter.structure_generation
+    page = converter.structure(dict(items=[dict(id="a", val="1")]), page_real)
+    assert page.items == [RealMessage("a", 1)]
+    assert converter.structure(dict(items=["2"]), page_int).items == [2]
+    assert converter.structure_generation == generation
+
+    (wild_page,) = converter.specialize(WildPage, RealMessage)
+    wp = converter.structure(dict(items=[dict(id="b", val=2)], extra=1), wild_page)
+    assert wp["extra"] == 1
+    assert converter.unstructure(wp, wild_page) == dict(
+        items=[dict(id="b", val=2)], extra=1
+    )
@@ -0,0 +1,57 @@
+import typing as ty
+
+import pytest
+
+from typecats import Cat, StructuringError, TypecatsConverter
+
+
+def _cats(converter: TypecatsConverter):
+    @Cat(converter=converter)
+    class Line:
+        sku: str
+        qty: int = 1
+
+    @Cat(converter=converter)
+    class Order:
+        id: str
+        lines: ty.List[Line]
+
+    return Line, Order
+
+
+def test_stats_per_class():
+    converter = TypecatsConverter(instrument=True)
+    Line, Order = _cats(converter)
+
+    order = Order.struc(dict(id="o", lines=[dict(sku="a"), dict(sku="b", qty=2)]))
+    assert Order.try_struc(dict(id="", lines=[])) is None
+    with pytest.raises(StructuringError):
+        Line.struc(dict(qty=1))
+    order.unstruc()
+    order.unstruc(strip_defaults=True)
+
+    stats = converter.stats()
+    assert stats["structure"][Order].calls == 2
+    assert stats["structure"][Order].failures == 1
+    assert stats["structure"][Order].payload_keys == 4
+    assert stats["structure"][Line].calls == 3
+    assert stats["structure"][Line].failures == 1
+    # nested Cats are timed on their own and as part of their parent
+    assert stats["structure"][Order].total_s >= stats["structure"][Order].max_s > 0
+    assert stats["unstructure"][Order].calls == 2
+    assert stats["unstructure"][Line].calls == 4
+
+    converter.reset_stats()
+    assert converter.stats() == dict(structure={}, unstructure={})
+    Line.struc(dict(sku="c"))
+    assert converter.stats()["structure"][Line].calls == 1
+
+
+def test_uninstrumented_converters_have_no_stats():
+    converter = TypecatsConverter()
+    Line, _ = _cats(converter)
+    hook = converter.get_structure_hook(Line)
+
+    Line.struc(dict(sku="a"))
+    assert converter.stats() == dict(structure={}, unstructure={})
+    assert hook.__name__ == "structure_typecat"
@@ -0,0 +1,98 @@
+import json
+import typing as ty
+from typing import Literal
+
+import attr
+import pytest
+
+from typecats import INTERN, Cat, InternTable, TypecatsConverter
+
+
+def _cats(converter: TypecatsConverter):
+    @Cat(converter=converter)
+    class Address:
+        kind: Literal["home", "work"]
+        country: str = attr.ib(metadata={INTERN: True})
+        city: str = ""
+        region: ty.Optional[str] = attr.ib(default=None, metadata={INTERN: True})
+
+    @Cat(converter=converter, frozen=True)
+    class Person:
+        name: str
+        addresses: ty.List[Address]
+
+    return Address, Person
+
+
+def _payload(n: int) -> list:
+    # json.loads makes a new str object for every value
+    return json.loads(
+        json.dumps(
+            [
+                dict(
+                    name=f"p{i}",
+                    addresses=[dict(kind="home", country="US", city=f"c{i}")],
+                )
+                for i in range(n)
+            ]
+        )
+    )
+
+
+def test_interns_literal_and_marked_attributes():
+    converter = TypecatsConverter(intern=True)
+    _, Person = _cats(converter)
+    people = [Person.struc(p) for p in _payload(3)]
+    first, second = people[0].addresses[0], people[1].addresses[0]
+
+    assert first.kind is "home"  # noqa: F632 # the Literal's own str
+    assert first.country is second.country
+    assert first.city is not people[2].addresses[0].city
+
+    stats = converter.intern_stats()
+    assert stats.entries == 1  # Literals don't need the table
+    assert stats.hits == 5  # 3 kinds, 2 repeated countries
+    assert stats.bytes_saved > 0
+
+
+def test_without_interning():
+    converter = TypecatsConverter()
+    _, Person = _cats(converter)
+    first, second = [Person.struc(p).addresses[0] for p in _payload(2)]
+    assert first.country == second.country
+    assert first.country is not second.country
+    assert converter.intern_stats().hits == 0
+
+
+def test_bounded_table_and_sys_intern():
+    table = InternTable(max_size=1)
+    assert table.intern("a") == "a"
+    b1, b2 = "".join(["b", "b"]), "".join(["b", "b"])
+    assert table.intern(b1) is b1
+    assert table.intern(b2) is b2  # full
+    assert table.stats().entries == 1
+
+    unbounded = InternTable(max_size=None)
+    assert unbounded.intern("".join(["x", "y"])) is "xy"  # noqa: F632
+
+
+def test_only_str_attributes_can_be_marked():
+    converter = TypecatsConverter(intern=True)
+
+    @Cat(converter=converter)
+    class Bad:
+        n: int = attr.ib(metadata={INTERN: True})
+
+    with pytest.raises(TypeError):
+        Bad.struc(dict(n=1))
+
+
+def test_pep_604_optionals():
+    @Cat(converter=TypecatsConverter(intern=True))
+    class Tag:
+        label: str | None = attr.ib(default=None, metadata={INTERN: True})
+        kind: Literal["a", "b"] | None = None
+
+    first, second = [Tag.struc(json.loads('{"label": "x", "kind": "a"}')) for _ in "12"]
+    assert first.label is second.label
+    assert first.kind is "a"  # noqa: F632 # the Literal's own str
@@ -0,0 +1,79 @@
+import json
+import sys
+import typing as ty
+from concurrent.futures import ThreadPoolExecutor
+
+import attr
+import pytest
+
+from typecats import Cat
+from typecats.interpreters import (
+    InterpreterPool,
+    RemoteStructuringError,
+    _struc_json_chunk,
+    struc_json_many,
+)
+
+
+@Cat
+class Reading:
+    sensor: str
+    value: float = 0.0
+    tags: ty.List[str] = attr.Factory(list)
+
+
+PAYLOADS = [
+    json.dumps(dict(sensor=f"s{i}", value=str(i), tags=["t"])).encode()
+    for i in range(50)
+]
+EXPECTED = [Reading.struc(json.loads(p)).unstruc() for p in PAYLOADS]
+
+
+def test_worker_structures_and_normalizes():
+    ref = f"{__name__}:Reading"
+    assert _struc_json_chunk(ref, PAYLOADS[:2], "unstruc", 0) == EXPECTED[:2]
+    assert _struc_json_chunk(ref, PAYLOADS[:1], "json", 0) == [
+        json.dumps(EXPECTED[0]).encode()
+    ]
+
+
+def test_pool_with_another_executor_preserves_order():
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        pool = InterpreterPool(executor=executor, workers=3)
+        assert pool.struc_json_many(Reading, PAYLOADS) == EXPECTED
+        assert pool.struc_json_many(Reading, iter(PAYLOADS), chunk_size=7) == EXPECTED
+
+
+def test_errors_report_the_failing_item():
+    payloads = PAYLOADS[:5] + [b'{"sensor": ""}']
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pool = InterpreterPool(executor=executor, workers=2)
+        with pytest.raises(RemoteStructuringError) as exc_info:
+            pool.struc_json_many(Reading, payloads)
+        with pytest.raises(ValueError):
+            pool.struc_json_many(Reading, payloads, output="yaml")  # type: ignore[arg-type]
+    assert exc_info.value.index == 5
+
+
+def test_local_cats_are_rejected():
+    @Cat
+    class Local:
+        x: int
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        with pytest.raises(ValueError):
+            InterpreterPool(executor=executor).struc_json_many(Local, [b"{}"])
+
+
+@pytest.mark.skipif(sys.version_info >= (3, 14), reason="sub-interpreters available")
+def test_requires_python_314():
+    with pytest.raises(ImportError):
+        InterpreterPool()
+
+
+@pytest.mark.skipif(sys.version_info < (3, 14), reason="requires Python 3.14")
+def test_sub_interpreters():
+    assert struc_json_many(Reading, PAYLOADS, workers=2) == EXPECTED
+    assert struc_json_many(Reading, PAYLOADS[:3], workers=2, output="json") == [
+        json.dumps(e).encode() for e in EXPECTED[:3]
+    ]
@@ -0,0 +1,78 @@
+import typing as ty
+
+import attr
+import pytest
+
+from typecats import (
+    Cat,
+    StructuringError,
+    StructuringLimitError,
+    StructuringLimits,
+    TypecatsConverter,
+)
+
+
+def _cats(converter: TypecatsConverter):
+    @Cat(converter=converter)
+    class Node:
+        name: str
+        children: ty.List["Node"] = attr.Factory(list)
+        attrs: ty.Dict[str, int] = attr.Factory(dict)
+
+    attr.resolve_types(Node, localns=dict(Node=Node))
+    return Node
+
+
+def _tree(depth: int) -> dict:
+    node: dict = dict(name="leaf")
+    for i in range(depth):
+        node = dict(name=f"n{i}", children=[node])
+    return node
+
+
+def test_converter_level_limits():
+    converter = TypecatsConverter(
+        limits=StructuringLimits(max_depth=10, max_collection_size=5, max_nodes=50)
+    )
+    Node = _cats(converter)
+
+    assert Node.struc(_tree(3)).children[0].name == "n1"
+
+    with pytest.raises(StructuringLimitError, match="max_depth=10"):
+        Node.struc(_tree(6))
+    with pytest.raises(StructuringLimitError, match="6 items exceeds"):
+        Node.struc(dict(name="wide", children=[dict(name="c")] * 6))
+    with pytest.raises(StructuringLimitError, match="max_nodes=50"):
+        Node.struc(
+            dict(name="big", children=[dict(name="c", attrs=dict(a=1, b=2))] * 5)
+            | dict(attrs={str(i): i for i in range(5)})
+            | dict(children=[dict(name="c", children=[dict(name="d")] * 5)] * 5)
+        )
+    # counts start over with every top-level call
+    assert Node.struc(_tree(3)).name == "n2"
+    assert Node.try_struc(_tree(6)) is None
+
+
+def test_limit_errors_are_structuring_errors():
+    converter = TypecatsConverter(limits=StructuringLimits(max_collection_size=1))
+    Node = _cats(converter)
+    with pytest.raises(StructuringError):
+        Node.struc(dict(name="x", attrs=dict(a=1, b=2)))
+    converter.set_structuring_limits(None)
+    assert Node.struc(dict(name="x", attrs=dict(a=1, b=2))).attrs == dict(a=1, b=2)
+
+
+def test_per_call_limits():
+    converter = TypecatsConverter()
+    Node = _cats(converter)
+
+    assert Node.struc(_tree(20)).name == "n19"
+    limits = StructuringLimits(max_depth=4)
+    with pytest.raises(StructuringLimitError):
+        Node.struc(_tree(20), limits=limits)
+    assert Node.try_struc(_tree(20), limits=limits) is None
+    assert Node.struc(_tree(1), only={"name"}, limits=limits).name == "n0"
+    assert converter.limited(limits) is converter.limited(limits)
+
+    converter.register_structure_hook(Node, lambda d, _t: Node("hooked"))
+    assert Node.struc(_tree(20), limits=limits).name == "hooked"
@@ -0,0 +1,151 @@
+import copy
+import pickle
+import typing as ty
+
+import attr
+import pytest
+
+from typecats import Cat, get_changes
+
+
+@Cat
+class Line:
+    sku: str
+    qty: int = 1
+
+
+@Cat
+class Order:
+    id: str
+    lines: ty.List[Line]
+
+
+@Cat
+class Open(dict):
+    id: str
+
+
+@Cat(frozen=True, slots=True)
+class Point:
+    x: int
+    y: int
+
+
+@Cat(frozen=True, cache_unstruc=True)
+class Frozen:
+    name: str
+
+
+@Cat(track_changes=True)
+class Tracked(dict):
+    name: str
+
+
+@Cat
+class Custom:
+    name: str
+
+    def __reduce__(self):
+        return (Custom, ("custom",))
+
+
+def _round_trip(obj):
+    return pickle.loads(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def test_cats_pickle_positionally():
+    order = Order("o", [Line("a"), Line("b", 2)])
+    assert order.__reduce_ex__(pickle.HIGHEST_PROTOCOL) == (
+        Order.__typecats_reconstruct__,
+        (("id", "lines"), "o", order.lines),
+    )
+    assert _round_trip(order) == order
+
+    assert _round_trip(Point(1, 2)) == Point(1, 2)
+    assert copy.deepcopy(order) == order
+
+
+def test_wildcat_extras_are_one_dict():
+    wild = Open.struc(dict(id="w", a=1, b=[2]))
+    reduced = wild.__reduce_ex__(pickle.HIGHEST_PROTOCOL)
+    assert reduced[1] == (("id",), "w", dict(a=1, b=[2]))
+    unpickled = _round_trip(wild)
+    assert unpickled == wild
+    assert unpickled["b"] == [2]
+
+
+def test_unpickling_skips_validators():
+    # the empty sku would fail validation in __init__
+    invalid = Line.__typecats_reconstruct__(("sku", "qty"), "", 1)
+    assert invalid.sku == ""
+    assert _round_trip(invalid).sku == ""
+
+
+def test_other_state():
+    frozen = Frozen("f")
+    frozen.unstruc()  # memoized, but not pickled
+    assert set(vars(frozen)) > {"name"}
+    assert set(vars(_round_trip(frozen))) == {"name"}
+
+    tracked = Tracked.struc(dict(name="t"))
+    tracked.name = "u"
+    tracked["k"] = 1
+    unpickled = _round_trip(tracked)
+    assert unpickled == tracked
+    assert get_changes(unpickled) == {"name", "k"}
+
+
+def test_own_pickling_is_kept():
+    assert _round_trip(Custom("x")) == Custom("custom")
+
+    @attr.s(auto_attribs=True)
+    class Base:
+        name: str
+
+        def __getstate__(self):
+            return dict(name=self.name)
+
+    @Cat
+    class Derived(Base):
+        pass
+
+    assert "__reduce_ex__" not in Derived.__dict__
+
+
+class OwnState(Order):
+    def __getstate__(self):
+        return dict(id=self.id.upper(), lines=self.lines)
+
+    def __setstate__(self, state):
+        self.__dict__.update(state, restored=True)
+
+
+class OwnReduce(Line):
+    def __reduce__(self):
+        return (OwnReduce, ("reduced",))
+
+
+def test_subclasses_own_pickling_is_kept():
+    unpickled = _round_trip(OwnState("o", [Line("a")]))
+    assert type(unpickled) is OwnState
+    assert (unpickled.id, unpickled.lines) == ("O", [Line("a")])
+    assert unpickled.restored
+
+    assert _round_trip(OwnReduce("x")).sku == "reduced"
+    assert copy.copy(OwnState("o", [Line("a")])).id == "O"
+
+
+def test_changed_attributes_are_matched_by_name():
+    # as if Line had been pickled before its attributes were reordered
+    line = Line.__typecats_reconstruct__(("qty", "sku"), 3, "a")
+    assert line == Line("a", 3)
+    # or before qty was added
+    assert Line.__typecats_reconstruct__(("sku",), "a") == Line("a")
+
+    wild = Open.__typecats_reconstruct__(("id",), "w", dict(a=1))
+    assert wild == Open.struc(dict(id="w", a=1))
+
+    with pytest.raises(pickle.UnpicklingError, match="no longer has"):
+        Line.__typecats_reconstruct__(("sku", "count"), "a", 1)
+    with pytest.raises(pickle.UnpicklingError, match="no default"):
+        Line.__typecats_reconstruct__(("qty",), 1)
@@ -0,0 +1,115 @@
+import pickle
+import typing as ty
+
+import attr
+import pytest
+
+from typecats import Cat, StructuringError, TypecatsConverter
+from typecats.projection import Projection
+
+from detailed_validation_utils import unsafe_stack_disable_detailed_validation
+
+
+@Cat
+class Child:
+    name: str
+
+
+@Cat
+class Listing:
+    id: str
+    status: str = "new"
+    count: int = 0
+    children: ty.List[Child] = attr.Factory(list)
+
+
+def test_struc_only_sets_only_requested_fields():
+    lst = Listing.struc(
+        dict(id="a", status="open", children=[dict(name="")]), only={"id", "status"}
+    )
+
+    assert isinstance(lst, Listing)
+    assert lst.id == "a"
+    assert lst.status == "open"
+    with pytest.raises(AttributeError):
+        lst.children  # never structured, so the invalid child is not an error
+
+
+def test_projection_uses_defaults_for_missing_keys():
+    proj = Listing.projection("id", "count", "children")
+    lst = proj.struc(dict(id="a"))
+
+    assert lst.count == 0
+    assert lst.children == []
+
+
+def test_projection_structures_nested_fields():
+    lst = Listing.projection("children")(dict(children=[dict(name="c")]))
+    assert lst.children == [Child("c")]
+
+
+def test_projections_are_cached_per_field_set():
+    assert Listing.projection("id", "status") is Listing.projection("status", "id")
+    assert Listing.projection("id") is not Listing.projection("id", "status")
+
+
+def test_projection_cache_is_reset_by_new_hooks():
+    conv = TypecatsConverter()
+
+    @Cat(converter=conv)
+    class Temp:
+        degrees: float = 0.0
+
+    before = Temp.projection("degrees")
+    conv.register_structure_hook(float, lambda v, _t: float(v) + 273.15)
+
+    assert Temp.projection("degrees") is not before
+    assert Temp.struc(dict(degrees=0), only={"degrees"}).degrees == 273.15
+
+
+def test_projection_runs_validators_of_projected_fields():
+    with pytest.raises(StructuringError):
+        Listing.struc(dict(id=""), only={"id"})
+    with pytest.raises(StructuringError):
+        Listing.struc(dict(status="x"), only={"id"})
+
+    assert Listing.try_struc(dict(id=""), only={"id"}) is None
+    assert Listing.try_struc(None, only={"id"}) is None
+
+
+def test_projection_errors_without_detailed_validation():
+    with unsafe_stack_disable_detailed_validation():
+        with pytest.raises(StructuringError):
+            Listing.struc(dict(id="a", count="many"), only={"id", "count"})
+
+
+def test_projection_rejects_unknown_names():
+    with pytest.raises(ValueError):
+        Listing.projection("id", "nope")
+
+
+def test_projection_of_frozen_cat():
+    @Cat(frozen=True)
+    class Frozen:
+        id: str
+        other: str = ""
+
+    fr = Frozen.struc(dict(id="x", other="y"), only={"id"})
+    assert fr.id == "x"
+    assert isinstance(Frozen.projection("id"), Projection)
+
+
+def test_projected_instances_repr_compare_unstruc_and_pickle():
+    raw = dict(id="a", status="open", count=3)
+    lst = Listing.struc(raw, only={"id", "count"})
+
+    assert repr(lst) == "Listing[projected](id='a', count=3)"
+    assert lst == Listing.struc(dict(raw, status="closed"), only={"count", "id"})
+    assert lst != Listing.struc(raw, only={"id"})
+    assert lst != Listing.struc(raw)
+    assert lst.unstruc() == dict(id="a", count=3)
+    assert lst.unstruc(include={"id", "status"}) == dict(id="a")
+    assert Listing.struc(raw).unstruc(include={"id"}) == dict(id="a")
+
+    copy = pickle.loads(pickle.dumps(lst))
+    assert copy == lst and type(copy) is type(lst)
@@ -0,0 +1,40 @@
+from typecats import Cat, TypecatsConverter
+
+
+def test_resolved_hooks_follow_registrations():
+    converter = TypecatsConverter()
+
+    @Cat(converter=converter)
+    class Temp:
+        degrees: int
+
+    assert Temp.struc(dict(degrees=3)) == Temp(3)
+    assert Temp(3).unstruc() == dict(degrees=3)
+
+    generation = converter.structure_generation
+    converter.register_structure_hook(Temp, lambda d, _t: Temp(d["degrees"] * 10))
+    assert converter.structure_generation > generation
+    assert Temp.struc(dict(degrees=3)) == Temp(30)
+    assert Temp.try_struc(dict(degrees=3)) == Temp(30)
+
+    converter.register_unstructure_hook(Temp, lambda t: dict(c=t.degrees))
+    assert Temp(3).unstruc() == dict(c=3)
+
+
+def test_subclass_instances_use_their_own_hook():
+    @Cat
+    class Base:
+        a: int = 0
+
+    class Sub(Base):
+        pass
+
+    assert Base(1).unstruc() == dict(a=1)
+    assert Sub(2).unstruc() == dict(a=2)
+
+
+def test_detailed_validation_toggle_bumps_the_generation():
+    converter = TypecatsConverter()
+    generation = converter.structure_generation
+    converter.set_detailed_validation(False)
+    assert converter.structure_generation > generation
@@ -0,0 +1,101 @@
+import typing as ty
+
+import attr
+import pytest
+
+from typecats import Cat, StructuringError, TypecatsConverter
+from typecats.tc import set_struc_converter
+
+
+@Cat
+class Item:
+    sku: str
+    qty: int
+    tags: ty.List[str] = attr.Factory(list)
+
+
+@Cat
+class Labeled(dict):
+    id: int
+
+
+def test_rows_in_field_order():
+    assert Item.struc_row(("a", 2, ["x"])) == Item("a", 2, ["x"])
+    assert Item.struc_rows([("a", 2, []), ("b", 3, ["y"])]) == [
+        Item("a", 2, []),
+        Item("b", 3, ["y"]),
+    ]
+
+
+def test_columns_in_any_order_ignore_unknown_columns():
+    rows = [(1, "a", "ignored"), (2, "b", "ignored")]
+    items = Item.struc_rows(rows, columns=["qty", "sku", "rowid"])
+    assert items == [Item("a", 1), Item("b", 2)]
+
+
+def test_rows_use_structure_hooks():
+    converter = TypecatsConverter()
+
+    @Cat(converter=converter)
+    class Reading:
+        sensor: str
+        value: float
+
+    converter.register_structure_hook(float, lambda v, _t: float(v) * 10)
+    assert Reading.struc_row(("s", "1.5")) == Reading("s", 15.0)
+
+
+def test_wildcats_keep_unknown_columns():
+    labeled = Labeled.struc_row((1, "red"), columns=["id", "color"])
+    assert labeled.id == 1
+    assert labeled["color"] == "red"
+
+
+def test_errors_match_struc():
+    with pytest.raises(StructuringError) as row_err:
+        Item.struc_row(("a", "not a number"))
+    with pytest.raises(StructuringError) as dict_err:
+        Item.struc(dict(sku="a", qty="not a number"))
+    assert str(row_err.value) == str(dict_err.value)
+
+    with pytest.raises(StructuringError):
+        Item.struc_row(("a",))  # missing qty
+    with pytest.raises(StructuringError):
+        Item.struc_rows([("a", 1), ("", 1)], columns=["sku", "qty"])
+
+
+def test_errors_report_the_failing_row():
+    converter = TypecatsConverter()
+
+    @Cat(converter=converter)
+    class Pair:
+        a: int
+        b: int
+
+    reported = list()
+    set_struc_converter(
+        Pair, converter, hook_common_errors=lambda e, d, *_: reported.append(d)
+    )
+    with pytest.raises(StructuringError):
+        Pair.struc_rows([(1, 2), (3, "x"), (5, 6)])
+    assert reported == [(3, "x")]
+
+
+def test_row_structurers_are_cached_per_columns():
+    converter = TypecatsConverter()
+
+    @Cat(converter=converter)
+    class Pair:
+        a: int
+        b: int
+
+    assert Pair.struc_row((1, 2)) == Pair(1, 2)
+    structurer = converter.row_structurer(Pair, ["a", "b"])
+    assert converter.row_structurer(Pair, ("a", "b")) is structurer
+    assert converter.row_structurer(Pair, ["b", "a"]) is not structurer
+    converter.register_structure_hook(int, lambda v, _t: int(v) + 1)
+    assert converter.row_structurer(Pair, ["a", "b"]) is not structurer
+    assert Pair.struc_row((1, 2)) == Pair(2, 3)
+
+    with pytest.raises(ValueError):
+        converter.row_structurer(Pair, ["a", "a"])
@@ -0,0 +1,95 @@
+import typing as ty
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from typecats import Cat, StructuringError, TypecatsConverter, register_scalar_hooks
+
+
+def _event_cls(converter: TypecatsConverter):
+    @Cat(converter=converter)
+    class Event:
+        id: uuid.UUID
+        at: datetime
+        day: date
+        amount: Decimal
+        ended: ty.Optional[datetime] = None
+
+    return Event
+
+
+@pytest.mark.parametrize("cache_size", [0, 16])
+def test_round_trip(cache_size):
+    converter = TypecatsConverter()
+    register_scalar_hooks(converter, cache_size=cache_size)
+    Event = _event_cls(converter)
+    id = uuid.uuid4()
+    raw = dict(
+        id=str(id),
+        at="2026-03-01T10:15:00.250000+00:00",
+        day="2026-03-01",
+        amount="12.50",
+        ended="2026-03-01T11:00:00Z",
+    )
+
+    event = Event.struc(raw)
+    assert event.id == id and isinstance(event.id, uuid.UUID)
+    assert event.at == datetime(2026, 3, 1, 10, 15, 0, 250000, tzinfo=timezone.utc)
+    assert event.day == date(2026, 3, 1)
+    assert event.amount == Decimal("12.50")
+    assert event.ended == datetime(2026, 3, 1, 11, tzinfo=timezone.utc)
+    assert event.unstruc() == dict(raw, ended="2026-03-01T11:00:00+00:00")
+
+    # already structured values pass through
+    assert Event.struc(dict(raw, id=id, at=event.at)).at is event.at
+    # except datetimes for dates, which would never equal a date
+    day = Event.struc(dict(raw, day=event.at)).day
+    assert day == date(2026, 3, 1) and type(day) is date
+    # Optional attributes dispatch on the value's runtime type
+    event.ended = "not yet"  # type: ignore[assignment]
+    assert event.unstruc()["ended"] == "not yet"
+
+
+def test_cache_shares_parsed_datetimes():
+    converter = TypecatsConverter()
+    register_scalar_hooks(converter, cache_size=4)
+    Event = _event_cls(converter)
+    raw = dict(id=str(uuid.uuid4()), at="2026-03-01T10:00", day="2026-03-01", amount=1)
+    assert Event.struc(raw).at is Event.struc(raw).at
+
+
+def test_uuid_formats():
+    converter = TypecatsConverter()
+    register_scalar_hooks(converter)
+    u = uuid.uuid4()
+    for text in (str(u), str(u).upper(), u.hex, f"{{{u}}}", u.urn):
+        parsed = converter.structure(text, uuid.UUID)
+        assert parsed == u and parsed.version == 4
+        assert converter.unstructure(parsed) == str(u)
+    with pytest.raises(ValueError):
+        converter.structure(str(u)[:-1] + "g", uuid.UUID)
+
+
+def test_decimals():
+    converter = TypecatsConverter()
+    register_scalar_hooks(converter, decimal_as_str=False)
+    assert converter.structure(0.1, Decimal) == Decimal("0.1")
+    assert converter.structure(3, Decimal) == Decimal(3)
+    assert converter.unstructure(Decimal("1.5")) == Decimal("1.5")
+    with pytest.raises(ValueError):
+        converter.structure("abc", Decimal)
+    with pytest.raises(TypeError):
+        converter.structure(True, Decimal)
+
+
+def test_invalid_values_fail_structuring():
+    converter = TypecatsConverter()
+    register_scalar_hooks(converter)
+    Event = _event_cls(converter)
+    raw = dict(id=str(uuid.uuid4()), at="yesterday", day="2026-03-01", amount=1)
+    with pytest.raises(StructuringError):
+        Event.struc(raw)
+    with pytest.raises(StructuringError):
+        Event.struc(dict(raw, at=1700000000))
@@ -0,0 +1,90 @@
+import typing as ty
+
+import pytest
+
+from typecats import Cat, StructuringError, TypecatsConverter
+from typecats.slow import PayloadSummary, summarize_payload
+
+
+def _cats(converter: TypecatsConverter):
+    @Cat(converter=converter)
+    class Point:
+        x: int
+        y: int
+
+    @Cat(converter=converter)
+    class Shape:
+        name: str
+        points: ty.List[Point]
+
+    return Point, Shape
+
+
+def _shape(n: int) -> dict:
+    return dict(name="s", points=[dict(x=i, y=i) for i in range(n)])
+
+
+def test_reports_oversized_payloads():
+    converter = TypecatsConverter()
+    Point, Shape = _cats(converter)
+    reports = list()
+    converter.set_slow_structuring_hook(
+        lambda report, payload: reports.append((report, payload)), max_payload_nodes=50
+    )
+
+    Shape.struc(_shape(5))
+    assert reports == []
+
+    shape = Shape.struc(_shape(100))
+    report, payload = reports[0]
+    assert report.operation == "structure"
+    assert report.cls is Shape
+    assert report.payload == PayloadSummary(nodes=303, largest_container=100, depth=4)
+    assert report.depth == 1
+    assert set(report.class_times) == {Point}
+    assert not report.failed
+    assert payload["name"] == "s"
+
+    shape.unstruc()
+    assert reports[1][0].operation == "unstructure"
+    assert reports[1][0].payload.nodes == 303
+
+
+def test_reports_slow_calls_including_failures():
+    converter = TypecatsConverter()
+    _, Shape = _cats(converter)
+    reports = list()
+    converter.set_slow_structuring_hook(
+        lambda report, _payload: reports.append(report), threshold_ms=0
+    )
+
+    with pytest.raises(StructuringError):
+        Shape.struc(dict(name="s", points=[dict(x=1)]))
+    assert reports[-1].failed
+    assert len(reports) == 1  # nested Cats are not reported on their own
+
+    converter.set_slow_structuring_hook(None)
+    Shape.struc(_shape(3))
+    assert len(reports) == 1
+
+
+def test_hook_errors_are_swallowed():
+    converter = TypecatsConverter()
+    Point, _ = _cats(converter)
+
+    def broken(_report, _payload):
+        raise RuntimeError("nope")
+
+    converter.set_slow_structuring_hook(broken, threshold_ms=0)
+    assert Point.struc(dict(x=1, y=2)) == Point(1, 2)
+
+
+def test_requires_a_threshold():
+    with pytest.raises(ValueError):
+        TypecatsConverter().set_slow_structuring_hook(lambda r, p: None)
+
+
+def test_summaries_stop_at_the_limit():
+    payload = dict(a=list(range(1000)))
+    assert summarize_payload(payload) == PayloadSummary(1002, 1000, 3)
+    assert summarize_payload(payload, limit=10).nodes == 11
@@ -0,0 +1,103 @@
+import sqlite3
+import typing as ty
+
+import pytest
+
+from typecats import Cat, StructuringError, TypecatsConverter
+from typecats.sqlite import cat_row_factory, iter_cats
+
+
+@Cat
+class Line:
+    sku: str
+    qty: int = 1
+
+
+@Cat
+class Order:
+    id: str
+    lines: ty.List[Line]
+    note: ty.Optional[str] = None
+
+
+@Cat
+class Tagged(dict):
+    id: str
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE orders (id TEXT, lines TEXT, note TEXT, meta TEXT)")
+    conn.executemany(
+        "INSERT INTO orders VALUES (?, ?, ?, ?)",
+        [
+            (f"o{i}", f'[{{"sku": "s{i}", "qty": {i + 1}}}]', None, '{"k": 1}')
+            for i in range(5)
+        ],
+    )
+    yield conn
+    conn.close()
+
+
+def test_row_factory_structures_json_columns(conn):
+    cursor = conn.cursor()
+    cursor.row_factory = cat_row_factory(Order)
+    orders = cursor.execute("SELECT id, lines FROM orders ORDER BY id").fetchall()
+    assert orders[0] == Order("o0", [Line("s0", 1)])
+    assert orders[4].lines[0].qty == 5
+
+    # a new query, with other columns, gets matched again
+    (order,) = cursor.execute(
+        "SELECT 'n' AS note, lines, id, 7 AS unknown FROM orders LIMIT 1"
+    ).fetchall()
+    assert order == Order("o0", [Line("s0", 1)], note="n")
+
+
+def test_wildcat_extras_can_be_json(conn):
+    cursor = conn.cursor()
+    cursor.row_factory = cat_row_factory(Tagged, json_columns=["meta"])
+    tagged = cursor.execute("SELECT id, meta, note FROM orders LIMIT 1").fetchone()
+    assert tagged.id == "o0"
+    assert tagged["meta"] == dict(k=1)
+    assert tagged["note"] is None
+
+
+def test_optional_json_columns(conn):
+    @Cat
+    class Pep604Order:
+        id: str
+        lines: ty.List[Line] | None = None
+
+    @Cat
+    class OptionalOrder:
+        id: str
+        lines: ty.Optional[ty.List[Line]] = None
+
+    for cls in (Pep604Order, OptionalOrder):
+        cursor = conn.cursor()
+        cursor.row_factory = cat_row_factory(cls)
+        order = cursor.execute("SELECT id, lines FROM orders LIMIT 1").fetchone()
+        assert order.lines == [Line("s0", 1)]
+
+
+def test_iter_cats_fetches_in_batches(conn):
+    cursor = conn.execute("SELECT id, lines FROM orders ORDER BY id")
+    orders = iter_cats(cursor, Order, size=2)
+    assert next(orders).id == "o0"
+    assert [o.id for o in orders] == ["o1", "o2", "o3", "o4"]
+
+
+def test_errors_and_converters(conn):
+    converter = TypecatsConverter()
+
+    @Cat(converter=converter)
+    class Count:
+        n: int
+
+    converter.register_structure_hook(int, lambda v, _t: int(v) * 2)
+    cursor = conn.execute("SELECT '21' AS n")
+    assert list(iter_cats(cursor, Count, converter=converter)) == [Count(42)]
+
+    with pytest.raises(StructuringError):
+        list(iter_cats(conn.execute("SELECT 'x' AS n"), Count))
@@ -3,7 +3,7 @@ from typing import Dict, Any
 import attr
 from attr import Factory as fac
 
-from typecats import Cat, unstruc_strip_defaults
+from typecats import Cat, TypecatsConverter, unstruc_strip_defaults
 from typing import Literal
 
 
@@ -120,3 +120,84 @@ def test_default_comparsion_works_on_structured_value():
     hd = HasNested("ben")
     assert hd.nested.i == 2
     assert hd.unstruc(strip_defaults=True) == dict(id="ben")
+
+
+def test_hooks_registered_before_and_after_first_strip_apply():
+    converter = TypecatsConverter()
+
+    class Money:
+        def __init__(self, cents: int):
+            self.cents = cents
+
+        def __eq__(self, other):
+            return isinstance(other, Money) and other.cents == self.cents
+
+    converter.register_unstructure_hook(Money, lambda m: f"{m.cents}c")
+
+    @Cat(converter=converter)
+    class Price:
+        amount: Money = Money(0)
+        note: str = ""
+
+    assert Price(Money(5)).unstruc(strip_defaults=True) == dict(amount="5c")
+
+    converter.register_unstructure_hook(Money, lambda m: m.cents)
+    assert Price(Money(5)).unstruc(strip_defaults=True) == dict(amount=5)
+    assert Price(Money(5)).unstruc() == dict(amount=5, note="")
+
+
+def test_nested_wildcat_extras_are_stripped():
+    @Cat
+    class Inner:
+        i: int = 2
+        s: str = ""
+
+    @Cat
+    class Outer(dict):
+        inner: Inner = fac(Inner)
+
+    outer = Outer()
+    outer["extra"] = Inner(s="x")
+    assert outer.unstruc(strip_defaults=True) == dict(extra=dict(s="x"))
+    assert outer.unstruc() == dict(inner=dict(i=2, s=""), extra=dict(i=2, s="x"))
+
+
+def test_deprecated_should_strip_defaults_is_still_honored():
+    import pytest
+
+    from typecats import strip_defaults
+    from typecats.stack_context import stack_context
+
+    converter = TypecatsConverter()
+
+    @Cat(converter=converter)
+    class Inner:
+        i: int = 2
+        s: str = ""
+
+    class Box:
+        def __init__(self, inner: Inner):
+            self.inner = inner
+
+        def __eq__(self, other):
+            return isinstance(other, Box) and other.inner == self.inner
+
+    # an old-style hook that closes over the converter
+    converter.register_unstructure_hook(
+        Box, lambda b: dict(inner=converter.unstructure(b.inner))
+    )
+
+    @Cat(converter=converter)
+    class Outer:
+        box: Box = Box(Inner())
+        n: int = 0
+
+    outer = Outer(Box(Inner(s="x")), n=1)
+    assert outer.unstruc(strip_defaults=True) == dict(box=dict(inner=dict(s="x")), n=1)
+
+    with pytest.warns(DeprecationWarning):
+        should_strip = strip_defaults.ShouldStripDefaults
+    with pytest.warns(DeprecationWarning):
+        with stack_context(should_strip, True):
+            assert outer.unstruc() == dict(box=dict(inner=dict(s="x")), n=1)
+    assert outer.unstruc() == dict(box=dict(inner=dict(i=2, s="x")), n=1)
@@ -0,0 +1,110 @@
+import typing as ty
+
+import pytest
+
+from typecats import Cat, StructuringError, TypecatsConverter, get_struc_cache
+from typecats.struc_cache import StrucCache, canonical_key
+
+
+@Cat(frozen=True, struc_cache_size=2)
+class Lookup:
+    code: str
+    weight: float = 0.0
+    tags: ty.Tuple[str, ...] = ()
+
+
+def test_identical_payloads_share_an_instance():
+    cache = get_struc_cache(Lookup)
+    assert cache is not None
+    cache.clear()
+
+    first = Lookup.struc(dict(code="a", tags=["x", "y"]))
+    second = Lookup.struc(dict(tags=["x", "y"], code="a"))
+
+    assert first is second
+    assert cache.info() == (1, 1, 2, 1)
+
+
+def test_scalar_types_are_part_of_the_key():
+    assert canonical_key(dict(a=1)) != canonical_key(dict(a=True))
+    assert canonical_key(dict(a=1)) != canonical_key(dict(a=1.0))
+    assert canonical_key(dict(a=[1])) == canonical_key(dict(a=[1]))
+    assert canonical_key(dict(a=object())) is None
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = get_struc_cache(Lookup)
+    assert cache is not None
+    cache.clear()
+
+    a = Lookup.struc(dict(code="a"))
+    Lookup.struc(dict(code="b"))
+    assert Lookup.struc(dict(code="a")) is a
+    Lookup.struc(dict(code="c"))  # evicts b
+
+    assert Lookup.struc(dict(code="a")) is a
+    assert cache.info().currsize == 2
+    assert cache.info().misses == 3
+    Lookup.struc(dict(code="b"))
+    assert cache.info().misses == 4
+
+
+def test_new_structure_hooks_invalidate_the_cache():
+    converter = TypecatsConverter()
+
+    @Cat(converter=converter, frozen=True, struc_cache_size=4)
+    class Tagged:
+        tag: str
+
+    before = Tagged.struc(dict(tag="a"))
+    converter.register_structure_hook(str, lambda v, _t: v.upper())
+    after = Tagged.struc(dict(tag="a"))
+
+    assert before.tag == "a"
+    assert after.tag == "A"
+    assert Tagged.struc(dict(tag="a")) is after
+
+
+def test_failures_are_not_cached():
+    cache = get_struc_cache(Lookup)
+    assert cache is not None
+    cache.clear()
+
+    with pytest.raises(StructuringError):
+        Lookup.struc(dict(code=""))
+    assert Lookup.try_struc(dict(code="")) is None
+    assert cache.info().currsize == 0
+
+
+def test_projections_bypass_the_cache():
+    cache = get_struc_cache(Lookup)
+    assert cache is not None
+    cache.clear()
+
+    Lookup.struc(dict(code="a"), only={"code"})
+    assert cache.info() == (0, 0, 2, 0)
+
+
+def test_requires_frozen_non_wildcat_cats():
+    with pytest.raises(TypeError):
+
+        @Cat(struc_cache_size=8)
+        class Mutable:
+            code: str
+
+    with pytest.raises(TypeError):
+
+        @Cat(frozen=True, struc_cache_size=8)
+        class Wild(dict):
+            code: str
+
+    with pytest.raises(ValueError):
+        StrucCache(0)
+
+
+def test_uncached_cats_have_no_cache():
+    @Cat(frozen=True)
+    class Plain:
+        code: str
+
+    assert get_struc_cache(Plain) is None
@@ -0,0 +1,93 @@
+import enum
+import typing as ty
+from typing import Literal
+
+import pytest
+
+from typecats import Cat, StructuringError, UnknownUnionTagError, struc
+from typecats.tagged_union import find_union_tag
+
+
+@Cat
+class Created:
+    kind: Literal["created"]
+    id: str
+
+
+@Cat
+class Deleted:
+    kind: Literal["deleted", "removed"]
+    id: str
+    hard: bool = False
+
+
+@Cat
+class Envelope:
+    event: ty.Union[Created, Deleted]
+    previous: ty.Optional[ty.Union[Created, Deleted]] = None
+
+
+Event = ty.Union[Created, Deleted]
+
+
+def test_structures_by_tag():
+    assert struc(Event, dict(kind="created", id="a")) == Created("created", "a")
+    assert struc(Event, dict(kind="removed", id="b", hard=True)) == Deleted(
+        "removed", "b", True
+    )
+    env = Envelope.struc(dict(event=dict(kind="deleted", id="c")))
+    assert env == Envelope(Deleted("deleted", "c"))
+    assert env.unstruc() == dict(
+        event=dict(kind="deleted", id="c", hard=False), previous=None
+    )
+
+
+def test_unknown_and_missing_tags():
+    with pytest.raises(UnknownUnionTagError, match="Unknown 'kind' tag 'updated'"):
+        struc(Event, dict(kind="updated", id="a"))
+    with pytest.raises(UnknownUnionTagError, match="Missing 'kind' tag"):
+        struc(Event, dict(id="a"))
+    with pytest.raises(StructuringError):
+        struc(Event, dict(kind=["created"], id="a"))
+    with pytest.raises(StructuringError):
+        Envelope.struc(dict(event=dict(kind="nope", id="a")))
+
+
+def test_members_are_still_validated():
+    with pytest.raises(StructuringError):
+        struc(Event, dict(kind="created", id=""))
+
+
+def test_index_requires_disjoint_literals_on_every_member():
+    @Cat
+    class Other:
+        kind: Literal["created"]
+
+    @Cat
+    class Untagged:
+        id: str
+
+    name, index = find_union_tag(Event)  # type: ignore[misc]
+    assert name == "kind"
+    assert index == {"created": Created, "deleted": Deleted, "removed": Deleted}
+    assert find_union_tag(ty.Union[Created, Other]) is None
+    assert find_union_tag(ty.Union[Created, Untagged]) is None
+    assert find_union_tag(ty.Union[Created, int]) is None
+    assert find_union_tag(Created | Deleted | None) is not None
+
+
+def test_enum_tags_match_their_values():
+    class Kind(enum.Enum):
+        A = "a"
+        B = "b"
+
+    @Cat
+    class A:
+        kind: Literal[Kind.A]
+
+    @Cat
+    class B:
+        kind: Literal[Kind.B]
+        n: int = 0
+
+    assert type(struc(ty.Union[A, B], dict(kind="b"))) is B
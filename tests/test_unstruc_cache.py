@@ -0,0 +1,149 @@
+import typing as ty
+
+import pytest
+
+from typecats import Cat, TypecatsConverter
+
+
+@Cat(frozen=True, cache_unstruc=True)
+class Country:
+    code: str
+    names: ty.Tuple[str, ...] = ()
+    region: str = ""
+
+
+@Cat(frozen=True, cache_unstruc=True)
+class WildCountry(dict):
+    code: str
+
+
+def test_cached_result_is_shared():
+    country = Country("US", ("United States",))
+    first = country.unstruc()
+    assert first == dict(code="US", names=["United States"], region="")
+    assert country.unstruc() is first
+
+    stripped = country.unstruc(strip_defaults=True)
+    assert stripped == dict(code="US", names=["United States"])
+    assert country.unstruc(strip_defaults=True) is stripped
+    assert country.unstruc() is first
+
+
+def test_unstructure_hooks_run_once_per_instance():
+    conv = TypecatsConverter()
+    calls = list()
+
+    class Flag:
+        pass
+
+    @Cat(converter=conv, frozen=True, cache_unstruc=True)
+    class Flagged:
+        flag: Flag
+
+    def unstructure_flag(flag):
+        calls.append(flag)
+        return "flag"
+
+    conv.register_unstructure_hook(Flag, unstructure_flag)
+
+    flagged = Flagged(Flag())
+    for _ in range(3):
+        assert flagged.unstruc() == dict(flag="flag")
+    assert len(calls) == 1
+
+    assert flagged.unstruc(strip_defaults=True) == dict(flag="flag")
+    assert len(calls) == 2
+
+
+def test_cache_is_per_converter_and_hook_generation():
+    loud, quiet = TypecatsConverter(), TypecatsConverter()
+    loud.register_unstructure_hook(str, str.upper)
+
+    country = Country("us", ("United States",))
+    assert loud.unstructure(country)["code"] == "US"
+    assert quiet.unstructure(country)["code"] == "us"
+    assert loud.unstructure(country)["code"] == "US"
+
+    loud.register_unstructure_hook(str, str.lower)
+    assert loud.unstructure(country)["names"] == ["united states"]
+
+
+def test_nested_cached_cats():
+    @Cat
+    class Holder:
+        country: Country
+
+    holder = Holder(Country("FR"))
+    assert holder.unstruc() == dict(country=dict(code="FR", names=[], region=""))
+    assert holder.unstruc() == holder.unstruc()
+
+
+def test_wildcat_extras_are_not_cached():
+    wc = WildCountry.struc(dict(code="DE", capital="Berlin"))
+    assert wc.unstruc() == dict(code="DE", capital="Berlin")
+
+    wc["capital"] = "Bonn"
+    assert wc.unstruc() == dict(code="DE", capital="Bonn")
+
+
+def test_requires_frozen_unslotted_cats():
+    with pytest.raises(TypeError):
+
+        @Cat(cache_unstruc=True)
+        class Mutable:
+            code: str
+
+    with pytest.raises(TypeError):
+
+        @Cat(frozen=True, slots=True, cache_unstruc=True)
+        class Slotted:
+            code: str
+
+
+@Cat
+class Mutable:
+    code: str
+
+
+@Cat
+class Wild(dict):
+    code: str
+
+
+@Cat(frozen=True)
+class HoldsMutable:
+    inner: ty.Optional[Mutable] = None
+
+
+@pytest.mark.parametrize(
+    "typ",
+    [
+        ty.List[str],
+        ty.Dict[str, int],
+        ty.Set[str],
+        ty.Sequence[str],
+        ty.Mapping[str, int],
+        ty.Tuple[ty.List[str], ...],
+        ty.Optional[Mutable],
+        Wild,
+        HoldsMutable,  # frozen, but holds a mutable Cat
+    ],
+)
+def test_rejects_mutable_attribute_types(typ):
+    with pytest.raises(TypeError, match="mutable"):
+
+        @Cat(frozen=True, cache_unstruc=True)
+        class Holder:
+            value: typ  # type: ignore[valid-type]
+
+
+def test_accepts_immutable_attribute_types():
+    @Cat(frozen=True, cache_unstruc=True)
+    class Node:
+        name: str
+        tags: ty.FrozenSet[str] = frozenset()
+        children: ty.Tuple["Node", ...] = ()
+        country: ty.Optional[Country] = None
+
+    node = Node("a", children=(Node("b", country=Country("FR")),))
+    assert node.unstruc()["children"][0]["country"]["code"] == "FR"
@@ -0,0 +1,86 @@
+import typing as ty
+
+import attr
+import pytest
+
+from typecats import Cat, TypecatsConverter, unstruc
+
+
+@Cat
+class Big:
+    id: str
+    tier: str = "free"
+    blob: ty.List[int] = attr.Factory(list)
+
+
+@Cat
+class WildBig(dict):
+    id: str
+    tier: str = "free"
+
+
+def test_include_and_exclude():
+    big = Big("a", "gold", [1, 2])
+
+    assert big.unstruc(include={"id", "tier"}) == dict(id="a", tier="gold")
+    assert big.unstruc(exclude={"blob"}) == dict(id="a", tier="gold")
+    assert big.unstruc(include={"id", "blob"}, exclude={"blob"}) == dict(id="a")
+    assert unstruc(big, include={"blob"}) == dict(blob=[1, 2])
+
+
+def test_excluded_fields_are_never_unstructured():
+    conv = TypecatsConverter()
+    calls = list()
+
+    class Payload:
+        pass
+
+    @Cat(converter=conv)
+    class Heavy:
+        id: str
+        payload: Payload = attr.Factory(Payload)
+
+    def unstructure_payload(p):
+        calls.append(p)
+        return "payload"
+
+    conv.register_unstructure_hook(Payload, unstructure_payload)
+
+    assert Heavy("a").unstruc(exclude={"payload"}) == dict(id="a")
+    assert calls == []
+    assert Heavy("a").unstruc() == dict(id="a", payload="payload")
+    assert len(calls) == 1
+
+
+def test_composes_with_strip_defaults():
+    big = Big("a")
+
+    assert big.unstruc(include={"id", "tier"}, strip_defaults=True) == dict(id="a")
+    assert Big("a", "gold").unstruc(exclude={"id"}, strip_defaults=True) == dict(
+        tier="gold"
+    )
+
+
+def test_filters_wildcat_extras():
+    wb = WildBig.struc(dict(id="a", tier="gold", color="red", size=3))
+
+    assert wb.unstruc(include={"id", "color"}) == dict(id="a", color="red")
+    assert wb.unstruc(exclude={"tier", "size"}) == dict(id="a", color="red")
+    assert wb.unstruc(exclude={"size"}, strip_defaults=True) == dict(
+        id="a", tier="gold", color="red"
+    )
+
+
+def test_generated_functions_are_cached():
+    conv = TypecatsConverter()
+    first = conv._get_unstructure_projection(Big, {"id"}, None)
+
+    assert conv._get_unstructure_projection(Big, {"id"}, None) is first
+    assert conv._get_unstructure_projection(Big, {"id"}, {"blob"}) is not first
+
+
+def test_rejects_unknown_names_and_non_attrs():
+    with pytest.raises(ValueError):
+        Big("a").unstruc(include={"nope"})
+    with pytest.raises(TypeError):
+        unstruc(dict(a=1), include={"a"})
@@ -1,6 +1,26 @@
 from .__version__ import __version__
+from .aio import astruc_iter, astruc_many
+from .batch import struc_many
+from .catfile import CatFile
+from .catlist import CatList
+from .changes import clear_changes, get_changes
+from .columns import CatColumns
 from .converter import TypecatsConverter
-from .exceptions import StructuringError, set_default_exception_hook
+from .exceptions import (
+    CompactSchemaError,
+    StructuringError,
+    StructuringLimitError,
+    UnknownUnionTagError,
+    set_default_exception_hook,
+)
+from .instrument import HookStats
+from .interning import INTERN, InternStats, InternTable
+from .limits import StructuringLimits
+from .projection import Projection
+from .rows import RowStructurer
+from .scalars import register_scalar_hooks
+from .slow import SlowStructuringReport
+from .struc_cache import StrucCache, get_struc_cache
 from .tc import (
     Cat,
     TypeCat,
@@ -13,25 +33,51 @@ from .tc import (
     register_unstruc_hook_func,
     unstruc_strip_defaults,
     set_detailed_validation_mode_not_threadsafe,
+    set_slow_structuring_hook,
+    set_structuring_limits,
 )
 from .types import CatT
 from .wildcat import is_wildcat
 
 __all__ = [
     "Cat",
+    "CatColumns",
+    "CatFile",
+    "CatList",
     "CatT",
+    "CompactSchemaError",
+    "HookStats",
+    "INTERN",
+    "InternStats",
+    "InternTable",
+    "Projection",
+    "RowStructurer",
+    "SlowStructuringReport",
+    "StrucCache",
     "StructuringError",
+    "StructuringLimitError",
+    "StructuringLimits",
     "set_default_exception_hook",
     "TypeCat",
     "TypecatsConverter",
+    "UnknownUnionTagError",
     "__version__",
+    "astruc_iter",
+    "astruc_many",
+    "clear_changes",
+    "get_changes",
+    "get_struc_cache",
     "is_wildcat",
+    "register_scalar_hooks",
     "register_struc_hook",
     "register_struc_hook_func",
     "register_unstruc_hook",
     "register_unstruc_hook_func",
     "set_detailed_validation_mode_not_threadsafe",
+    "set_slow_structuring_hook",
+    "set_structuring_limits",
     "struc",
+    "struc_many",
     "try_struc",
     "unstruc",
     "unstruc_strip_defaults",
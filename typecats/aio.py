@@ -0,0 +1,79 @@
+"""Structuring large batches inside a running asyncio event loop.
+
+Structuring a 50k-item list in one go blocks the loop for every other
+request sharing it. These helpers structure items one at a time and
+yield control back to the loop whenever `budget_ms` has elapsed since
+they last did. Large batches can instead be handed to an executor.
+
+Each item goes through the given structuring callable (e.g. `MyCat.struc`
+or `MyCat.try_struc`), so errors are raised (or suppressed) and reported
+to the exception hook exactly as they would be without these helpers.
+`MyCat.astruc_many` and `MyCat.astruc_iter` are shorthands for `MyCat.struc`.
+"""
+
+import asyncio
+import time
+import typing as ty
+from concurrent.futures import Executor
+from functools import partial
+
+R = ty.TypeVar("R")
+
+DEFAULT_BUDGET_MS = 5.0
+
+
+class StrucMethod:
+    """A picklable stand-in for YourCat.struc or YourCat.try_struc, so that
+    structuring can be sent to a process pool by reference to the class.
+    """
+
+    def __init__(self, cls: type, method: str = "struc"):
+        self.cls = cls
+        self.method = method
+
+    def __call__(self, d: ty.Any) -> ty.Any:
+        return getattr(self.cls, self.method)(d)
+
+
+def _struc_all(struc: ty.Callable[[ty.Any], R], items: ty.Iterable) -> ty.List[R]:
+    return [struc(item) for item in items]
+
+
+async def astruc_iter(
+    struc: ty.Callable[[ty.Any], R],
+    items: ty.Iterable,
+    *,
+    budget_ms: float = DEFAULT_BUDGET_MS,
+) -> ty.AsyncIterator[R]:
+    """Structures and yields items, yielding to the event loop whenever budget_ms has been used."""
+    budget = budget_ms / 1000
+    deadline = time.perf_counter() + budget
+    for item in items:
+        yield struc(item)
+        if time.perf_counter() >= deadline:
+            await asyncio.sleep(0)
+            deadline = time.perf_counter() + budget
+
+
+async def astruc_many(
+    struc: ty.Callable[[ty.Any], R],
+    items: ty.Iterable,
+    *,
+    budget_ms: float = DEFAULT_BUDGET_MS,
+    executor: ty.Optional[Executor] = None,
+    offload_above: int = 0,
+) -> ty.List[R]:
+    """Structures all items without blocking the event loop for more than about budget_ms at a time.
+
+    If an executor is given and there are more than offload_above items,
+    the whole batch is structured there instead. A process pool requires
+    a picklable struc callable, such as StrucMethod(YourCat).
+    """
+    if executor is not None:
+        items = items if isinstance(items, ty.Sized) else list(items)
+        if len(items) > offload_above:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                executor, partial(_struc_all, struc, items)
+            )
+    return [res async for res in astruc_iter(struc, items, budget_ms=budget_ms)]
@@ -0,0 +1,66 @@
+"""Structuring large batches across threads.
+
+On free-threaded Python builds, structuring in a ThreadPoolExecutor
+scales across cores without pickling anything: workers share the
+Cat classes and the converter's generated hooks. On builds with a GIL
+it still works, but only overlaps with I/O.
+
+The first item is structured in the calling thread before any worker
+starts, so the hooks for the common case are generated once rather
+than by every worker at the same time.
+"""
+
+import typing as ty
+from concurrent.futures import Executor, ThreadPoolExecutor
+
+R = ty.TypeVar("R")
+
+DEFAULT_CHUNKS_PER_THREAD = 4
+
+
+def _struc_chunk(struc: ty.Callable[[ty.Any], R], items: ty.Sequence) -> ty.List[R]:
+    return [struc(item) for item in items]
+
+
+def struc_many(
+    struc: ty.Callable[[ty.Any], R],
+    items: ty.Iterable,
+    *,
+    threads: int = 1,
+    executor: ty.Optional[Executor] = None,
+) -> ty.List[R]:
+    """Structures all items, in order, using up to `threads` threads.
+
+    Items are split into contiguous chunks, and the error from the
+    earliest failing chunk is raised. An existing executor may be passed
+    instead of having a pool of `threads` threads created per call;
+    `threads` then only determines how finely the items are chunked.
+    """
+    if threads < 1:
+        raise ValueError(f"threads must be at least 1, not {threads}")
+    items = items if isinstance(items, ty.Sequence) else list(items)
+    if not items:
+        return list()
+    if executor is None and threads == 1:
+        return _struc_chunk(struc, items)
+
+    results = [struc(items[0])]
+    rest = items[1:]
+    if not rest:
+        return results
+    chunk_size = max(1, -(-len(rest) // (threads * DEFAULT_CHUNKS_PER_THREAD)))
+    chunks = [rest[i : i + chunk_size] for i in range(0, len(rest), chunk_size)]
+
+    def run(pool: Executor) -> None:
+        futures = [pool.submit(_struc_chunk, struc, chunk) for chunk in chunks]
+        for future in futures:
+            results.extend(future.result())
+
+    if executor is not None:
+        run(executor)
+    else:
+        with ThreadPoolExecutor(
+            max_workers=threads, thread_name_prefix="typecats"
+        ) as pool:
+            run(pool)
+    return results
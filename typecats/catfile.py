@@ -0,0 +1,214 @@
+"""Read-only, random access to the Cats in a JSON Lines file.
+
+    orders = CatFile("orders.jsonl", Order, cache_size=1024)
+    len(orders), orders[10], orders[-100:]
+    big = list(orders.filter(lambda o: o.total > 100, contains=b'"total"'))
+
+The file is memory-mapped, so only the records that are accessed are
+read, and they are structured only when accessed. The start offset of
+every non-blank line is kept in an index, which is saved next to the
+file (as `<path>.idx`) and reused as long as the file's size and
+modification time are unchanged.
+
+With a cache_size, the most recently accessed Cats are kept, so that
+repeated access to the same records doesn't structure them again. Cats
+handed out may be shared, so don't mutate them.
+
+Close a CatFile (or use it as a context manager) when done with it; one
+that is garbage collected without being closed closes its file then.
+"""
+
+import array
+import collections
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+import typing as ty
+import weakref
+
+from .types import C
+
+logger = logging.getLogger(__name__)
+
+_INDEX_MAGIC = b"TCIDX1\0\0"
+_INDEX_HEADER = struct.Struct("<8sQQQ")  # magic, file size, file mtime_ns, count
+_WHITESPACE = frozenset(b" \t\r")
+
+
+def _build_index(data: ty.Union[bytes, mmap.mmap]) -> "array.array[int]":
+    offsets = array.array("Q")
+    start = 0
+    size = len(data)
+    while start < size:
+        end = data.find(b"\n", start)
+        if end == -1:
+            end = size
+        # only lines starting with whitespace need a closer look
+        if end > start and (data[start] not in _WHITESPACE or data[start:end].strip()):
+            offsets.append(start)
+        start = end + 1
+    return offsets
+
+
+def _read_index(
+    index_path: str, stat: os.stat_result
+) -> ty.Optional["array.array[int]"]:
+    try:
+        with open(index_path, "rb") as f:
+            magic, size, mtime_ns, count = _INDEX_HEADER.unpack(
+                f.read(_INDEX_HEADER.size)
+            )
+            if (magic, size, mtime_ns) != (
+                _INDEX_MAGIC,
+                stat.st_size,
+                stat.st_mtime_ns,
+            ):
+                return None
+            offsets = array.array("Q")
+            offsets.fromfile(f, count)
+            return offsets
+    except (OSError, EOFError, struct.error):
+        return None
+
+
+def _write_index(
+    index_path: str, stat: os.stat_result, offsets: "array.array[int]"
+) -> None:
+    tmp_path = f"{index_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(
+                _INDEX_HEADER.pack(
+                    _INDEX_MAGIC, stat.st_size, stat.st_mtime_ns, len(offsets)
+                )
+            )
+            offsets.tofile(f)
+        os.replace(tmp_path, index_path)
+    except OSError:
+        # e.g. a read-only directory; the index is rebuilt next time.
+        logger.warning("Could not save JSONL index %s", index_path, exc_info=True)
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _close(file: ty.BinaryIO, data: ty.Union[bytes, mmap.mmap]) -> None:
+    if isinstance(data, mmap.mmap):
+        data.close()
+    file.close()
+
+
+class CatFile(ty.Sequence[C]):
+    """A read-only sequence of the Cats of type cls in a JSON Lines file.
+
+    Indexing returns a Cat, slicing a list of Cats. Records are
+    structured with `cls.struc`, so invalid records raise when accessed.
+    """
+
+    def __init__(
+        self,
+        path: ty.Union[str, "os.PathLike[str]"],
+        cls: ty.Type[C],
+        *,
+        cache_size: int = 0,
+        index_path: ty.Optional[str] = None,
+    ):
+        self.path = os.fspath(path)
+        self.cls = cls
+        self.index_path = index_path or f"{self.path}.idx"
+        self._cache_size = cache_size
+        self._cache: ty.OrderedDict[int, C] = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._struc: ty.Callable[[ty.Any], C] = getattr(cls, "struc")
+
+        self._file = open(self.path, "rb")  # pylint: disable=consider-using-with
+        self._data: ty.Union[bytes, mmap.mmap] = b""  # empty files can't be mapped
+        try:
+            stat = os.fstat(self._file.fileno())
+            if stat.st_size:
+                self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            offsets = _read_index(self.index_path, stat)
+            if offsets is None:
+                offsets = _build_index(self._data)
+                _write_index(self.index_path, stat, offsets)
+        except BaseException:
+            _close(self._file, self._data)
+            raise
+        self._offsets = offsets
+        # must not refer to self, or it would keep it alive
+        self._finalizer = weakref.finalize(self, _close, self._file, self._data)
+
+    def close(self) -> None:
+        self._finalizer()
+        self._cache.clear()
+
+    def __enter__(self) -> "CatFile[C]":
+        return self
+
+    def __exit__(self, *_exc: ty.Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def raw(self, i: int) -> bytes:
+        """The bytes of record i, without structuring it."""
+        start = self._offsets[i]
+        end = self._data.find(b"\n", start)
+        return self._data[start : end if end != -1 else len(self._data)]
+
+    def _get(self, i: int) -> C:
+        if not self._cache_size:
+            return self._struc(json.loads(self.raw(i)))
+        with self._lock:
+            cat = self._cache.get(i)
+            if cat is not None:
+                self._cache.move_to_end(i)
+                return cat
+        cat = self._struc(json.loads(self.raw(i)))
+        with self._lock:
+            self._cache[i] = cat
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return cat
+
+    @ty.overload
+    def __getitem__(self, i: int) -> C: ...
+
+    @ty.overload
+    def __getitem__(self, i: slice) -> ty.List[C]: ...
+
+    def __getitem__(self, i: ty.Union[int, slice]) -> ty.Union[C, ty.List[C]]:
+        if isinstance(i, slice):
+            return [self._get(j) for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(f"CatFile index {i} out of range")
+        return self._get(i)
+
+    def __iter__(self) -> ty.Iterator[C]:
+        for i in range(len(self)):
+            yield self._get(i)
+
+    def filter(
+        self,
+        predicate: ty.Optional[ty.Callable[[C], bool]] = None,
+        *,
+        contains: ty.Optional[bytes] = None,
+    ) -> ty.Iterator[C]:
+        """Yields the Cats for which predicate is true.
+
+        With `contains`, records whose raw bytes don't contain it are
+        skipped without being parsed or structured.
+        """
+        for i in range(len(self)):
+            if contains is not None and contains not in self.raw(i):
+                continue
+            cat = self._get(i)
+            if predicate is None or predicate(cat):
+                yield cat
@@ -0,0 +1,216 @@
+"""A list of Cats that are structured only when they are accessed.
+
+    @Cat
+    class Folder:
+        name: str
+        files: CatList[File]
+
+    folder = Folder.struc(big_payload)
+    len(folder.files), folder.files[0]   # structures only the first File
+    folder.unstruc()                     # the other Files are passed through
+
+A CatList holds the raw items it was structured from and structures
+each one on first access, keeping the result. When it is unstructured,
+items that were never accessed are returned as (shallow copies of) what
+they were given; accessed items are unstructured, so changes made to
+them are kept. Unstructuring with strip_defaults structures the
+untouched items too, so that their defaults are stripped.
+
+`validate()` structures all remaining items at once, raising an
+IterableValidationError for all of the invalid ones.
+
+A pickled CatList keeps its raw items and the items structured so far.
+The hook it structures the rest with is not pickled: once unpickled,
+they are structured with the item class's `struc`.
+"""
+
+import copy
+import typing as ty
+
+from cattrs import Converter
+from cattrs.errors import IterableValidationError, IterableValidationNote
+
+from .types import C
+
+_RAW = object()  # marks items not structured yet
+
+
+class CatList(ty.Sequence[C]):
+    """A read-only sequence of Cats structured from raw mappings on access.
+
+    Standalone, `CatList(raw_items, MyCat)` structures with `MyCat.struc`.
+    As the type of an attribute, `CatList[MyCat]`, the converter's hooks
+    are used.
+    """
+
+    def __init__(
+        self,
+        raw: ty.Iterable[ty.Any],
+        cls: ty.Type[C],
+        *,
+        structure: ty.Optional[ty.Callable[[ty.Any], C]] = None,
+    ):
+        self.cls = cls
+        self._raw = list(raw)
+        self._items: ty.List[ty.Any] = [_RAW] * len(self._raw)
+        self._structure: ty.Callable[[ty.Any], C] = structure or getattr(cls, "struc")
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def _get(self, i: int) -> C:
+        item = self._items[i]
+        if item is _RAW:
+            item = self._items[i] = self._structure(self._raw[i])
+        return item
+
+    @ty.overload
+    def __getitem__(self, i: int) -> C: ...
+
+    @ty.overload
+    def __getitem__(self, i: slice) -> ty.List[C]: ...
+
+    def __getitem__(self, i: ty.Union[int, slice]) -> ty.Union[C, ty.List[C]]:
+        if isinstance(i, slice):
+            return [self._get(j) for j in range(*i.indices(len(self)))]
+        return self._get(i)
+
+    def __iter__(self) -> ty.Iterator[C]:
+        for i in range(len(self._raw)):
+            yield self._get(i)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (CatList, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __reduce__(self) -> ty.Tuple[ty.Any, ...]:
+        structured = {i: item for i, item in enumerate(self._items) if item is not _RAW}
+        return (_reconstruct_catlist, (self.cls, self._raw, structured))
+
+    def __repr__(self) -> str:
+        return (
+            f"CatList[{self.cls.__name__}]"
+            f"({len(self)} items, {self.structured_count} structured)"
+        )
+
+    @property
+    def structured_count(self) -> int:
+        """The number of items structured so far."""
+        return sum(item is not _RAW for item in self._items)
+
+    def validate(self) -> None:
+        """Structures every item not yet structured, raising for all that are invalid."""
+        errors = list()
+        for i, item in enumerate(self._items):
+            if item is not _RAW:
+                continue
+            try:
+                self._items[i] = self._structure(self._raw[i])
+            except Exception as e:  # noqa # collected and re-raised as a group
+                e.add_note(
+                    IterableValidationNote(
+                        f"Structuring CatList @ index {i}", i, self.cls
+                    )
+                )
+                errors.append(e)
+        if errors:
+            raise IterableValidationError(
+                f"While validating CatList[{self.cls.__name__}]",
+                errors,
+                ty.cast(ty.Any, CatList)[self.cls],
+            )
+
+    def unstruc_items(
+        self, unstructure: ty.Callable[[C], ty.Any], *, structure_all: bool = False
+    ) -> ty.List[ty.Any]:
+        """The raw items, with the structured ones replaced by unstructure(item).
+
+        The raw items are shallow copies. With structure_all, the raw items are
+        structured (without keeping the results) and unstructured as well.
+        """
+        if structure_all:
+            return [
+                unstructure(self._structure(raw) if item is _RAW else item)
+                for raw, item in zip(self._raw, self._items)
+            ]
+        return [
+            copy.copy(raw) if item is _RAW else unstructure(item)
+            for raw, item in zip(self._raw, self._items)
+        ]
+
+
+def _reconstruct_catlist(
+    cls: ty.Type[C], raw: ty.List[ty.Any], structured: ty.Dict[int, C]
+) -> CatList[C]:
+    catlist = CatList(raw, cls, structure=_default_structure(cls))
+    for i, item in structured.items():
+        catlist._items[i] = item
+    return catlist
+
+
+def _default_structure(cls: ty.Type[C]) -> ty.Callable[[ty.Any], C]:
+    struc = getattr(cls, "struc", None)
+    if struc is not None:
+        return struc
+
+    from .tc import _TYPECATS_DEFAULT_CONVERTER  # noqa # tc imports this module
+
+    hook = _TYPECATS_DEFAULT_CONVERTER.get_structure_hook(cls)
+    return lambda raw: hook(raw, cls)
+
+
+def is_catlist_type(typ: ty.Any) -> bool:
+    return ty.get_origin(typ) is CatList
+
+
+def _item_type(typ: ty.Any) -> ty.Any:
+    args = ty.get_args(typ)
+    if not args:
+        raise TypeError("CatList attributes must be parameterized, e.g. CatList[MyCat]")
+    return args[0]
+
+
+def make_catlist_structure_fn(
+    converter: Converter, typ: ty.Any
+) -> ty.Callable[[ty.Any, ty.Any], CatList]:
+    item_type = _item_type(typ)
+    resolved: ty.List[ty.Callable[[ty.Any], ty.Any]] = list()
+
+    def structure_item(raw: ty.Any) -> ty.Any:
+        # resolved on first use, so that Cats may contain CatLists of themselves
+        if not resolved:
+            hook = converter.get_structure_hook(item_type)
+            resolved.append(lambda raw: hook(raw, item_type))
+        return resolved[0](raw)
+
+    def structure_catlist(obj: ty.Any, _Type: ty.Any) -> CatList:
+        if isinstance(obj, CatList):
+            return obj
+        if not isinstance(obj, (list, tuple)):
+            raise TypeError(f"Cannot structure a CatList from {type(obj).__name__}")
+        return CatList(obj, item_type, structure=structure_item)
+
+    return structure_catlist
+
+
+def make_catlist_unstructure_fn(
+    converter: Converter, typ: ty.Any
+) -> ty.Callable[[ty.Any], ty.List[ty.Any]]:
+    item_type = _item_type(typ)
+    resolved: ty.List[ty.Callable[[ty.Any], ty.Any]] = list()
+    # untouched raw items would keep their defaults
+    structure_all = getattr(converter, "_strips_defaults", False)
+
+    def unstructure_item(item: ty.Any) -> ty.Any:
+        if not resolved:
+            resolved.append(converter.get_unstructure_hook(item_type))
+        return resolved[0](item)
+
+    def unstructure_catlist(obj: ty.Any) -> ty.List[ty.Any]:
+        if isinstance(obj, CatList):
+            return obj.unstruc_items(unstructure_item, structure_all=structure_all)
+        # e.g. a plain list of Cats assigned in code
+        return [unstructure_item(item) for item in obj]
+
+    return unstructure_catlist
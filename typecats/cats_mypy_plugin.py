@@ -27,6 +27,7 @@ from collections.abc import Callable
 from mypy.nodes import (  # pylint: disable=no-name-in-module
     ARG_NAMED_OPT,
     ARG_POS,
+    ARG_STAR,
     Argument,
     CallExpr,
     NameExpr,
@@ -148,13 +149,143 @@ def _add_cat_methods(ctx: ClassDefContext) -> None:
     strip_arg = Argument(
         Var("strip_defaults", bool_type), bool_type, None, ARG_NAMED_OPT
     )
+    optional_names_type = UnionType(
+        [ctx.api.named_type("typing.AbstractSet", [str_type]), NoneType()]
+    )
+    only_arg = Argument(
+        Var("only", optional_names_type), optional_names_type, None, ARG_NAMED_OPT
+    )
+    limits_type = UnionType(
+        [
+            ctx.api.named_type_or_none("typecats.limits.StructuringLimits") or any_type,
+            NoneType(),
+        ]
+    )
+    limits_arg = Argument(Var("limits", limits_type), limits_type, None, ARG_NAMED_OPT)
+    names_arg = Argument(Var("names", str_type), str_type, None, ARG_STAR)
+    projection_type = (
+        ctx.api.named_type_or_none("typecats.projection.Projection", [cls_type])
+        or any_type
+    )
 
-    add_method(ctx, "struc", args=[d_arg], return_type=cls_type, is_classmethod=True)
+    add_method(
+        ctx,
+        "struc",
+        args=[d_arg, only_arg, limits_arg],
+        return_type=cls_type,
+        is_classmethod=True,
+    )
     add_method(
         ctx,
         "try_struc",
-        args=[d_opt_arg],
+        args=[d_opt_arg, only_arg, limits_arg],
         return_type=UnionType([cls_type, NoneType()]),
         is_classmethod=True,
     )
-    add_method(ctx, "unstruc", args=[strip_arg], return_type=dict_type)
+    add_method(
+        ctx,
+        "projection",
+        args=[names_arg],
+        return_type=projection_type,
+        is_classmethod=True,
+    )
+    records_type = ctx.api.named_type("typing.Iterable", [mapping_type])
+    records_arg = Argument(Var("records", records_type), records_type, None, ARG_POS)
+    columns_type = (
+        ctx.api.named_type_or_none("typecats.columns.CatColumns", [cls_type])
+        or any_type
+    )
+    add_method(
+        ctx,
+        "struc_columns",
+        args=[records_arg],
+        return_type=columns_type,
+        is_classmethod=True,
+    )
+
+    float_type = ctx.api.named_type("builtins.float")
+    int_type = ctx.api.named_type("builtins.int")
+    list_type = ctx.api.named_type("builtins.list", [cls_type])
+    budget_arg = Argument(Var("budget_ms", float_type), float_type, None, ARG_NAMED_OPT)
+    add_method(
+        ctx,
+        "struc_many",
+        args=[
+            records_arg,
+            Argument(Var("threads", int_type), int_type, None, ARG_NAMED_OPT),
+            Argument(Var("executor", any_type), any_type, None, ARG_NAMED_OPT),
+        ],
+        return_type=list_type,
+        is_classmethod=True,
+    )
+    row_type = ctx.api.named_type("typing.Sequence", [any_type])
+    optional_columns_type = UnionType(
+        [ctx.api.named_type("typing.Sequence", [str_type]), NoneType()]
+    )
+    columns_arg = Argument(
+        Var("columns", optional_columns_type),
+        optional_columns_type,
+        None,
+        ARG_NAMED_OPT,
+    )
+    add_method(
+        ctx,
+        "struc_row",
+        args=[Argument(Var("row", row_type), row_type, None, ARG_POS), columns_arg],
+        return_type=cls_type,
+        is_classmethod=True,
+    )
+    rows_type = ctx.api.named_type("typing.Iterable", [row_type])
+    add_method(
+        ctx,
+        "struc_rows",
+        args=[Argument(Var("rows", rows_type), rows_type, None, ARG_POS), columns_arg],
+        return_type=list_type,
+        is_classmethod=True,
+    )
+    add_method(
+        ctx,
+        "astruc_many",
+        args=[
+            records_arg,
+            budget_arg,
+            Argument(Var("executor", any_type), any_type, None, ARG_NAMED_OPT),
+            Argument(Var("offload_above", int_type), int_type, None, ARG_NAMED_OPT),
+        ],
+        return_type=ctx.api.named_type("typing.Awaitable", [list_type]),
+        is_classmethod=True,
+    )
+    add_method(
+        ctx,
+        "astruc_iter",
+        args=[records_arg, budget_arg],
+        return_type=ctx.api.named_type("typing.AsyncIterator", [cls_type]),
+        is_classmethod=True,
+    )
+    add_method(
+        ctx,
+        "struc_compact",
+        args=[Argument(Var("payload", row_type), row_type, None, ARG_POS)],
+        return_type=cls_type,
+        is_classmethod=True,
+    )
+    include_arg = Argument(
+        Var("include", optional_names_type), optional_names_type, None, ARG_NAMED_OPT
+    )
+    exclude_arg = Argument(
+        Var("exclude", optional_names_type), optional_names_type, None, ARG_NAMED_OPT
+    )
+    add_method(
+        ctx,
+        "unstruc",
+        args=[strip_arg, include_arg, exclude_arg],
+        return_type=dict_type,
+    )
+    add_method(
+        ctx,
+        "unstruc_compact",
+        args=[strip_arg],
+        return_type=ctx.api.named_type("builtins.list", [any_type]),
+    )
+    if _get_bool_kwarg(ctx, "track_changes", False):
+        add_method(ctx, "unstruc_changes", args=[strip_arg], return_type=dict_type)
@@ -0,0 +1,140 @@
+"""Opt-in tracking of the attributes and Wildcat keys changed on a mutable Cat.
+
+Enable with `@Cat(track_changes=True)`; Cat subclasses of a tracking Cat
+track changes too. Assignments to attributes are
+recorded through an attrs on_setattr hook, and item assignment/deletion
+on a Wildcat is recorded by wrapping its dict-mutating methods. Nothing
+is recorded while constructing or structuring an object, so a freshly
+structured Cat reports no changes.
+"""
+
+import typing as ty
+
+import attr
+
+from .types import is_frozen_attrs
+
+_CHANGES_ATTR = "__typecats_changes"
+_TRACKS_CHANGES_ATTR = "__typecats_tracks_changes__"
+
+
+def tracks_changes(cls: type) -> bool:
+    # an attrs subclass has its own __setattr__, which records only if it was made to;
+    # so the flag is read from the class attrs last generated methods for
+    for klass in (ty.get_origin(cls) or cls).__mro__:
+        if "__attrs_attrs__" in vars(klass):
+            return vars(klass).get(_TRACKS_CHANGES_ATTR, False)
+    return False
+
+
+def inherits_change_tracking(cls: type) -> bool:
+    return any(tracks_changes(base) for base in cls.__mro__[1:])
+
+
+def _record(obj: ty.Any, key: ty.Any) -> None:
+    changes = obj.__dict__.get(_CHANGES_ATTR)
+    if changes is None:
+        changes = set()
+        object.__setattr__(obj, _CHANGES_ATTR, changes)
+    changes.add(key)
+
+
+def record_attribute_change(
+    obj: ty.Any, attribute: "attr.Attribute[ty.Any]", value: ty.Any
+) -> ty.Any:
+    """An attrs on_setattr hook that records the name of the assigned attribute."""
+    _record(obj, attribute.name)
+    return value
+
+
+def get_changes(obj: ty.Any) -> ty.FrozenSet[ty.Any]:
+    """The attribute names and Wildcat keys changed since the object was
+    structured or constructed (or since clear_changes was last called).
+
+    Deleted Wildcat keys are included, even though they will be absent
+    from the result of unstruc_changes.
+    """
+    return frozenset(getattr(obj, "__dict__", {}).get(_CHANGES_ATTR, ()))
+
+
+def clear_changes(obj: ty.Any) -> None:
+    changes = getattr(obj, "__dict__", {}).get(_CHANGES_ATTR)
+    if changes:
+        changes.clear()
+
+
+def make_change_tracking_kwargs(cls: type, attrs_kwargs: dict) -> dict:
+    """Returns the attrs keyword arguments with change recording added to on_setattr."""
+    if attrs_kwargs.get("frozen"):
+        raise TypeError(f"Cannot track changes on frozen Cat {cls.__name__}")
+    frozen_bases = [b.__name__ for b in cls.__mro__[1:] if is_frozen_attrs(b)]
+    if frozen_bases:
+        raise TypeError(
+            f"Cannot track changes on Cat {cls.__name__}, "
+            f"which subclasses frozen {frozen_bases[0]}"
+        )
+    if attrs_kwargs.get("slots"):
+        raise TypeError(f"Cannot track changes on slotted Cat {cls.__name__}")
+    user_on_setattr = attrs_kwargs.get("on_setattr")
+    if user_on_setattr is None:
+        on_setattr: ty.Any = record_attribute_change
+    elif isinstance(user_on_setattr, (list, tuple)):
+        on_setattr = [*user_on_setattr, record_attribute_change]
+    else:
+        on_setattr = [user_on_setattr, record_attribute_change]
+    return dict(attrs_kwargs, on_setattr=on_setattr)
+
+
+def mixin_wildcat_change_tracking(cls: type) -> None:
+    """Wraps the dict-mutating methods of a Wildcat so that they record the keys they touch.
+
+    Must be applied after setup_warnings_for_dangerous_dict_subclass_operations.
+    """
+    setitem = getattr(cls, "__setitem__")
+    delitem = getattr(cls, "__delitem__")
+    update = getattr(cls, "update")
+    pop = getattr(cls, "pop")
+    setdefault = getattr(cls, "setdefault")
+    popitem = getattr(cls, "popitem")
+    clear = getattr(cls, "clear")
+
+    def __setitem__(self, key, item):
+        setitem(self, key, item)
+        _record(self, key)
+
+    def __delitem__(self, key):
+        delitem(self, key)
+        _record(self, key)
+
+    def tracking_update(self, other_dict=None, **kwargs):
+        update(self, other_dict, **kwargs)
+        for key in other_dict or kwargs:
+            _record(self, key)
+
+    def tracking_pop(self, key, *default):
+        if key in self:
+            _record(self, key)
+        return pop(self, key, *default)
+
+    def tracking_setdefault(self, key, default=None):
+        if key not in self:
+            _record(self, key)
+        return setdefault(self, key, default)
+
+    def tracking_popitem(self):
+        key, value = popitem(self)
+        _record(self, key)
+        return key, value
+
+    def tracking_clear(self):
+        for key in self:
+            _record(self, key)
+        clear(self)
+
+    setattr(cls, "__setitem__", __setitem__)
+    setattr(cls, "__delitem__", __delitem__)
+    setattr(cls, "update", tracking_update)
+    setattr(cls, "pop", tracking_pop)
+    setattr(cls, "setdefault", tracking_setdefault)
+    setattr(cls, "popitem", tracking_popitem)
+    setattr(cls, "clear", tracking_clear)
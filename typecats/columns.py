@@ -0,0 +1,214 @@
+"""Columnar (struct-of-arrays) structuring of many records of one Cat.
+
+Analytics code that aggregates over millions of records doesn't need
+millions of Cat instances. `MyCat.struc_columns(records)` produces a
+CatColumns holding one column per attribute: NumPy arrays for int,
+float and bool attributes, object arrays of (deduplicated) strings for
+str attributes, and lists of values structured by the converter's hooks
+for everything else. Cats are built only when a row is accessed.
+
+Requires NumPy (`pip install typecats[columns]`).
+"""
+
+import typing as ty
+
+import attr
+from cattrs import Converter
+from cattrs.errors import ClassValidationError
+
+from .attrs_shim import nonempty_validator
+from .types import C, StrucInput
+
+_NUMERIC_DTYPES: ty.Mapping[type, str] = {int: "int64", float: "float64", bool: "bool"}
+
+
+def _import_numpy():
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel
+    except ImportError as e:
+        raise ImportError(
+            "Columnar structuring requires numpy; install typecats[columns]"
+        ) from e
+    return numpy
+
+
+def _has_nonempty_validator(attribute: attr.Attribute) -> bool:
+    validator = attribute.validator
+    if validator is None:
+        return False
+    if validator is nonempty_validator:
+        return True
+    return nonempty_validator in getattr(validator, "_validators", ())
+
+
+def _column_values(
+    records: ty.Sequence[StrucInput], attribute: attr.Attribute, key: str
+) -> ty.List[ty.Any]:
+    default = attribute.default
+    if default is attr.NOTHING:
+        return [r[key] for r in records]
+    if isinstance(default, attr.Factory):  # type: ignore[arg-type]
+        if default.takes_self:  # type: ignore[union-attr]
+            raise ValueError(
+                f"Cannot build column {attribute.name} from a self-factory"
+            )
+        factory = default.factory  # type: ignore[union-attr]
+        return [r[key] if key in r else factory() for r in records]
+    return [r.get(key, default) for r in records]
+
+
+class CatColumns(ty.Generic[C]):
+    """A struct-of-arrays container of records of one Cat class.
+
+    Columns are available by attribute name via `columns`. Indexing
+    builds (and runs the validators of) a Cat for that row; `unstruc`
+    turns the whole container back into a list of records.
+    """
+
+    def __init__(
+        self,
+        converter: Converter,
+        cls: ty.Type[C],
+        columns: ty.Dict[str, ty.Any],
+        length: int,
+        extras: ty.Optional[ty.List[ty.Dict[str, ty.Any]]] = None,
+    ):
+        self.cls = cls
+        self.columns = columns
+        self.extras = extras
+        self._converter = converter
+        self._length = length
+
+    def __len__(self) -> int:
+        return self._length
+
+    @ty.overload
+    def __getitem__(self, index: int) -> C: ...
+
+    @ty.overload
+    def __getitem__(self, index: slice) -> ty.List[C]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError(index)
+        kwargs = dict()
+        cat_cls: type = self.cls
+        for a in attr.fields(cat_cls):
+            if a.name in self.columns:
+                value = self.columns[a.name][index]
+                kwargs[a.alias] = value.item() if hasattr(value, "item") else value
+        obj = self.cls(**kwargs)
+        if self.extras is not None:
+            obj.update(self.extras[index])  # type: ignore[attr-defined]
+        return obj
+
+    def __iter__(self) -> ty.Iterator[C]:
+        for i in range(self._length):
+            yield self[i]
+
+    def unstruc(self) -> ty.List[ty.Dict[str, ty.Any]]:
+        """The records, unstructured by the converter's hooks."""
+        names = list()
+        values = list()
+        cat_cls: type = self.cls
+        for a in attr.fields(cat_cls):
+            if a.name not in self.columns:
+                continue
+            column = self.columns[a.name]
+            names.append(a.name)
+            if hasattr(column, "tolist"):
+                values.append(column.tolist())
+            else:
+                hook = self._converter.get_unstructure_hook(a.type)
+                values.append([hook(v) for v in column])
+        records = [dict(zip(names, row)) for row in zip(*values)]
+        if not names:
+            records = [dict() for _ in range(self._length)]
+        if self.extras is not None:
+            records = [
+                {
+                    **{k: self._converter.unstructure(v) for k, v in extra.items()},
+                    **record,
+                }
+                for extra, record in zip(self.extras, records)
+            ]
+        return records
+
+
+def struc_columns(
+    converter: Converter, cls: ty.Type[C], records: ty.Iterable[StrucInput]
+) -> CatColumns[C]:
+    """Structures records of cls into a CatColumns.
+
+    Values are converted as they would be by struc, and required
+    attributes are checked for emptiness column by column. Other
+    validators run only when a row is built.
+    """
+    np = _import_numpy()
+    records = records if isinstance(records, ty.Sequence) else list(records)
+    cat_cls: type = cls
+    attribs = attr.fields(cat_cls)
+    if any(isinstance(a.type, str) for a in attribs):
+        # PEP 563 annotations - need to be resolved.
+        attr.resolve_types(cat_cls)
+        attribs = attr.fields(cat_cls)
+    use_alias = getattr(converter, "use_alias", False)
+
+    columns: ty.Dict[str, ty.Any] = dict()
+    errors: ty.List[Exception] = list()
+    for a in attribs:
+        if not a.init:
+            continue
+        key = a.alias if use_alias else a.name
+        try:
+            values = _column_values(records, a, key)
+            if a.type in _NUMERIC_DTYPES:
+                try:
+                    column = np.array(values, dtype=_NUMERIC_DTYPES[a.type])
+                except (TypeError, ValueError, OverflowError):
+                    hook = converter.get_structure_hook(a.type)
+                    column = np.array(
+                        [hook(v, a.type) for v in values],
+                        dtype=_NUMERIC_DTYPES[a.type],
+                    )
+            elif a.type is str:
+                interned: ty.Dict[str, str] = dict()
+                column = np.empty(len(values), dtype=object)
+                column[:] = [interned.setdefault(str(v), str(v)) for v in values]
+                if _has_nonempty_validator(a):
+                    empty = np.flatnonzero(column == "")
+                    if len(empty):
+                        raise ValueError(
+                            f'Attribute "{a.name}" on class {cls} cannot have '
+                            f"empty values; found {len(empty)} at rows {empty[:10].tolist()}"
+                        )
+            else:
+                hook = converter.get_structure_hook(a.type)
+                column = [hook(v, a.type) for v in values]
+                if _has_nonempty_validator(a):
+                    empty_rows = [i for i, v in enumerate(column) if not v]
+                    if empty_rows:
+                        raise ValueError(
+                            f'Attribute "{a.name}" on class {cls} cannot have '
+                            f"empty values; found {len(empty_rows)} at rows {empty_rows[:10]}"
+                        )
+            columns[a.name] = column
+        except Exception as e:
+            e.__notes__ = getattr(e, "__notes__", []) + [
+                f"Structuring columns of {cls.__qualname__} @ attribute {a.name}"
+            ]
+            errors.append(e)
+    if errors:
+        raise ClassValidationError(
+            f"While structuring columns of {cls.__name__}", errors, cls
+        )
+
+    extras = None
+    if dict in cls.__mro__:
+        keys = {a.alias if use_alias else a.name for a in attribs}
+        extras = [{k: v for k, v in r.items() if k not in keys} for r in records]
+    return CatColumns(converter, cls, columns, len(records), extras)
@@ -0,0 +1,356 @@
+"""A compact, positional form of Cats for caches and inter-process queues.
+
+    payload = order.unstruc_compact()      # ["3f2a9c1e", "o1", [["a", 1]]]
+    Order.struc_compact(payload) == order
+
+A Cat is encoded as the list of its attribute values in attrs field
+order (attributes with init=False are left out), and nested Cats (also inside lists, sets, tuples, dicts and
+Optionals) are encoded the same way. Other values are unstructured by
+the converter's hooks, as by `unstruc`. A Wildcat has one more item,
+the dict of its untyped keys.
+
+The first item of a payload is the fingerprint of the Cat's schema: its
+attribute names, order and types, including those of nested Cats. A
+payload whose fingerprint does not match the class it is structured as
+raises CompactSchemaError.
+
+With strip_defaults=True, every Cat list instead starts with a bitmap
+of the attributes that follow: those not equal to their defaults, as
+with `unstruc(strip_defaults=True)`. The fingerprint is then prefixed
+with "~".
+"""
+
+import collections.abc
+import hashlib
+import typing as ty
+from typing import Literal
+
+import attr
+from attr import has as is_attrs_class
+
+from cattrs import Converter
+from cattrs.fns import identity
+
+from .changes import clear_changes, tracks_changes
+from .exceptions import (
+    CompactSchemaError,
+    SimpleValidationError,
+    _BASIC_VALIDATION_EXCEPTIONS,
+)
+from .strip_defaults import _get_attr_default_value
+from .types import is_union, optional_arg
+from .wildcat import is_wildcat
+
+Encoder = ty.Callable[[ty.Any], ty.Any]
+Decoder = ty.Callable[[ty.Any], ty.Any]
+
+_ELIDED = "~"
+_NO_DEFAULT = object()
+
+_SEQUENCE_TYPES: ty.Mapping[ty.Any, ty.Callable[[ty.Iterable[ty.Any]], ty.Any]] = {
+    list: list,
+    tuple: tuple,
+    set: set,
+    frozenset: frozenset,
+    collections.abc.Sequence: list,
+    collections.abc.MutableSequence: list,
+    collections.abc.Set: frozenset,
+    collections.abc.MutableSet: set,
+}
+_MAPPING_TYPES: ty.AbstractSet[ty.Any] = {
+    dict,
+    collections.abc.Mapping,
+    collections.abc.MutableMapping,
+}
+
+
+def _is_cat(typ: ty.Any) -> bool:
+    # generic Cats are left to the converter
+    return isinstance(typ, type) and is_attrs_class(typ)
+
+
+def _fields(cls: type) -> ty.Tuple[attr.Attribute, ...]:
+    if any(isinstance(a.type, str) for a in attr.fields(cls)):
+        # PEP 563 annotations - need to be resolved.
+        attr.resolve_types(cls)
+    return attr.fields(cls)
+
+
+def _type_signature(typ: ty.Any, seen: ty.Dict[type, int]) -> str:
+    if _is_cat(typ):
+        if typ in seen:
+            return f"@{seen[typ]}"  # recursive types refer back to their layout
+        seen[typ] = len(seen)
+        sig = ",".join(
+            f"{a.name}:{_type_signature(a.type, seen)}" for a in _fields(typ)
+        )
+        return f"({sig}{'+' if is_wildcat(typ) else ''})"
+    args = ty.get_args(typ)
+    # X | None and Optional[X] are the same schema
+    origin = ty.Union if is_union(typ) else ty.get_origin(typ)
+    if origin is None:
+        return getattr(typ, "__qualname__", None) or repr(typ)
+    if origin is Literal:
+        return f"Literal[{','.join(repr(a) for a in args)}]"
+    args_sig = ",".join(_type_signature(a, seen) for a in args)
+    return f"{_type_signature(origin, dict(seen))}[{args_sig}]"
+
+
+def schema_fingerprint(cls: type) -> str:
+    """Identifies the attribute names, order and types of a Cat and its nested Cats."""
+    layout = _type_signature(cls, dict())
+    return hashlib.sha256(layout.encode()).hexdigest()[:8]
+
+
+def _has_cat(typ: ty.Any, seen: ty.Set[ty.Any]) -> bool:
+    if _is_cat(typ):
+        return True
+    if typ in seen:
+        return False
+    seen.add(typ)
+    return any(_has_cat(arg, seen) for arg in ty.get_args(typ))
+
+
+def _is_homogeneous_tuple(typ: ty.Any) -> bool:
+    args = ty.get_args(typ)
+    return ty.get_origin(typ) is not tuple or (len(args) == 2 and args[1] is Ellipsis)
+
+
+def _compile(
+    cls: type, name: str, source: str, namespace: ty.Dict[str, ty.Any]
+) -> ty.Callable[[ty.Any], ty.Any]:
+    exec(  # pylint: disable=exec-used
+        compile(source, f"<typecats {name} {cls.__qualname__}>", "exec"), namespace
+    )
+    return namespace[name]
+
+
+class CompactCodec:
+    """Encodes and decodes Cats in compact form with one converter's hooks.
+
+    Encoders and decoders are built once per type; a TypecatsConverter
+    discards its codec when its hooks change.
+    """
+
+    def __init__(self, converter: Converter):
+        self.converter = converter
+        self._encoders: ty.Dict[ty.Tuple[ty.Any, bool], Encoder] = dict()
+        self._decoders: ty.Dict[ty.Any, Decoder] = dict()
+        self._fingerprints: ty.Dict[type, str] = dict()
+
+    def fingerprint(self, cls: type) -> str:
+        fp = self._fingerprints.get(cls)
+        if fp is None:
+            fp = self._fingerprints[cls] = schema_fingerprint(cls)
+        return fp
+
+    def encode(
+        self,
+        obj: ty.Any,
+        cls: ty.Optional[type] = None,
+        *,
+        strip_defaults: bool = False,
+    ) -> list:
+        cls = cls or type(obj)
+        fp = self.fingerprint(cls)
+        return [
+            _ELIDED + fp if strip_defaults else fp,
+            *self.encoder(cls, strip_defaults)(obj),
+        ]
+
+    def decode(self, payload: ty.Sequence[ty.Any], cls: type) -> ty.Any:
+        fp = self.fingerprint(cls)
+        header = payload[0] if payload else None
+        if header not in (fp, _ELIDED + fp):
+            msg = (
+                f"Compact payload has schema {header!r}, but {cls.__name__} has schema {fp!r};"
+                " it was written for a different version of the class"
+            )
+            raise CompactSchemaError(msg, [ValueError(msg)], cls)
+        decode = self.decoder(cls, header != fp)
+        try:
+            return decode(payload[1:])
+        except _BASIC_VALIDATION_EXCEPTIONS as e:
+            raise SimpleValidationError(
+                f"While structuring {cls.__name__} from compact form", [e], cls
+            ) from e
+
+    def encoder(self, typ: ty.Any, strip_defaults: bool = False) -> Encoder:
+        key = (typ, strip_defaults)
+        encode = self._encoders.get(key)
+        if encode is None:
+            if _is_cat(typ):
+                # stands in while the encoder is built, for recursive Cats
+                self._encoders[key] = self._lazy(self._encoders, key)
+                encode = self._cat_encoder(typ, strip_defaults)
+            else:
+                encode = self._encoder(typ, strip_defaults)
+            self._encoders[key] = encode
+        return encode
+
+    def decoder(self, typ: ty.Any, elided: bool = False) -> Decoder:
+        key = (typ, elided)
+        decode = self._decoders.get(key)
+        if decode is None:
+            if _is_cat(typ):
+                self._decoders[key] = self._lazy(self._decoders, key)
+                decode = self._cat_decoder(typ, elided)
+            else:
+                decode = self._decoder(typ, elided)
+            self._decoders[key] = decode
+        return decode
+
+    @staticmethod
+    def _lazy(
+        table: ty.Dict[ty.Any, ty.Callable[[ty.Any], ty.Any]], key: ty.Any
+    ) -> ty.Callable[[ty.Any], ty.Any]:
+        def call_when_built(value: ty.Any) -> ty.Any:
+            return table[key](value)
+
+        return call_when_built
+
+    def _encoder(self, typ: ty.Any, strip_defaults: bool) -> Encoder:
+        if not _has_cat(typ, set()):
+            return self.converter.get_unstructure_hook(typ)
+        origin = ty.get_origin(typ)
+        args = ty.get_args(typ)
+        optional = optional_arg(typ)
+        if optional is not None:
+            encode_some = self.encoder(optional, strip_defaults)
+            return lambda v: None if v is None else encode_some(v)
+        if origin in _SEQUENCE_TYPES and _is_homogeneous_tuple(typ):
+            encode_item = self.encoder(args[0], strip_defaults)
+            return lambda v: [encode_item(item) for item in v]
+        if origin in _MAPPING_TYPES and len(args) == 2:
+            encode_key = self.converter.get_unstructure_hook(args[0])
+            encode_value = self.encoder(args[1], strip_defaults)
+            return lambda v: {
+                encode_key(k): encode_value(item) for k, item in v.items()
+            }
+        return self.converter.get_unstructure_hook(typ)
+
+    def _decoder(self, typ: ty.Any, elided: bool) -> Decoder:
+        if not _has_cat(typ, set()):
+            hook = self.converter.get_structure_hook(typ)
+            return lambda v: hook(v, typ)
+        origin = ty.get_origin(typ)
+        args = ty.get_args(typ)
+        optional = optional_arg(typ)
+        if optional is not None:
+            decode_some = self.decoder(optional, elided)
+            return lambda v: None if v is None else decode_some(v)
+        if origin in _SEQUENCE_TYPES and _is_homogeneous_tuple(typ):
+            decode_item = self.decoder(args[0], elided)
+            make = _SEQUENCE_TYPES[origin]
+            if make is list:
+                return lambda v: [decode_item(item) for item in v]
+            return lambda v: make([decode_item(item) for item in v])
+        if origin in _MAPPING_TYPES and len(args) == 2:
+            key_hook = self.converter.get_structure_hook(args[0])
+            key_type = args[0]
+            decode_value = self.decoder(args[1], elided)
+            return lambda v: {
+                key_hook(k, key_type): decode_value(item) for k, item in v.items()
+            }
+        hook = self.converter.get_structure_hook(typ)
+        return lambda v: hook(v, typ)
+
+    def _cat_encoder(self, cls: type, strip_defaults: bool) -> Encoder:
+        fields = _fields(cls)
+        getters = [
+            (
+                a.name,
+                self.encoder(a.type, strip_defaults),
+                (
+                    _get_attr_default_value(a)
+                    if a.default is not attr.NOTHING
+                    and ty.get_origin(a.type) is not Literal
+                    else _NO_DEFAULT
+                ),
+            )
+            for a in fields
+            if a.init
+        ]
+        names = frozenset(a.name for a in fields)
+        wildcat = is_wildcat(cls)
+        unstructure = self.converter.unstructure
+
+        def extras(obj: ty.Any) -> dict:
+            return {k: unstructure(obj[k]) for k in obj if k not in names}
+
+        if not strip_defaults:
+            namespace: ty.Dict[str, ty.Any] = dict(_extras=extras)
+            items = list()
+            for i, (name, encode, _) in enumerate(getters):
+                if encode is identity:
+                    items.append(f"o.{name}")
+                else:
+                    namespace[f"_e{i}"] = encode
+                    items.append(f"_e{i}(o.{name})")
+            if wildcat:
+                items.append("_extras(o)")
+            return _compile(
+                cls,
+                "encode_cat",
+                f"def encode_cat(o):\n    return [{', '.join(items)}]\n",
+                namespace,
+            )
+
+        def encode_cat_elided(obj: ty.Any) -> list:
+            mask = 0
+            res: ty.List[ty.Any] = [0]
+            for bit, (name, encode, default) in enumerate(getters):
+                value = getattr(obj, name)
+                if default is _NO_DEFAULT or value != default:
+                    mask |= 1 << bit
+                    res.append(encode(value))
+            res[0] = mask
+            if wildcat:
+                res.append(extras(obj))
+            return res
+
+        return encode_cat_elided
+
+    def _cat_decoder(self, cls: type, elided: bool) -> Decoder:
+        fields = [a for a in _fields(cls) if a.init]
+        setters = [(a.alias or a.name, self.decoder(a.type, elided)) for a in fields]
+        wildcat = is_wildcat(cls)
+        clears_changes = wildcat and tracks_changes(cls)
+
+        def finish(obj: ty.Any, extras: ty.Any) -> ty.Any:
+            obj.update(extras)
+            if clears_changes:
+                clear_changes(obj)
+            return obj
+
+        if not elided:
+            namespace: ty.Dict[str, ty.Any] = dict(_cls=cls, _finish=finish)
+            kwargs = list()
+            for i, a in enumerate(fields):
+                if _has_cat(a.type, set()):
+                    namespace[f"_d{i}"] = setters[i][1]
+                    kwargs.append(f"{setters[i][0]}=_d{i}(v[{i}])")
+                else:
+                    # leaves call their structure hooks directly
+                    namespace[f"_h{i}"] = self.converter.get_structure_hook(a.type)
+                    namespace[f"_t{i}"] = a.type
+                    kwargs.append(f"{setters[i][0]}=_h{i}(v[{i}], _t{i})")
+            call = f"_cls({', '.join(kwargs)})"
+            if wildcat:
+                call = f"_finish({call}, v[-1])"
+            return _compile(
+                cls, "decode_cat", f"def decode_cat(v):\n    return {call}\n", namespace
+            )
+
+        def decode_cat_elided(values: ty.Sequence[ty.Any]) -> ty.Any:
+            mask = values[0]
+            i = 1
+            kwargs: ty.Dict[str, ty.Any] = dict()
+            for bit, (alias, decode) in enumerate(setters):
+                if mask >> bit & 1:
+                    kwargs[alias] = decode(values[i])
+                    i += 1
+            obj = cls(**kwargs)
+            return finish(obj, values[-1]) if wildcat else obj
+
+        return decode_cat_elided
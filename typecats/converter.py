@@ -3,15 +3,41 @@
 Replaces the old patch.py approach of monkey-patching an external converter instance.
 """
 
+import threading
 import typing as ty
 
+import attr
 from attr import has as is_attrs_class
 from cattrs.converters import GenConverter
+from cattrs.gen import make_dict_unstructure_fn, override
 
+from .attrs_shim import get_attrs_names
+from .changes import clear_changes, tracks_changes
+from .instrument import (
+    STRUCTURE,
+    UNSTRUCTURE,
+    ConverterStats,
+    HookStats,
+    instrument_structure,
+    instrument_unstructure,
+)
+from .limits import LimitGuard, StructuringLimits, is_limited_type
+from .catlist import (
+    is_catlist_type,
+    make_catlist_structure_fn,
+    make_catlist_unstructure_fn,
+)
+from .compact import CompactCodec
+from .interning import InternStats, InternTable, make_field_interner
+from .projection import Projection, projected_names
+from .rows import RowStructurer
+from .slow import SlowDetector, SlowStructuringHook
+from .tagged_union import is_tagged_cat_union, make_tagged_union_structure_fn
+from .unstruc_cache import caches_unstruc, get_cached, set_cached
+from .types import C
 from .wildcat import is_wildcat, enrich_structured_wildcat, enrich_unstructured_wildcat
-from .strip_defaults import ShouldStripDefaults, strip_attrs_defaults
+from .strip_defaults import _SHOULD_STRIP_DEFAULTS, strip_attrs_defaults
 from .exceptions import _consolidate_exceptions, StructuringError, _embed_exception_info
-from .stack_context import stack_context
 
 
 def _has_with_generic(cls) -> bool:
@@ -19,9 +45,109 @@ def _has_with_generic(cls) -> bool:
     return is_attrs_class(cls) or (origin is not None and is_attrs_class(origin))
 
 
+class _HookCache:
+    """Replaces the lru_cache around cattrs' hook dispatch.
+
+    Lookups of already-generated hooks are lock-free dict reads. Hook
+    generation happens under a lock that is shared by all of a
+    converter's hook caches, so that under contention (e.g. on
+    free-threaded Python) a hook is generated only once, and clearing
+    the cache cannot interleave with a generation that would then
+    store a stale hook.
+    """
+
+    def __init__(self, generate: ty.Callable[[ty.Any], ty.Any], lock: threading.RLock):
+        self._generate = generate
+        self._lock = lock
+        self._hooks: ty.Dict[ty.Any, ty.Any] = dict()
+
+    def __call__(self, typ: ty.Any) -> ty.Any:
+        try:
+            return self._hooks[typ]
+        except KeyError:
+            pass
+        with self._lock:
+            hooks = self._hooks
+            if typ not in hooks:
+                hooks[typ] = self._generate(typ)
+            return hooks[typ]
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._hooks = dict()
+
+
+_UnstrucProjectionKey = ty.Tuple[
+    type, ty.Optional[ty.FrozenSet[str]], ty.FrozenSet[str]
+]
+
+
 class TypecatsConverter(GenConverter):
-    def __init__(self, *args, **kwargs):
+    """A cattrs GenConverter that knows about Cats and Wildcats.
+
+    Safe to share between threads, including on free-threaded Python:
+    generated hooks are looked up without locking and generated at most
+    once per type. Registering hooks while other threads are structuring
+    is safe, but those threads may briefly still use the previous hooks.
+
+    The structure and unstructure generations count hook changes (hook
+    registrations and detailed validation toggles), so that callers
+    holding on to a resolved hook know when to resolve it again.
+
+    With limits, structuring is stopped early when it exceeds a maximum
+    depth, collection size or number of nodes; see typecats.limits.
+    `limited(limits)` returns a converter for applying other limits per call.
+
+    With instrument=True, every generated Cat hook records its calls,
+    failures and time; see `stats()`.
+
+    With intern=True (or an InternTable), equal strings in Literal and
+    INTERN-marked attributes share one object; see typecats.interning.
+
+    Unstructuring with strip_defaults=True is delegated to a twin
+    converter, created on first use, whose hooks always strip defaults.
+    Hooks registered on this converter are also registered on its twins.
+    """
+
+    def __init__(
+        self,
+        *args: ty.Any,
+        instrument: bool = False,
+        limits: ty.Optional[StructuringLimits] = None,
+        intern: ty.Union[bool, InternTable] = False,
+        **kwargs: ty.Any,
+    ) -> None:
+        self._intern_table: ty.Optional[InternTable] = (
+            InternTable() if intern is True else intern or None
+        )
+        self._limit_guard = LimitGuard(limits) if limits else None
+        self._limited_twins: ty.Dict[StructuringLimits, "TypecatsConverter"] = dict()
+        self._stats: ty.Optional[ConverterStats] = (
+            ConverterStats() if instrument else None
+        )
+        self._slow_detector: ty.Optional[SlowDetector] = None
+        self._hook_lock = threading.RLock()
+        self._strips_defaults = False
+        self._strip_defaults_twin: ty.Optional["TypecatsConverter"] = None
+        self.structure_generation = 0
+        self.unstructure_generation = 0
+        # tags memoized unstruc results; replaced when unstructure hooks change
+        self._unstruc_cache_token = object()
+        self._projections: ty.Dict[ty.Tuple[type, frozenset], Projection] = dict()
+        self._row_structurers: ty.Dict[
+            ty.Tuple[type, ty.Tuple[str, ...]], RowStructurer
+        ] = dict()
+        self._compact_codec: ty.Optional[CompactCodec] = None
+        self._unstructure_projections: ty.Dict[
+            _UnstrucProjectionKey, ty.Callable[[ty.Any], ty.Any]
+        ] = dict()
         super().__init__(*args, **kwargs)
+        self._structure_func.dispatch = _HookCache(  # type: ignore[method-assign,assignment]
+            self._generate_structure_hook, self._hook_lock
+        )
+        self._unstructure_func.dispatch = _HookCache(  # type: ignore[method-assign,assignment]
+            self._unstructure_func.dispatch_without_caching, self._hook_lock
+        )
         # Re-register after super().__init__() so our factories take priority over
         # the mapping/dict hooks, which would otherwise win for wildcat (dict subclass) types.
         self.register_structure_hook_factory(
@@ -34,6 +160,210 @@ class TypecatsConverter(GenConverter):
             lambda cl: cl is ty.Any,
             self._unstructure_any,
         )
+        self.register_structure_hook_factory(
+            is_tagged_cat_union,
+            lambda typ: make_tagged_union_structure_fn(self, typ),
+        )
+        self.register_structure_hook_factory(
+            is_catlist_type, lambda typ: make_catlist_structure_fn(self, typ)
+        )
+        self.register_unstructure_hook_factory(
+            is_catlist_type, lambda typ: make_catlist_unstructure_fn(self, typ)
+        )
+        self.register_unstructure_hook_factory(
+            lambda typ: projected_names(typ) is not None,
+            lambda typ: self._get_unstructure_projection(
+                typ.__base__, projected_names(typ), None
+            ),
+        )
+        # copy() must not carry over the hooks above, which are bound to self.
+        self._struct_copy_skip = self._structure_func.get_num_fns()
+        self._unstruct_copy_skip = self._unstructure_func.get_num_fns()
+
+    def _generate_structure_hook(self, typ: ty.Any) -> ty.Any:
+        hook = self._structure_func.dispatch_without_caching(typ)
+        if self._limit_guard is not None and is_limited_type(typ):
+            hook = self._limit_guard.wrap(hook, typ)
+        return hook
+
+    def get_structure_hook(  # pylint: disable=redefined-builtin
+        self, type: ty.Any, cache_result: bool = True
+    ) -> ty.Any:
+        # cattrs also generates hooks uncached (e.g. for attributes with attrs
+        # converters); these must be limited too.
+        if cache_result:
+            return self._structure_func.dispatch(type)  # type: ignore[call-arg,misc]
+        return self._generate_structure_hook(type)
+
+    def _make_twin(self) -> "TypecatsConverter":
+        # called with the hook lock held, before the twin has generated any hooks.
+        twin = self.copy()
+        twin._stats = self._stats
+        twin._slow_detector = self._slow_detector
+        twin._limit_guard = self._limit_guard
+        twin._intern_table = self._intern_table
+        return twin
+
+    def _get_strip_defaults_twin(self) -> "TypecatsConverter":
+        twin = self._strip_defaults_twin
+        if twin is None:
+            with self._hook_lock:
+                if self._strip_defaults_twin is None:
+                    twin = self._make_twin()
+                    twin._strips_defaults = True
+                    self._strip_defaults_twin = twin
+                twin = self._strip_defaults_twin
+        return twin
+
+    def limited(self, limits: StructuringLimits) -> "TypecatsConverter":
+        """A converter like this one but with the given StructuringLimits,
+        created on first use and kept in sync with this converter's hooks.
+        """
+        twin = self._limited_twins.get(limits)
+        if twin is None:
+            with self._hook_lock:
+                twin = self._limited_twins.get(limits)
+                if twin is None:
+                    twin = self._make_twin()
+                    twin._limit_guard = LimitGuard(limits) if limits else None
+                    self._limited_twins[limits] = twin
+        return twin
+
+    def _register_on_twin(self, name: str, *args: ty.Any, **kwargs: ty.Any) -> None:
+        with self._hook_lock:
+            twins = list(self._limited_twins.values())
+            if self._strip_defaults_twin is not None:
+                twins.append(self._strip_defaults_twin)
+        for twin in twins:
+            getattr(twin, name)(*args, **kwargs)
+
+    def stats(self) -> ty.Dict[str, ty.Dict[ty.Any, HookStats]]:
+        """HookStats of the Cats this converter has structured and unstructured,
+        keyed by "structure"/"unstructure" and then by class. Empty unless the
+        converter was created with instrument=True.
+        """
+        if self._stats is None:
+            return {STRUCTURE: {}, UNSTRUCTURE: {}}
+        return self._stats.snapshot()
+
+    def reset_stats(self) -> None:
+        if self._stats is not None:
+            self._stats.reset()
+
+    def intern_stats(self) -> InternStats:
+        """How many strings interning has replaced, and their size in bytes."""
+        if self._intern_table is None:
+            return InternStats(0, 0, 0)
+        return self._intern_table.stats()
+
+    def set_slow_structuring_hook(
+        self,
+        hook: ty.Optional[SlowStructuringHook],
+        *,
+        threshold_ms: ty.Optional[float] = None,
+        max_payload_nodes: ty.Optional[int] = None,
+    ) -> None:
+        """Reports top-level Cat structuring and unstructuring that takes at least
+        threshold_ms or has more than max_payload_nodes nodes; see typecats.slow.
+        Passing None removes the hook. Either way, all hooks are regenerated.
+        """
+        detector = (
+            SlowDetector(hook, threshold_ms, max_payload_nodes)
+            if hook is not None
+            else None
+        )
+        with self._hook_lock:
+            self._slow_detector = detector
+            self._structure_func.clear_cache()
+            self._unstructure_func.clear_cache()
+            self._structure_hooks_changed()
+            self._unstructure_hooks_changed()
+        self._register_on_twin(
+            "set_slow_structuring_hook",
+            hook,
+            threshold_ms=threshold_ms,
+            max_payload_nodes=max_payload_nodes,
+        )
+
+    def set_structuring_limits(self, limits: ty.Optional[StructuringLimits]) -> None:
+        """Replaces this converter's StructuringLimits; None removes them.
+        All structure hooks are regenerated.
+        """
+        with self._hook_lock:
+            self._limit_guard = LimitGuard(limits) if limits else None
+            self._structure_func.clear_cache()
+            self._structure_hooks_changed()
+
+    def set_detailed_validation(self, enabled: bool = True) -> None:
+        """Changes the detailed validation mode and discards the hooks generated for the old mode."""
+        with self._hook_lock:
+            self.detailed_validation = enabled
+            self._structure_func.clear_cache()
+            self._structure_hooks_changed()
+        self._register_on_twin("set_detailed_validation", enabled)
+
+    def _structure_hooks_changed(self) -> None:
+        with self._hook_lock:
+            self.structure_generation += 1
+        # Projections and row structurers resolve their hooks once, so they must be rebuilt.
+        self._projections.clear()
+        self._row_structurers.clear()
+        self._compact_codec = None
+
+    def register_structure_hook(self, *args, **kwargs):
+        res = super().register_structure_hook(*args, **kwargs)
+        self._structure_hooks_changed()
+        self._register_on_twin("register_structure_hook", *args, **kwargs)
+        return res
+
+    def register_structure_hook_func(self, *args, **kwargs):
+        res = super().register_structure_hook_func(*args, **kwargs)
+        self._structure_hooks_changed()
+        self._register_on_twin("register_structure_hook_func", *args, **kwargs)
+        return res
+
+    def register_structure_hook_factory(self, predicate, factory=None):
+        if factory is None:
+            # Decorator use.
+            def decorator(factory):
+                return self.register_structure_hook_factory(predicate, factory)
+
+            return decorator
+        res = super().register_structure_hook_factory(predicate, factory)
+        self._structure_hooks_changed()
+        self._register_on_twin("register_structure_hook_factory", predicate, factory)
+        return res
+
+    def _unstructure_hooks_changed(self) -> None:
+        with self._hook_lock:
+            self.unstructure_generation += 1
+            self._unstruc_cache_token = object()
+        self._unstructure_projections.clear()
+        self._compact_codec = None
+
+    def register_unstructure_hook(self, *args, **kwargs):
+        res = super().register_unstructure_hook(*args, **kwargs)
+        self._unstructure_hooks_changed()
+        self._register_on_twin("register_unstructure_hook", *args, **kwargs)
+        return res
+
+    def register_unstructure_hook_func(self, *args, **kwargs):
+        res = super().register_unstructure_hook_func(*args, **kwargs)
+        self._unstructure_hooks_changed()
+        self._register_on_twin("register_unstructure_hook_func", *args, **kwargs)
+        return res
+
+    def register_unstructure_hook_factory(self, predicate, factory=None):
+        if factory is None:
+            # Decorator use.
+            def decorator(factory):
+                return self.register_unstructure_hook_factory(predicate, factory)
+
+            return decorator
+        res = super().register_unstructure_hook_factory(predicate, factory)
+        self._unstructure_hooks_changed()
+        self._register_on_twin("register_unstructure_hook_factory", predicate, factory)
+        return res
 
     def _unstructure_any(self, obj: ty.Any) -> ty.Any:
         cls = type(obj)
@@ -41,44 +371,195 @@ class TypecatsConverter(GenConverter):
             return self.unstructure(obj, cls)
         return self.unstructure(obj)
 
+    def projection(self, cls: ty.Type[C], names: ty.AbstractSet[str]) -> Projection[C]:
+        """Returns a cached Projection that structures only the named attributes of cls."""
+        key = (cls, frozenset(names))
+        proj = self._projections.get(key)
+        if proj is None:
+            proj = self._projections.setdefault(key, Projection(self, cls, key[1]))
+        return proj
+
+    def specialize(self, generic: type, *params: ty.Any) -> ty.List[ty.Any]:
+        """Generates the structure and unstructure hooks for parameterizations of a generic Cat.
+
+        Each param is a type argument, or a tuple of them for generics with
+        several type parameters. Call this at startup so that the first
+        request using e.g. Page[User] doesn't pay for generating its hooks.
+        Returns the parameterized types.
+        """
+        specialized = list()
+        for param in params:
+            typ = generic[param]  # type: ignore[index]
+            self.get_structure_hook(typ)
+            self.get_unstructure_hook(typ)
+            specialized.append(typ)
+        return specialized
+
+    def row_structurer(
+        self, cls: ty.Type[C], columns: ty.Sequence[str]
+    ) -> RowStructurer[C]:
+        """Returns a cached RowStructurer for rows of cls with the given columns."""
+        key = (cls, tuple(columns))
+        rows = self._row_structurers.get(key)
+        if rows is None:
+            rows = self._row_structurers.setdefault(
+                key, RowStructurer(self, cls, key[1])
+            )
+        return rows
+
+    def compact_codec(self) -> CompactCodec:
+        """The CompactCodec for this converter's hooks; see typecats.compact."""
+        codec = self._compact_codec
+        if codec is None:
+            codec = self._compact_codec = CompactCodec(self)
+        return codec
+
     def gen_structure_attrs_fromdict(self, cls):
         base = super().gen_structure_attrs_fromdict(cls)
+        # Everything about cls is settled here, once per parameterization,
+        # rather than on every call.
+        core_type = ty.get_origin(cls) or cls
+        wildcat = is_wildcat(cls)
+        attrs_names = frozenset(get_attrs_names(core_type)) if wildcat else frozenset()
+        # enriching a change-tracking Wildcat records its extras as changes.
+        clear_enrichment_changes = wildcat and tracks_changes(cls)
+        intern_fields = (
+            make_field_interner(core_type, self._intern_table)
+            if self._intern_table is not None
+            else None
+        )
 
         def structure_typecat(dictionary, Type):
             try:
                 with _consolidate_exceptions(self, Type):
-                    core_type = ty.get_origin(Type) or Type
-                    if is_wildcat(Type) and isinstance(dictionary, core_type):
+                    if wildcat and isinstance(dictionary, core_type):
                         res = self.structure_attrs_fromdict(dictionary, Type)
                     else:
                         res = base(dictionary, Type)
-                    if is_wildcat(Type):
-                        enrich_structured_wildcat(res, dictionary, Type)
+                    if wildcat:
+                        enrich_structured_wildcat(res, dictionary, Type, attrs_names)
+                        if clear_enrichment_changes:
+                            clear_changes(res)
+                    if intern_fields is not None:
+                        intern_fields(res)
                     return res
             except StructuringError as e:
                 _embed_exception_info(e, dictionary, Type)
                 raise e
 
-        return structure_typecat
+        hook = structure_typecat
+        if self._stats is not None:
+            hook = instrument_structure(hook, self._stats.counter(STRUCTURE, cls))
+        if self._slow_detector is not None:
+            hook = self._slow_detector.wrap_structure(hook, cls)
+        return hook
 
     def gen_unstructure_attrs_fromdict(self, cls):
-        base = super().gen_unstructure_attrs_fromdict(cls)
+        hook = self._wrap_unstructure_typecat(
+            cls, super().gen_unstructure_attrs_fromdict(cls)
+        )
+        if self._stats is not None:
+            hook = instrument_unstructure(hook, self._stats.counter(UNSTRUCTURE, cls))
+        if self._slow_detector is not None:
+            hook = self._slow_detector.wrap_unstructure(hook, cls)
+        return hook
+
+    def _wrap_unstructure_typecat(
+        self,
+        cls,
+        base: ty.Callable[[ty.Any], ty.Dict[str, ty.Any]],
+        keep_extra: ty.Optional[ty.Callable[[ty.Any], bool]] = None,
+    ):
         core_cls = ty.get_origin(cls) or cls
+        wildcat = is_wildcat(cls)
+        # projections (keep_extra) have their own key sets, so they are not cached.
+        cached = keep_extra is None and caches_unstruc(cls)
+        stripped = self._strips_defaults
+
+        def unstructure_attrs_stripped(obj):
+            return strip_attrs_defaults(base(obj), obj)
+
+        unstructure_attrs = unstructure_attrs_stripped if stripped else base
+
+        def unstructure_attrs_cached(obj):
+            if type(obj) is not core_cls:
+                # a subclass instance unstructured as its declared parent type
+                return unstructure_attrs(obj)
+            token = self._unstruc_cache_token
+            res = get_cached(obj, stripped, token)
+            if res is None:
+                res = unstructure_attrs(obj)
+                set_cached(obj, stripped, token, res)
+            return res
+
+        unstructure_typed = unstructure_attrs_cached if cached else unstructure_attrs
 
         def unstructure_with_extras(obj):
             if isinstance(obj, dict) and not is_attrs_class(type(obj)):
                 # Restores cattrs 22 behavior: plain dicts in attrs-typed fields are
                 # structured into the expected type before unstructuring.
                 obj = self.structure(obj, core_cls)
-            res = base(obj)
-            if ShouldStripDefaults.get():
-                res = strip_attrs_defaults(res, obj)
-            if is_wildcat(cls):
-                res = enrich_unstructured_wildcat(self, obj, res)
+            res = unstructure_typed(obj)
+            if wildcat:
+                res = enrich_unstructured_wildcat(self, obj, res, keep_extra)
             return res
 
         return unstructure_with_extras
 
+    def gen_unstructure_attrs_projection(
+        self,
+        cls: type,
+        include: ty.Optional[ty.AbstractSet[str]] = None,
+        exclude: ty.AbstractSet[str] = frozenset(),
+    ) -> ty.Callable[[ty.Any], ty.Dict[str, ty.Any]]:
+        """Generates an unstructure hook that emits only the included keys of cls.
+
+        Attributes that are not emitted are never unstructured, and the
+        Wildcat extras are filtered by the same include/exclude rules.
+        """
+        attribs = attr.fields(ty.get_origin(cls) or cls)
+        names = {a.name for a in attribs}
+        unknown = (set(include or ()) | set(exclude)) - names
+        if unknown and not is_wildcat(cls):
+            raise ValueError(
+                f"Cannot include or exclude {sorted(unknown)}; "
+                f"they are not attributes of {getattr(cls, '__name__', cls)}"
+            )
+        overrides: ty.Dict[str, ty.Any] = {
+            a.name: self.type_overrides[a.type]
+            for a in attribs
+            if a.type in self.type_overrides
+        }
+        for name in names:
+            if name in exclude or (include is not None and name not in include):
+                overrides[name] = override(omit=True)
+        base: ty.Callable[[ty.Any], ty.Dict[str, ty.Any]] = make_dict_unstructure_fn(
+            cls, self, _cattrs_omit_if_default=self.omit_if_default, **overrides
+        )
+
+        def keep_extra(key: ty.Any) -> bool:
+            return key not in exclude and (include is None or key in include)
+
+        return self._wrap_unstructure_typecat(cls, base, keep_extra)
+
+    def _get_unstructure_projection(
+        self,
+        cls: type,
+        include: ty.Optional[ty.AbstractSet[str]],
+        exclude: ty.Optional[ty.AbstractSet[str]],
+    ) -> ty.Callable[[ty.Any], ty.Dict[str, ty.Any]]:
+        key: _UnstrucProjectionKey = (
+            cls,
+            frozenset(include) if include is not None else None,
+            frozenset(exclude or ()),
+        )
+        hook = self._unstructure_projections.get(key)
+        if hook is None:
+            hook = self._unstructure_projections.setdefault(
+                key, self.gen_unstructure_attrs_projection(*key)
+            )
+        return hook
+
     def gen_unstructure_optional(self, cl: type) -> ty.Callable:
         """Restore cattrs 22 runtime-dispatch behavior for Optional fields.
 
@@ -105,8 +586,35 @@ class TypecatsConverter(GenConverter):
         unstructure_as: ty.Any = None,
         *,
         strip_defaults: bool = False,
+        include: ty.Optional[ty.AbstractSet[str]] = None,
+        exclude: ty.Optional[ty.AbstractSet[str]] = None,
     ) -> ty.Any:
-        if strip_defaults:
-            with stack_context(ShouldStripDefaults, True):
-                return super().unstructure(obj, unstructure_as)
+        """Unstructure obj, optionally limited to the `include`d keys and
+        without the `exclude`d ones. Key selection applies only to the top
+        level object, which must then be an attrs instance.
+        """
+        if (
+            strip_defaults or _SHOULD_STRIP_DEFAULTS.get()
+        ) and not self._strips_defaults:
+            # the deprecated ShouldStripDefaults is set for custom hooks that
+            # read it or unstructure through a converter they close over.
+            token = _SHOULD_STRIP_DEFAULTS.set(True)
+            try:
+                return self._get_strip_defaults_twin().unstructure(
+                    obj, unstructure_as, include=include, exclude=exclude
+                )
+            finally:
+                _SHOULD_STRIP_DEFAULTS.reset(token)
+        if include is not None or exclude is not None:
+            if not is_attrs_class(type(obj)):
+                raise TypeError(
+                    f"include/exclude require an attrs instance; got {type(obj)}"
+                )
+            cls: ty.Any = type(obj)
+            projected = projected_names(cls)
+            if projected is not None:
+                # a projected instance has only its projected attributes
+                cls = cls.__base__
+                include = projected if include is None else projected & set(include)
+            return self._get_unstructure_projection(cls, include, exclude)(obj)
         return super().unstructure(obj, unstructure_as)
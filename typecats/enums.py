@@ -0,0 +1,143 @@
+"""Structuring and unstructuring of Enum Cats.
+
+    @Cat(enum_unknown=Color.OTHER)
+    class Color(Enum):
+        RED = "red"
+        OTHER = "other"
+
+The structure hook of an Enum Cat looks values up in a dict of the
+Enum's values, rather than calling the Enum, which raises and catches
+an exception for every value that isn't its own member. Values that
+aren't found are still passed to the Enum, so that `_missing_` and
+Flag combinations keep working; what happens to the rest is up to
+`enum_unknown`:
+
+- "raise" (the default): the ValueError the Enum raises
+- None: they structure to None
+- a member of the Enum: they structure to that member
+
+The unstructure hook reads the member's value directly. As in cattrs,
+the values of Enums with an annotated `_value_` are structured and
+unstructured as that type.
+"""
+
+import enum
+import operator
+import typing as ty
+from typing import Literal
+
+from cattrs import Converter
+
+RAISE: ty.Final = "raise"
+
+EnumUnknown = ty.Union[Literal["raise"], None, enum.Enum]
+
+
+def check_enum_unknown(cls: ty.Type[enum.Enum], unknown: EnumUnknown) -> None:
+    if unknown is None or isinstance(unknown, cls):
+        return
+    if unknown == RAISE and isinstance(unknown, str):
+        return
+    raise TypeError(
+        f"enum_unknown for {cls.__qualname__} must be 'raise', None, "
+        f"or one of its members, not {unknown!r}"
+    )
+
+
+def _value_type(cls: ty.Type[enum.Enum]) -> ty.Any:
+    return (
+        cls.__annotations__.get("_value_") if "__annotations__" in vars(cls) else None
+    )
+
+
+def _has_missing(cls: ty.Type[enum.Enum]) -> bool:
+    missing = getattr(cls._missing_, "__func__", None)
+    return missing is not enum.Enum._missing_.__func__  # type: ignore[attr-defined]
+
+
+def make_enum_structure_factory(
+    cls: ty.Type[enum.Enum], unknown: EnumUnknown
+) -> ty.Callable[[ty.Any, Converter], ty.Callable[[ty.Any, ty.Any], ty.Any]]:
+    check_enum_unknown(cls, unknown)
+    raises = not isinstance(unknown, cls) and unknown is not None
+    has_missing = _has_missing(cls)
+
+    def missing(value: ty.Any) -> ty.Any:
+        if raises:
+            return cls(value)  # the Enum's own error, or its _missing_
+        if isinstance(value, cls):
+            return value
+        if has_missing:
+            try:
+                return cls(value)
+            except ValueError:
+                pass
+        return unknown
+
+    def factory(_type: ty.Any, converter: Converter) -> ty.Callable[..., ty.Any]:
+        # aliases included; members are never None, so None means not found
+        get = {v: m for v, m in cls._value2member_map_.items()}.get
+        value_type = _value_type(cls)
+
+        if value_type is None:
+
+            def structure_enum(value: ty.Any, _Type: ty.Any) -> ty.Any:
+                try:
+                    member = get(value)
+                except TypeError:  # unhashable
+                    return missing(value)
+                return member if member is not None else missing(value)
+
+            return structure_enum
+
+        value_hook = converter.get_structure_hook(value_type)
+
+        def structure_typed_enum(value: ty.Any, _Type: ty.Any) -> ty.Any:
+            if isinstance(value, cls):
+                return value
+            value = value_hook(value, value_type)
+            try:
+                member = get(value)
+            except TypeError:
+                return missing(value)
+            return member if member is not None else missing(value)
+
+        return structure_typed_enum
+
+    return factory
+
+
+def make_enum_unstructure_factory(
+    cls: ty.Type[enum.Enum],
+) -> ty.Callable[[ty.Any, Converter], ty.Callable[[ty.Any], ty.Any]]:
+    # `Enum.value` is a Python-level descriptor; `_value_` is in the instance dict.
+    get_value = operator.attrgetter("_value_")
+
+    def factory(_type: ty.Any, converter: Converter) -> ty.Callable[[ty.Any], ty.Any]:
+        value_type = _value_type(cls)
+        if value_type is None:
+            return get_value
+        value_hook = converter.get_unstructure_hook(value_type)
+
+        def unstructure_typed_enum(member: ty.Any) -> ty.Any:
+            return value_hook(member._value_)
+
+        return unstructure_typed_enum
+
+    return factory
+
+
+def register_enum_hooks(
+    converter: Converter, cls: ty.Type[enum.Enum], unknown: EnumUnknown = RAISE
+) -> None:
+    """Registers the Enum Cat hooks of cls on converter."""
+
+    def is_cls(typ: ty.Any) -> bool:
+        return typ is cls
+
+    converter.register_structure_hook_factory(
+        is_cls, make_enum_structure_factory(cls, unknown)
+    )
+    converter.register_unstructure_hook_factory(
+        is_cls, make_enum_unstructure_factory(cls)
+    )
@@ -37,6 +37,18 @@ class SimpleValidationError(BaseValidationError):
     pass
 
 
+class UnknownUnionTagError(BaseValidationError):
+    """A tagged Union of Cats was given an item whose tag matches none of its members."""
+
+
+class StructuringLimitError(BaseValidationError):
+    """Structuring exceeded one of the converter's StructuringLimits."""
+
+
+class CompactSchemaError(BaseValidationError):
+    """A compact payload was written for a different schema than the class it is structured as."""
+
+
 @contextlib.contextmanager
 def _consolidate_exceptions(converter: Converter, cl: ty.Type[C]):
     """Re-raises basic validation exceptions as a SimpleValidationException group.
@@ -101,6 +113,8 @@ _EXCEPTION_HOOK: TypecatsCommonExceptionHook = _default_log_structure_exception
 
 
 def set_default_exception_hook(hook: TypecatsCommonExceptionHook):
+    # A single reference assignment, so threads emitting exceptions
+    # concurrently see either the old hook or the new one.
     global _EXCEPTION_HOOK
     _EXCEPTION_HOOK = hook
 
@@ -0,0 +1,128 @@
+"""Opt-in per-class timing and call counting for a TypecatsConverter.
+
+`TypecatsConverter(instrument=True)` wraps each Cat structure and
+unstructure hook it generates in a timer; without it, the hooks are
+generated exactly as before and cost nothing extra. `converter.stats()`
+returns a HookStats per operation and class.
+
+Try_struc goes through the same structure hook as struc, so its
+suppressed errors are counted as failures. Times are inclusive: a Cat
+nested inside another is counted both on its own and as part of its
+parent. The payload size is a cheap estimate, the number of top-level
+keys in the input (when structuring) or output (when unstructuring).
+"""
+
+import threading
+import time
+import typing as ty
+
+STRUCTURE = "structure"
+UNSTRUCTURE = "unstructure"
+
+
+class HookStats(ty.NamedTuple):
+    calls: int
+    failures: int
+    total_s: float
+    max_s: float
+    payload_keys: int
+
+
+class _Counter:
+    __slots__ = ("_lock", "calls", "failures", "total_s", "max_s", "payload_keys")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.calls = 0
+        self.failures = 0
+        self.total_s = 0.0
+        self.max_s = 0.0
+        self.payload_keys = 0
+
+    def record(self, elapsed: float, failed: bool, payload: ty.Any) -> None:
+        try:
+            keys = len(payload)
+        except TypeError:
+            keys = 0
+        with self._lock:
+            self.calls += 1
+            self.failures += failed
+            self.total_s += elapsed
+            if elapsed > self.max_s:
+                self.max_s = elapsed
+            self.payload_keys += keys
+
+    def snapshot(self) -> HookStats:
+        with self._lock:
+            return HookStats(
+                self.calls, self.failures, self.total_s, self.max_s, self.payload_keys
+            )
+
+
+class ConverterStats:
+    """The counters of one instrumented converter, keyed by operation and class."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: ty.Dict[ty.Tuple[str, ty.Any], _Counter] = dict()
+
+    def counter(self, operation: str, cls: ty.Any) -> _Counter:
+        with self._lock:
+            return self._counters.setdefault((operation, cls), _Counter())
+
+    def snapshot(self) -> ty.Dict[str, ty.Dict[ty.Any, HookStats]]:
+        with self._lock:
+            counters = list(self._counters.items())
+        res: ty.Dict[str, ty.Dict[ty.Any, HookStats]] = {STRUCTURE: {}, UNSTRUCTURE: {}}
+        for (operation, cls), counter in counters:
+            stats = counter.snapshot()
+            if stats.calls:
+                res[operation][cls] = stats
+        return res
+
+    def reset(self) -> None:
+        # generated hooks hold on to their counters, so these are zeroed in place.
+        with self._lock:
+            counters = list(self._counters.values())
+        for counter in counters:
+            with counter._lock:  # pylint: disable=protected-access
+                counter.reset()
+
+
+def instrument_structure(
+    hook: ty.Callable[[ty.Any, ty.Any], ty.Any], counter: _Counter
+) -> ty.Callable[[ty.Any, ty.Any], ty.Any]:
+    perf_counter = time.perf_counter
+
+    def structure_instrumented(d: ty.Any, Type: ty.Any) -> ty.Any:
+        start = perf_counter()
+        try:
+            res = hook(d, Type)
+        except BaseException:
+            counter.record(perf_counter() - start, True, d)
+            raise
+        counter.record(perf_counter() - start, False, d)
+        return res
+
+    return structure_instrumented
+
+
+def instrument_unstructure(
+    hook: ty.Callable[[ty.Any], ty.Any], counter: _Counter
+) -> ty.Callable[[ty.Any], ty.Any]:
+    perf_counter = time.perf_counter
+
+    def unstructure_instrumented(obj: ty.Any) -> ty.Any:
+        start = perf_counter()
+        try:
+            res = hook(obj)
+        except BaseException:
+            counter.record(perf_counter() - start, True, None)
+            raise
+        counter.record(perf_counter() - start, False, res)
+        return res
+
+    return unstructure_instrumented
@@ -0,0 +1,184 @@
+"""Structuring JSON batches in a pool of sub-interpreters (Python 3.14+).
+
+Each interpreter imports typecats, and therefore has its own default
+TypecatsConverter. Nothing but bytes crosses between interpreters:
+payloads go in as raw JSON and come out either unstructured (plain
+dicts) or re-serialized as JSON, so the Cats themselves never need to be
+pickled.
+
+Hooks registered at runtime in the main interpreter can't be shipped to
+the workers. Instead, each worker imports the given `modules` on
+startup, which replays the Cat definitions and hook registrations those
+modules perform at import time. Cats must be importable by module and
+qualified name (i.e. not defined inside a function).
+"""
+
+import importlib
+import json
+import os
+import sys
+import typing as ty
+from concurrent.futures import Executor
+
+Output = ty.Literal["unstruc", "json"]
+
+DEFAULT_CHUNKS_PER_WORKER = 4
+
+
+class RemoteStructuringError(Exception):
+    """Raised in place of an error from structuring inside a worker
+    interpreter, since most structuring errors can't be sent back.
+    """
+
+    def __init__(self, index: int, message: str):
+        super().__init__(f"Item {index}: {message}")
+        self.index = index
+        self.message = message
+
+    def __reduce__(self):
+        return (type(self), (self.index, self.message))
+
+
+def _import_interpreter_pool_executor() -> ty.Any:
+    try:
+        # pylint: disable=import-outside-toplevel,no-name-in-module
+        from concurrent.futures import InterpreterPoolExecutor  # type: ignore[attr-defined,unused-ignore]
+    except ImportError as e:
+        raise ImportError(
+            "Sub-interpreter structuring requires Python 3.14 or newer"
+        ) from e
+    return InterpreterPoolExecutor
+
+
+def _bootstrap(modules: ty.Sequence[str], sys_path: ty.Sequence[str]) -> None:
+    """Runs once in each worker interpreter."""
+    for path in sys_path:
+        if path not in sys.path:
+            sys.path.append(path)
+    for module in modules:
+        importlib.import_module(module)
+
+
+def _cat_ref(cls: type) -> str:
+    if "<locals>" in cls.__qualname__:
+        raise ValueError(
+            f"{cls.__qualname__} is defined inside a function and cannot be "
+            "imported by a worker interpreter"
+        )
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def _resolve_cat(ref: str) -> ty.Any:
+    module, _, qualname = ref.partition(":")
+    obj: ty.Any = importlib.import_module(module)
+    for name in qualname.split("."):
+        obj = getattr(obj, name)
+    return obj
+
+
+def _struc_json_chunk(
+    ref: str, payloads: ty.Sequence[ty.Union[bytes, str]], output: Output, start: int
+) -> ty.List[ty.Any]:
+    """Runs in a worker interpreter."""
+    cls = _resolve_cat(ref)
+    results = list()
+    for i, payload in enumerate(payloads):
+        try:
+            unstructured = cls.struc(json.loads(payload)).unstruc()
+        except Exception as e:  # noqa # sent back as a RemoteStructuringError
+            raise RemoteStructuringError(
+                start + i, f"{type(e).__name__}: {e}"
+            ) from None
+        results.append(
+            json.dumps(unstructured).encode() if output == "json" else unstructured
+        )
+    return results
+
+
+class InterpreterPool:
+    """A pool of worker interpreters for structuring JSON payloads.
+
+    `executor` may be given to use another kind of pool (e.g. a
+    ProcessPoolExecutor on older Pythons); the pool then does not own
+    it and will not shut it down, and `modules` must already be imported
+    by its workers.
+    """
+
+    def __init__(
+        self,
+        modules: ty.Sequence[str] = (),
+        *,
+        workers: ty.Optional[int] = None,
+        executor: ty.Optional[Executor] = None,
+    ):
+        self.workers = workers or os.cpu_count() or 1
+        self._owns_executor = executor is None
+        if executor is None:
+            pool_cls = _import_interpreter_pool_executor()
+            executor = pool_cls(
+                max_workers=self.workers,
+                initializer=_bootstrap,
+                initargs=(tuple(modules), tuple(sys.path)),
+            )
+        self._executor = executor
+
+    def struc_json_many(
+        self,
+        cls: type,
+        payloads: ty.Iterable[ty.Union[bytes, str]],
+        *,
+        output: Output = "unstruc",
+        chunk_size: ty.Optional[int] = None,
+    ) -> ty.List[ty.Any]:
+        """Structures each JSON payload as cls and returns the results in order.
+
+        With output="unstruc" each result is the structured Cat unstructured
+        again, so values are validated and normalized; with output="json"
+        it is that, serialized to JSON bytes. The first failing item raises
+        RemoteStructuringError.
+        """
+        if output not in ("unstruc", "json"):
+            raise ValueError(f"Unknown output {output!r}")
+        ref = _cat_ref(cls)
+        payloads = payloads if isinstance(payloads, ty.Sequence) else list(payloads)
+        if chunk_size is None:
+            chunk_size = -(-len(payloads) // (self.workers * DEFAULT_CHUNKS_PER_WORKER))
+        chunk_size = max(1, chunk_size)
+        futures = [
+            self._executor.submit(
+                _struc_json_chunk, ref, payloads[i : i + chunk_size], output, i
+            )
+            for i in range(0, len(payloads), chunk_size)
+        ]
+        results: ty.List[ty.Any] = list()
+        for future in futures:
+            results.extend(future.result())
+        return results
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._owns_executor:
+            self._executor.shutdown(wait=wait)
+
+    def __enter__(self) -> "InterpreterPool":
+        return self
+
+    def __exit__(self, *_exc: ty.Any) -> None:
+        self.shutdown()
+
+
+def struc_json_many(
+    cls: type,
+    payloads: ty.Iterable[ty.Union[bytes, str]],
+    *,
+    modules: ty.Sequence[str] = (),
+    workers: ty.Optional[int] = None,
+    output: Output = "unstruc",
+) -> ty.List[ty.Any]:
+    """Structures the payloads in a new InterpreterPool, shut down afterwards.
+
+    The module defining cls is always imported by the workers.
+    Prefer keeping an InterpreterPool around for repeated batches.
+    """
+    modules = (cls.__module__, *modules)
+    with InterpreterPool(modules, workers=workers) as pool:
+        return pool.struc_json_many(cls, payloads, output=output)
@@ -0,0 +1,107 @@
+"""Limits on the size and shape of what a TypecatsConverter will structure.
+
+    converter = TypecatsConverter(limits=StructuringLimits(max_depth=32, max_nodes=100_000))
+    MyCat.struc(d, limits=StructuringLimits(max_collection_size=1000))
+
+With limits, the structure hooks of Cats and collections are wrapped in
+guards when they are generated; without them, no hook is wrapped. Each
+thread counts, for the duration of a top-level structure call:
+
+- depth: the nesting of Cats and collections being structured,
+- collection size: checked before any element of a collection is structured,
+- nodes: one per Cat or collection, plus one per collection element.
+
+Exceeding a limit raises StructuringLimitError as soon as it is detected,
+even when it happens deep inside detailed validation.
+"""
+
+import collections.abc
+import threading
+import typing as ty
+
+from attr import has as is_attrs_class
+
+from .exceptions import StructuringLimitError
+
+
+class StructuringLimits(ty.NamedTuple):
+    max_depth: ty.Optional[int] = None
+    max_collection_size: ty.Optional[int] = None
+    max_nodes: ty.Optional[int] = None
+
+
+def _is_collection(typ: ty.Any) -> bool:
+    core = ty.get_origin(typ) or typ
+    return (
+        isinstance(core, type)
+        and issubclass(core, collections.abc.Collection)
+        and not issubclass(core, (str, bytes, bytearray))
+    )
+
+
+def is_limited_type(typ: ty.Any) -> bool:
+    core = ty.get_origin(typ) or typ
+    return (isinstance(core, type) and is_attrs_class(core)) or _is_collection(typ)
+
+
+class _Counts(threading.local):
+    depth = 0
+    nodes = 0
+    exceeded: ty.Optional[StructuringLimitError] = None
+
+
+class LimitGuard:
+    """Wraps structure hooks to enforce StructuringLimits."""
+
+    def __init__(self, limits: StructuringLimits):
+        self.limits = limits
+        self._counts = _Counts()
+
+    def _exceeded(self, typ: ty.Any, problem: str) -> StructuringLimitError:
+        msg = f"While structuring {getattr(typ, '__name__', typ)}: {problem}"
+        err = StructuringLimitError(msg, [ValueError(msg)], typ)
+        self._counts.exceeded = err
+        return err
+
+    def wrap(
+        self, hook: ty.Callable[[ty.Any, ty.Any], ty.Any], typ: ty.Any
+    ) -> ty.Callable[[ty.Any, ty.Any], ty.Any]:
+        max_depth, max_size, max_nodes = self.limits
+        collection = _is_collection(typ)
+        counts = self._counts
+
+        def structure_limited(obj: ty.Any, Type: ty.Any) -> ty.Any:
+            depth = counts.depth
+            if depth == 0:
+                counts.nodes = 0
+                counts.exceeded = None
+            nodes = counts.nodes + 1
+            if max_depth is not None and depth >= max_depth:
+                raise self._exceeded(Type, f"exceeded max_depth={max_depth}")
+            if collection:
+                try:
+                    size = len(obj)
+                except TypeError:
+                    size = 0
+                if max_size is not None and size > max_size:
+                    raise self._exceeded(
+                        Type,
+                        f"collection of {size} items exceeds max_collection_size={max_size}",
+                    )
+                nodes += size
+            if max_nodes is not None and nodes > max_nodes:
+                raise self._exceeded(Type, f"exceeded max_nodes={max_nodes}")
+            counts.nodes = nodes
+            counts.depth = depth + 1
+            try:
+                return hook(obj, Type)
+            except Exception:
+                exceeded = counts.exceeded
+                if depth == 0 and exceeded is not None:
+                    # surface the limit error rather than the groups wrapping it
+                    raise exceeded from None
+                raise
+            finally:
+                counts.depth = depth
+
+        return structure_limited
@@ -0,0 +1,285 @@
+"""Compact pickling of Cats.
+
+Every Cat gets a generated `__reduce_ex__` that pickles its attribute
+values positionally, and the untyped keys of a Wildcat as one dict,
+instead of attrs' per-attribute state (and, for Wildcats, the pickling
+of their dict base item by item). Unpickling calls the class's generated
+`__typecats_reconstruct__`, which sets the values directly, skipping
+`__init__` and validators: the object was valid when it was pickled.
+
+The values are preceded by the tuple of attribute names, which pickle
+memoizes, so it is written out once per pickle. If the class's
+attributes have since been reordered, added or removed, the values are
+matched up by name; added attributes get their defaults, and an
+UnpicklingError is raised for attributes that were removed or that have
+no default.
+
+Other instance state, such as the changes recorded by `track_changes`,
+is carried along. Memoized unstruc results and cached hashes are not.
+
+Cats whose class (or a base class) defines its own `__reduce__`,
+`__reduce_ex__`, `__getstate__` or `__setstate__` keep it, and so do
+subclasses of a Cat that define their own: they are pickled as `object`
+would pickle them.
+"""
+
+import operator
+import pickle
+import typing as ty
+
+import attr
+
+from .unstruc_cache import _CACHE_SLOTS
+
+_PICKLING_METHODS = ("__reduce__", "__reduce_ex__", "__getstate__", "__setstate__")
+# never carried over: hashes of str differ between processes
+_DROPPED_STATE = frozenset((*_CACHE_SLOTS, "_attrs_cached_hash"))
+_GENERATED_ATTR = "__typecats_pickling__"
+_RECONSTRUCT_NAME = "__typecats_reconstruct__"
+
+
+class _Plan(ty.NamedTuple):
+    names: ty.Tuple[str, ...]
+    get_values: ty.Callable[[ty.Any], ty.Tuple[ty.Any, ...]]
+    slotted: bool  # some attributes are in slots rather than the instance dict
+    has_dict: bool
+    wildcat: bool
+
+
+_PLANS: ty.Dict[type, _Plan] = dict()
+_OWN_PICKLING: ty.Dict[type, bool] = dict()
+
+
+def _make_plan(cls: type) -> _Plan:
+    names = tuple(a.name for a in attr.fields(cls))
+    get_values: ty.Callable[[ty.Any], ty.Tuple[ty.Any, ...]]
+    if len(names) > 1:
+        get_values = operator.attrgetter(*names)
+    else:
+        # attrgetter of one name returns the value rather than a tuple
+
+        def get_values(obj: ty.Any) -> ty.Tuple[ty.Any, ...]:
+            return tuple(getattr(obj, name) for name in names)
+
+    slots = {
+        slot
+        for klass in cls.__mro__
+        for slot in ty.cast(ty.Iterable[str], klass.__dict__.get("__slots__", ()))
+    }
+    plan = _Plan(
+        names,
+        get_values,
+        any(name in slots for name in names),
+        cls.__dictoffset__ != 0,
+        issubclass(cls, dict),
+    )
+    _PLANS[cls] = plan
+    return plan
+
+
+def _get_plan(cls: type) -> _Plan:
+    return _PLANS.get(cls) or _make_plan(cls)
+
+
+def _values_by_name(
+    cls: type, names: ty.Tuple[str, ...], values: ty.Tuple[ty.Any, ...]
+) -> ty.Tuple[ty.Any, ...]:
+    """The values pickled for names, in the current order of cls's attributes."""
+    by_name = dict(zip(names, values))
+    fields = attr.fields(cls)
+    removed = by_name.keys() - {a.name for a in fields}
+    if removed:
+        raise pickle.UnpicklingError(
+            f"{cls.__qualname__} was pickled with attributes it no longer has: "
+            f"{sorted(removed)}"
+        )
+    ordered = list()
+    for a in fields:
+        default = a.default
+        if a.name in by_name:
+            ordered.append(by_name[a.name])
+        elif isinstance(default, attr.Factory):  # type: ignore[arg-type]
+            if default.takes_self:  # type: ignore[union-attr]
+                raise pickle.UnpicklingError(
+                    f"{cls.__qualname__} was pickled without its attribute {a.name!r}, "
+                    "whose default needs the object itself"
+                )
+            ordered.append(default.factory())  # type: ignore[union-attr]
+        elif default is not attr.NOTHING:
+            ordered.append(default)
+        else:
+            raise pickle.UnpicklingError(
+                f"{cls.__qualname__} was pickled without its attribute {a.name!r}, "
+                "which has no default"
+            )
+    return tuple(ordered)
+
+
+def _reconstruct(
+    cls: type,
+    names: ty.Tuple[str, ...],
+    values: ty.Tuple[ty.Any, ...],
+    extras: ty.Optional[dict] = None,
+    state: ty.Optional[dict] = None,
+) -> ty.Any:
+    plan = _get_plan(cls)
+    if names != plan.names:
+        values = _values_by_name(cls, names, values)
+    obj = cls.__new__(cls)  # type: ignore[call-overload]
+    if plan.slotted:
+        for name, value in zip(plan.names, values):
+            object.__setattr__(obj, name, value)
+    else:
+        obj.__dict__.update(zip(plan.names, values))
+    if state:
+        obj.__dict__.update(state)
+    if extras:
+        dict.update(obj, extras)
+    return obj
+
+
+def _reduce_cat(self: ty.Any, protocol: int) -> ty.Union[str, ty.Tuple[ty.Any, ...]]:
+    """Reduces any Cat, including its other instance state; used when the fast path can't be."""
+    cls = type(self)
+    own_pickling = _OWN_PICKLING.get(cls)
+    if own_pickling is None:
+        own_pickling = _OWN_PICKLING[cls] = _defines_pickling(cls)
+    if own_pickling:
+        # only __reduce_ex__ is generated, so object's calls an overriding __reduce__
+        return object.__reduce_ex__(self, protocol)
+    plan = _get_plan(cls)
+    extras = dict.copy(self) if plan.wildcat and dict.__len__(self) else None
+    state = None
+    if plan.has_dict:
+        instance_dict = self.__dict__
+        if plan.slotted or len(instance_dict) > len(plan.names):
+            state = {
+                k: v
+                for k, v in instance_dict.items()
+                if k not in plan.names and k not in _DROPPED_STATE
+            } or None
+    values = plan.get_values(self)
+    if state is not None:
+        return (_reconstruct, (cls, plan.names, values, extras, state))
+    if extras is not None:
+        return (_reconstruct, (cls, plan.names, values, extras))
+    return (_reconstruct, (cls, plan.names, values))
+
+
+def _defines_pickling(cls: type) -> bool:
+    for klass in cls.__mro__:
+        if klass in (object, dict):
+            continue
+        for name in _PICKLING_METHODS:
+            method = klass.__dict__.get(name)
+            if method is None or getattr(method, _GENERATED_ATTR, False):
+                continue
+            if getattr(method, "__module__", "").startswith("attr."):
+                continue  # generated by attrs for slotted classes
+            return True
+    return False
+
+
+def _compile(
+    cls: type, name: str, source: str, namespace: ty.Dict[str, ty.Any]
+) -> ty.Callable[..., ty.Any]:
+    exec(  # pylint: disable=exec-used
+        compile(source, f"<typecats {name} {cls.__qualname__}>", "exec"), namespace
+    )
+    fn = namespace[name]
+    setattr(fn, _GENERATED_ATTR, True)
+    return fn
+
+
+def _reconstruct_renamed(
+    cls: type, names: ty.Tuple[str, ...], values: ty.Tuple[ty.Any, ...]
+) -> ty.Any:
+    n = len(names)
+    return _reconstruct(cls, names, values[:n], values[n] if len(values) > n else None)
+
+
+def _make_reconstruct(cls: type, plan: _Plan) -> ty.Callable[..., ty.Any]:
+    params = [f"v{i}" for i in range(len(plan.names))]
+    if plan.wildcat:
+        params.append("*extras")
+    unpack = f"    {', '.join(params)}, = values\n" if params else ""
+    if plan.slotted:
+        sets = [f"    _setattr(o, {n!r}, v{i})\n" for i, n in enumerate(plan.names)]
+    else:
+        sets = ["    d = o.__dict__\n"] + [
+            f"    d[{n!r}] = v{i}\n" for i, n in enumerate(plan.names)
+        ]
+    if plan.wildcat:
+        sets.append(
+            "    if extras and extras[0]:\n        _dict_update(o, extras[0])\n"
+        )
+    source = (
+        f"def {_RECONSTRUCT_NAME}(names, *values):\n"
+        "    if names is not _names and names != _names:\n"
+        "        return _reconstruct_renamed(_cls, names, values)\n"
+        + unpack
+        + "    o = _new(_cls)\n"
+        + "".join(sets)
+        + "    return o\n"
+    )
+    reconstruct = _compile(
+        cls,
+        _RECONSTRUCT_NAME,
+        source,
+        dict(
+            _cls=cls,
+            _names=plan.names,
+            _reconstruct_renamed=_reconstruct_renamed,
+            _new=cls.__new__,
+            _setattr=object.__setattr__,
+            _dict_update=dict.update,
+        ),
+    )
+    # pickled by reference, as an attribute of the class
+    reconstruct.__module__ = cls.__module__
+    reconstruct.__qualname__ = f"{cls.__qualname__}.{_RECONSTRUCT_NAME}"
+    return reconstruct
+
+
+def _make_reduce(cls: type, plan: _Plan) -> ty.Callable[[ty.Any, int], ty.Any]:
+    values = "".join(f"self.{name}, " for name in plan.names)
+    checks = ["self.__class__ is not _cls"]
+    if plan.has_dict and not plan.slotted:
+        # anything else in the instance dict is pickled as state
+        checks.append(f"len(self.__dict__) != {len(plan.names)}")
+    elif plan.has_dict:
+        checks.append("self.__dict__")
+    lines = [
+        "def __reduce_ex__(self, protocol):\n",
+        f"    if {' or '.join(checks)}:\n",
+        "        return _reduce_cat(self, protocol)\n",
+    ]
+    if plan.wildcat:
+        lines.append(
+            "    if _dict_len(self):\n"
+            f"        return (_reconstruct, (_names, {values}_dict_copy(self)))\n"
+        )
+    lines.append(f"    return (_reconstruct, (_names, {values}))\n")
+    return _compile(
+        cls,
+        "__reduce_ex__",
+        "".join(lines),
+        dict(
+            _cls=cls,
+            _names=plan.names,
+            _reduce_cat=_reduce_cat,
+            _dict_len=dict.__len__,
+            _dict_copy=dict.copy,
+            _reconstruct=getattr(cls, _RECONSTRUCT_NAME),
+        ),
+    )
+
+
+def install_reduce(cls: type) -> None:
+    """Gives an attrs class the compact __reduce_ex__, unless it defines its own pickling."""
+    if _defines_pickling(cls):
+        return
+    plan = _make_plan(cls)
+    setattr(cls, _RECONSTRUCT_NAME, staticmethod(_make_reconstruct(cls, plan)))
+    # pickle calls __reduce_ex__ first; object's would look up __reduce__ on every call
+    setattr(cls, "__reduce_ex__", _make_reduce(cls, plan))
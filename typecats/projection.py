@@ -0,0 +1,232 @@
+"""Projections structure only a chosen subset of a Cat's fields.
+
+A listing endpoint that displays three fields of a sixty-field Cat
+should not pay to structure the other fifty-seven, some of which may be
+large nested subtrees. A Projection resolves the structure hooks for its
+fields once, and then structures only those keys.
+
+Projected instances belong to a subclass of the Cat whose repr, equality,
+hash and pickling use only the projected attributes, and which a
+TypecatsConverter unstructures to only those keys.
+"""
+
+import threading
+import typing as ty
+
+import attr
+from cattrs import Converter
+from cattrs.errors import AttributeValidationNote, ClassValidationError
+
+from .exceptions import (
+    _consolidate_exceptions,
+    _embed_exception_info,
+    StructuringError,
+)
+from .types import C, StrucInput
+
+
+class _ProjectedField(ty.NamedTuple):
+    attribute: attr.Attribute
+    key: str
+    type: ty.Any
+    hook: ty.Callable[[ty.Any, ty.Any], ty.Any]
+
+
+def _resolve_fields(
+    converter: Converter, cls: type, names: ty.AbstractSet[str]
+) -> ty.Tuple[_ProjectedField, ...]:
+    attribs = attr.fields(cls)
+    if any(isinstance(a.type, str) for a in attribs):
+        # PEP 563 annotations - need to be resolved.
+        attr.resolve_types(cls)
+        attribs = attr.fields(cls)
+    unknown = set(names) - {a.name for a in attribs}
+    if unknown:
+        raise ValueError(
+            f"Cannot project {sorted(unknown)}; they are not attributes of {cls.__name__}"
+        )
+    use_alias = getattr(converter, "use_alias", False)
+    return tuple(
+        _ProjectedField(
+            a,
+            a.alias if use_alias else a.name,
+            a.type,
+            (
+                converter.get_structure_hook(a.type)
+                if a.type is not None
+                else lambda v, _t: v
+            ),
+        )
+        for a in attribs
+        if a.name in names
+    )
+
+
+_PROJECTED_ATTR = "__typecats_projected__"
+
+_PROJECTED_CLASSES: ty.Dict[ty.Tuple[type, ty.FrozenSet[str]], type] = dict()
+_PROJECTED_CLASSES_LOCK = threading.Lock()
+
+
+def projected_names(cls: ty.Any) -> ty.Optional[ty.FrozenSet[str]]:
+    """The projected attribute names, if cls is the class of projected instances."""
+    return vars(cls).get(_PROJECTED_ATTR) if isinstance(cls, type) else None
+
+
+def _reconstruct_projected(
+    cls: type, items: ty.Tuple[ty.Tuple[str, ty.Any], ...]
+) -> ty.Any:
+    projected = projected_class(cls, frozenset(name for name, _ in items))
+    instance = projected.__new__(projected)  # type: ignore[call-overload]
+    for name, value in items:
+        object.__setattr__(instance, name, value)
+    return instance
+
+
+def _make_projected_class(cls: type, names: ty.FrozenSet[str]) -> type:
+    ordered = tuple(a.name for a in attr.fields(cls) if a.name in names)
+
+    def values(self: ty.Any) -> ty.Tuple[ty.Any, ...]:
+        return tuple(getattr(self, name) for name in ordered)
+
+    def __repr__(self: ty.Any) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in ordered)
+        return f"{cls.__qualname__}[projected]({fields})"
+
+    def __eq__(self: ty.Any, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return values(self) == values(other)
+
+    def __ne__(self: ty.Any, other: object) -> bool:
+        result = __eq__(self, other)
+        return result if result is NotImplemented else not result
+
+    def __hash__(self: ty.Any) -> int:
+        return hash(values(self))
+
+    def __reduce__(self: ty.Any, _protocol: ty.Any = None) -> ty.Tuple[ty.Any, ...]:
+        return (_reconstruct_projected, (cls, tuple(zip(ordered, values(self)))))
+
+    return type(
+        cls.__name__,
+        (cls,),
+        {
+            "__slots__": (),
+            "__module__": cls.__module__,
+            "__qualname__": cls.__qualname__,
+            "__repr__": __repr__,
+            "__eq__": __eq__,
+            "__ne__": __ne__,
+            "__hash__": __hash__ if cls.__hash__ is not None else None,
+            "__reduce__": __reduce__,
+            "__reduce_ex__": __reduce__,
+            _PROJECTED_ATTR: names,
+        },
+    )
+
+
+def projected_class(cls: type, names: ty.AbstractSet[str]) -> type:
+    """The class of the instances of cls on which only names are set."""
+    key = (cls, frozenset(names))
+    projected = _PROJECTED_CLASSES.get(key)
+    if projected is None:
+        with _PROJECTED_CLASSES_LOCK:
+            projected = _PROJECTED_CLASSES.get(key)
+            if projected is None:
+                projected = _PROJECTED_CLASSES[key] = _make_projected_class(*key)
+    return projected
+
+
+class Projection(ty.Generic[C]):
+    """Structures a fixed subset of the attributes of a Cat.
+
+    The result is an instance of the Cat on which only the projected
+    attributes are set; any other attribute raises AttributeError when
+    accessed. Its class is a subclass of the Cat; see projected_class.
+    Neither __init__ nor __attrs_post_init__ is run, but the validators
+    of the projected attributes are. For Wildcats, the untyped (dict)
+    part of the input is not retained.
+
+    Obtain these via YourCat.projection(*names) or
+    converter.projection(YourCat, names), which are cached per field set.
+    """
+
+    def __init__(
+        self, converter: Converter, cls: ty.Type[C], names: ty.AbstractSet[str]
+    ):
+        self.cls = cls
+        self.names = frozenset(names)
+        self._converter = converter
+        self._fields = _resolve_fields(converter, cls, self.names)
+        self._projected_cls = projected_class(cls, self.names)
+
+    def __repr__(self) -> str:
+        return f"Projection({self.cls.__name__}, {sorted(self.names)})"
+
+    def struc(self, d: StrucInput) -> C:
+        try:
+            with _consolidate_exceptions(self._converter, self.cls):
+                return self._struc(d)
+        except StructuringError as e:
+            _embed_exception_info(e, d, self.cls)
+            raise e
+
+    __call__ = struc
+
+    def _struc(self, d: StrucInput) -> C:
+        cls = self.cls
+        detailed = self._converter.detailed_validation
+        projected = self._projected_cls
+        instance = projected.__new__(projected)  # type: ignore[call-overload]
+        errors: ty.List[Exception] = list()
+        for field in self._fields:
+            a = field.attribute
+            try:
+                if field.key in d:
+                    value = field.hook(d[field.key], field.type)
+                    if a.converter is not None:
+                        value = a.converter(value)  # type: ignore[operator]
+                elif isinstance(a.default, attr.Factory):  # type: ignore[arg-type]
+                    factory = a.default.factory  # type: ignore[union-attr]
+                    value = (
+                        factory(instance)
+                        if a.default.takes_self  # type: ignore[union-attr]
+                        else factory()
+                    )
+                elif a.default is not attr.NOTHING:
+                    value = a.default
+                else:
+                    raise KeyError(field.key)
+                object.__setattr__(instance, a.name, value)
+            except Exception as e:
+                if not detailed:
+                    raise
+                e.__notes__ = getattr(e, "__notes__", []) + [
+                    AttributeValidationNote(
+                        f"Structuring class {cls.__qualname__} @ attribute {a.name}",
+                        a.name,
+                        field.type,
+                    )
+                ]
+                errors.append(e)
+        if errors:
+            raise ClassValidationError(f"While structuring {cls.__name__}", errors, cls)
+
+        if attr.validators.get_disabled():
+            return instance
+        try:
+            for field in self._fields:
+                if field.attribute.validator is not None:
+                    field.attribute.validator(
+                        instance,
+                        field.attribute,
+                        getattr(instance, field.attribute.name),
+                    )
+        except Exception as e:
+            if not detailed:
+                raise
+            raise ClassValidationError(
+                f"While structuring {cls.__name__}", [e], cls
+            ) from e
+        return instance
@@ -0,0 +1,129 @@
+"""Structuring Cats from row tuples, as returned by database drivers.
+
+`MyCat.struc_row(row)` and `MyCat.struc_rows(rows, columns=[...])` map
+column positions straight to attributes, without building a dict per
+row. For each class and column list, a constructor is generated once
+that calls the converter's hook for each column and passes the results
+to the class by keyword, so attrs validators run as usual.
+
+When a row fails, it is structured again as a dict through the normal
+struc path, so errors are exactly those struc would raise. Columns that
+are not attributes are ignored, except by Wildcats, which keep them.
+"""
+
+import typing as ty
+
+import attr
+from cattrs import Converter
+
+from .changes import clear_changes, tracks_changes
+from .types import C
+from .wildcat import is_wildcat
+
+
+def _row_fn_source(kwargs: ty.Sequence[ty.Tuple[int, str, bool, bool]]) -> str:
+    def value(i: int, hooked: bool, decoded: bool) -> str:
+        v = f"_d{i}(row[{i}])" if decoded else f"row[{i}]"
+        return f"_h{i}({v}, _t{i})" if hooked else v
+
+    args = "".join(
+        f"        {alias}={value(i, hooked, decoded)},\n"
+        for i, alias, hooked, decoded in kwargs
+    )
+    return f"def struc_row(row):\n    return _cls(\n{args}    )\n"
+
+
+Decoder = ty.Callable[[ty.Any], ty.Any]
+
+
+def _unchanged(value: ty.Any) -> ty.Any:
+    return value
+
+
+class RowStructurer(ty.Generic[C]):
+    """Structures rows whose values are in the order of `columns`.
+
+    `decoders` maps column names to functions applied to their raw
+    values before anything else, e.g. to parse JSON text.
+    """
+
+    def __init__(
+        self,
+        converter: Converter,
+        cls: ty.Type[C],
+        columns: ty.Sequence[str],
+        decoders: ty.Optional[ty.Mapping[str, Decoder]] = None,
+    ):
+        decoders = decoders or dict()
+        self.cls = cls
+        self.columns = tuple(columns)
+        self._converter = converter
+        self._decoders = [
+            (i, decoders[c]) for i, c in enumerate(self.columns) if c in decoders
+        ]
+        cat_cls: type = cls
+        if any(isinstance(a.type, str) for a in attr.fields(cat_cls)):
+            # PEP 563 annotations - need to be resolved.
+            attr.resolve_types(cat_cls)
+        use_alias = getattr(converter, "use_alias", False)
+        by_key = {
+            (a.alias if use_alias else a.name): a
+            for a in attr.fields(cat_cls)
+            if a.init
+        }
+        unknown = [c for c in self.columns if c not in by_key]
+        if len(set(self.columns)) != len(self.columns):
+            raise ValueError(f"Duplicate columns in {self.columns}")
+
+        namespace: ty.Dict[str, ty.Any] = dict(_cls=cls)
+        kwargs = list()
+        for i, column in enumerate(self.columns):
+            a = by_key.get(column)
+            if a is None:
+                continue
+            hooked = a.type is not None
+            if hooked:
+                namespace[f"_h{i}"] = converter.get_structure_hook(a.type)
+                namespace[f"_t{i}"] = a.type
+            decoded = column in decoders
+            if decoded:
+                namespace[f"_d{i}"] = decoders[column]
+            kwargs.append((i, a.alias, hooked, decoded))
+        source = _row_fn_source(kwargs)
+        exec(  # pylint: disable=exec-used
+            compile(source, f"<typecats struc_row {cls.__qualname__}>", "exec"),
+            namespace,
+        )
+        self._construct: ty.Callable[[ty.Sequence[ty.Any]], C] = namespace["struc_row"]
+        self._extras = (
+            [
+                (i, c, decoders.get(c, _unchanged))
+                for i, c in enumerate(self.columns)
+                if c in unknown
+            ]
+            if is_wildcat(cls)
+            else []
+        )
+        self._clear_changes = is_wildcat(cls) and tracks_changes(cls)
+
+    def struc(self, row: ty.Sequence[ty.Any]) -> C:
+        if len(row) != len(self.columns):
+            return self._struc_dict(row)
+        try:
+            obj = self._construct(row)
+        except Exception:  # noqa # re-done below for the errors struc would raise
+            return self._struc_dict(row)
+        if self._extras:
+            obj.update({c: decode(row[i]) for i, c, decode in self._extras})  # type: ignore[attr-defined]
+            if self._clear_changes:
+                clear_changes(obj)
+        return obj
+
+    __call__ = struc
+
+    def _struc_dict(self, row: ty.Sequence[ty.Any]) -> C:
+        d = dict(zip(self.columns, row))
+        for i, decode in self._decoders:
+            if i < len(row):
+                d[self.columns[i]] = decode(row[i])
+        return self._converter.structure(d, self.cls)
@@ -0,0 +1,129 @@
+"""Structure and unstructure hooks for datetimes, dates, Decimals and UUIDs.
+
+    register_scalar_hooks(converter, cache_size=1024)
+
+registers, on the given converter (by default, the typecats default
+converter):
+
+- datetime and date: structured from ISO 8601 strings with
+  `fromisoformat`, and unstructured with `isoformat`. With a cache_size,
+  the most recently parsed strings are kept, which pays off for
+  timestamps that repeat across records; datetimes are immutable, so
+  they can be shared.
+- Decimal: structured from str, int or float (via its repr, so 0.1 is
+  Decimal("0.1")), and unstructured to str, unless decimal_as_str=False.
+- UUID: structured from strings, canonical ones without a detour
+  through `UUID.__init__`, and unstructured to str.
+
+Values that already have the type are passed through when structuring,
+except that datetimes are converted to dates with `.date()` for date
+attributes; other types raise a TypeError. The unstructure hooks are registered for
+the exact types, so Optional attributes, which are unstructured by the
+runtime type of their value, use them too.
+"""
+
+import functools
+import typing as ty
+import uuid
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+
+import cattrs
+
+from .tc import _TYPECATS_DEFAULT_CONVERTER
+
+_new_uuid = object.__new__
+_set_slot = object.__setattr__
+_SAFE_UNKNOWN = uuid.SafeUUID.unknown
+
+
+def _parse_uuid(value: str) -> uuid.UUID:
+    if len(value) == 36 and value[8] == value[13] == value[18] == value[23] == "-":
+        digits = value.replace("-", "")
+        # int() would also accept signs, underscores, spaces and non-ASCII digits
+        if len(digits) == 32 and digits.isascii() and digits.isalnum():
+            try:
+                number = int(digits, 16)
+            except ValueError:
+                pass
+            else:
+                u = _new_uuid(uuid.UUID)
+                _set_slot(u, "int", number)
+                _set_slot(u, "is_safe", _SAFE_UNKNOWN)
+                return u
+    return uuid.UUID(value)
+
+
+def _structure_from_str(
+    typ: type, parse: ty.Callable[[str], ty.Any]
+) -> ty.Callable[[ty.Any, ty.Any], ty.Any]:
+    def structure(value: ty.Any, _Type: ty.Any) -> ty.Any:
+        if value.__class__ is str:
+            return parse(value)
+        if isinstance(value, typ):
+            return value
+        if isinstance(value, str):
+            return parse(str(value))
+        raise TypeError(f"Cannot structure a {typ.__name__} from {type(value)}")
+
+    return structure
+
+
+def _structure_date(
+    parse: ty.Callable[[str], ty.Any],
+) -> ty.Callable[[ty.Any, ty.Any], ty.Any]:
+    structure_from_str = _structure_from_str(date, parse)
+
+    def structure(value: ty.Any, _Type: ty.Any) -> ty.Any:
+        if value.__class__ is str:
+            return parse(value)
+        # a datetime is a date, but doesn't compare equal to one
+        if isinstance(value, datetime):
+            return value.date()
+        return structure_from_str(value, _Type)
+
+    return structure
+
+
+def _structure_decimal(value: ty.Any, _Type: ty.Any) -> Decimal:
+    cls = value.__class__
+    if cls is str or cls is int:
+        try:
+            return Decimal(value)
+        except InvalidOperation:
+            raise ValueError(f"Invalid Decimal: {value!r}") from None
+    if cls is float:
+        return Decimal(repr(value))
+    if isinstance(value, Decimal):
+        return value
+    raise TypeError(f"Cannot structure a Decimal from {type(value)}")
+
+
+def register_scalar_hooks(
+    converter: cattrs.Converter = _TYPECATS_DEFAULT_CONVERTER,
+    *,
+    cache_size: int = 0,
+    decimal_as_str: bool = True,
+) -> None:
+    """Registers the hooks described in typecats.scalars on converter."""
+    parse_datetime: ty.Callable[[str], ty.Any] = datetime.fromisoformat
+    parse_date: ty.Callable[[str], ty.Any] = date.fromisoformat
+    if cache_size:
+        parse_datetime = functools.lru_cache(maxsize=cache_size)(parse_datetime)
+        parse_date = functools.lru_cache(maxsize=cache_size)(parse_date)
+
+    converter.register_structure_hook(
+        datetime, _structure_from_str(datetime, parse_datetime)
+    )
+    converter.register_structure_hook(date, _structure_date(parse_date))
+    converter.register_structure_hook(Decimal, _structure_decimal)
+    converter.register_structure_hook(
+        uuid.UUID, _structure_from_str(uuid.UUID, _parse_uuid)
+    )
+
+    # the C methods themselves, rather than lambdas calling them
+    converter.register_unstructure_hook(datetime, datetime.isoformat)
+    converter.register_unstructure_hook(date, date.isoformat)
+    if decimal_as_str:
+        converter.register_unstructure_hook(Decimal, Decimal.__str__)
+    converter.register_unstructure_hook(uuid.UUID, uuid.UUID.__str__)
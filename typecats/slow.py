@@ -0,0 +1,176 @@
+"""Reporting of slow or oversized top-level structuring and unstructuring.
+
+`converter.set_slow_structuring_hook(hook, threshold_ms=..., max_payload_nodes=...)`
+regenerates the converter's Cat hooks so that every top-level call
+(one not nested inside another Cat) is timed. When it takes longer than
+threshold_ms, or its payload has more than max_payload_nodes nodes, the
+hook is called with a SlowStructuringReport and the payload (the input
+when structuring, the output when unstructuring).
+
+Nested Cats are traced per thread: the report includes the Cat nesting
+depth reached and the inclusive time spent per nested class. The size
+of a payload is only counted up to max_payload_nodes unless a report is
+made, so huge payloads are not walked twice.
+"""
+
+import logging
+import threading
+import time
+import typing as ty
+
+from .instrument import STRUCTURE, UNSTRUCTURE
+
+logger = logging.getLogger(__name__)
+
+
+class PayloadSummary(ty.NamedTuple):
+    nodes: int
+    largest_container: int
+    depth: int
+
+
+class SlowStructuringReport(ty.NamedTuple):
+    operation: str
+    cls: ty.Any
+    elapsed_s: float
+    payload: PayloadSummary
+    depth: int
+    class_times: ty.Mapping[ty.Any, float]
+    failed: bool
+
+
+SlowStructuringHook = ty.Callable[[SlowStructuringReport, ty.Any], None]
+
+
+def summarize_payload(obj: ty.Any, limit: ty.Optional[int] = None) -> PayloadSummary:
+    """Counts the nodes of an unstructured payload, stopping once more than limit have been seen."""
+    nodes = 0
+    largest = 0
+    max_depth = 0
+    stack = [(obj, 1)]
+    while stack:
+        value, depth = stack.pop()
+        nodes += 1
+        if depth > max_depth:
+            max_depth = depth
+        if limit is not None and nodes > limit:
+            break
+        if isinstance(value, ty.Mapping):
+            children: ty.Iterable[ty.Any] = value.values()
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            children = value
+        else:
+            continue
+        largest = max(largest, len(value))
+        stack.extend((child, depth + 1) for child in children)
+    return PayloadSummary(nodes, largest, max_depth)
+
+
+class _Trace:
+    __slots__ = ("depth", "max_depth", "class_times")
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.max_depth = 0
+        self.class_times: ty.Dict[ty.Any, float] = dict()
+
+
+class SlowDetector:
+    def __init__(
+        self,
+        hook: SlowStructuringHook,
+        threshold_ms: ty.Optional[float] = None,
+        max_payload_nodes: ty.Optional[int] = None,
+    ):
+        if threshold_ms is None and max_payload_nodes is None:
+            raise ValueError("Give a threshold_ms, a max_payload_nodes, or both")
+        self.hook = hook
+        self.threshold_s = threshold_ms / 1000 if threshold_ms is not None else None
+        self.max_payload_nodes = max_payload_nodes
+        self._traces = {STRUCTURE: threading.local(), UNSTRUCTURE: threading.local()}
+
+    def _report(
+        self,
+        operation: str,
+        cls: ty.Any,
+        payload: ty.Any,
+        elapsed: float,
+        trace: _Trace,
+        failed: bool,
+    ) -> None:
+        slow = self.threshold_s is not None and elapsed >= self.threshold_s
+        if not slow and self.max_payload_nodes is not None:
+            counted = summarize_payload(payload, self.max_payload_nodes)
+            slow = counted.nodes > self.max_payload_nodes
+        if not slow:
+            return
+        report = SlowStructuringReport(
+            operation,
+            cls,
+            elapsed,
+            summarize_payload(payload),
+            trace.max_depth,
+            trace.class_times,
+            failed,
+        )
+        try:
+            self.hook(report, payload)
+        except Exception:  # noqa # broad catch because this is nonessential
+            logger.exception("Slow structuring hook failure")
+
+    def _traced(
+        self,
+        operation: str,
+        cls: ty.Any,
+        call: ty.Callable[[], ty.Any],
+        payload: ty.Any,
+    ) -> ty.Any:
+        local = self._traces[operation]
+        perf_counter = time.perf_counter
+        trace = getattr(local, "trace", None)
+        if trace is not None:
+            trace.depth += 1
+            trace.max_depth = max(trace.max_depth, trace.depth)
+            start = perf_counter()
+            try:
+                return call()
+            finally:
+                elapsed = perf_counter() - start
+                trace.class_times[cls] = trace.class_times.get(cls, 0.0) + elapsed
+                trace.depth -= 1
+
+        trace = local.trace = _Trace()
+        start = perf_counter()
+        res = None
+        failed = True
+        try:
+            res = call()
+            failed = False
+            return res
+        finally:
+            elapsed = perf_counter() - start
+            local.trace = None
+            self._report(
+                operation,
+                cls,
+                payload if operation == STRUCTURE else res,
+                elapsed,
+                trace,
+                failed,
+            )
+
+    def wrap_structure(
+        self, hook: ty.Callable[[ty.Any, ty.Any], ty.Any], cls: ty.Any
+    ) -> ty.Callable[[ty.Any, ty.Any], ty.Any]:
+        def structure_detected(d: ty.Any, Type: ty.Any) -> ty.Any:
+            return self._traced(STRUCTURE, cls, lambda: hook(d, Type), d)
+
+        return structure_detected
+
+    def wrap_unstructure(
+        self, hook: ty.Callable[[ty.Any], ty.Any], cls: ty.Any
+    ) -> ty.Callable[[ty.Any], ty.Any]:
+        def unstructure_detected(obj: ty.Any) -> ty.Any:
+            return self._traced(UNSTRUCTURE, cls, lambda: hook(obj), None)
+
+        return unstructure_detected
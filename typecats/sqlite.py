@@ -0,0 +1,134 @@
+"""Structuring Cats straight from sqlite3 queries.
+
+    cursor = conn.cursor()
+    cursor.row_factory = cat_row_factory(Order)
+    orders = cursor.execute("SELECT id, lines FROM orders").fetchall()
+
+    for order in iter_cats(conn.execute("SELECT * FROM orders"), Order):
+        ...
+
+Columns are matched to attributes by name once per cursor description
+(i.e. once per query), and rows are structured positionally with a
+RowStructurer. Columns whose attribute is a Cat or a collection hold
+JSON text, which is parsed before structuring; `json_columns` names
+further JSON columns, such as the extras of a Wildcat.
+
+`converter` must be the converter the Cat was defined with if it is
+not the default one.
+"""
+
+import json
+import sqlite3
+import typing as ty
+
+import attr
+from cattrs import Converter
+
+from .limits import is_limited_type
+from .rows import Decoder, RowStructurer
+from .tc import _TYPECATS_DEFAULT_CONVERTER
+from .types import C, is_union
+
+DescriptionT = ty.Tuple[ty.Tuple[ty.Any, ...], ...]
+
+
+def _loads(value: ty.Any) -> ty.Any:
+    if isinstance(value, (str, bytes)):
+        return json.loads(value)
+    return value
+
+
+def _is_json_type(typ: ty.Any) -> bool:
+    args = ty.get_args(typ)
+    if is_union(typ) and type(None) in args:
+        return any(_is_json_type(arg) for arg in args if arg is not type(None))
+    return is_limited_type(typ)
+
+
+def json_decoders(
+    cls: type, converter: Converter, json_columns: ty.Iterable[str] = ()
+) -> ty.Dict[str, Decoder]:
+    if any(isinstance(a.type, str) for a in attr.fields(cls)):
+        # PEP 563 annotations - need to be resolved.
+        attr.resolve_types(cls)
+    use_alias = getattr(converter, "use_alias", False)
+    decoders: ty.Dict[str, Decoder] = {
+        (a.alias if use_alias else a.name): _loads
+        for a in attr.fields(cls)
+        if a.init and _is_json_type(a.type)
+    }
+    decoders.update((column, _loads) for column in json_columns)
+    return decoders
+
+
+class _CursorStructurer(ty.Generic[C]):
+    """Caches a RowStructurer for the last description and converter hooks seen."""
+
+    def __init__(
+        self, cls: ty.Type[C], converter: Converter, json_columns: ty.Iterable[str]
+    ):
+        self.cls = cls
+        self._converter = converter
+        self._json_columns = tuple(json_columns)
+        self._key: ty.Tuple[ty.Optional[DescriptionT], int] = (None, -1)
+        self._structurer: ty.Optional[RowStructurer[C]] = None
+
+    def for_description(self, description: DescriptionT) -> RowStructurer[C]:
+        generation = getattr(self._converter, "structure_generation", 0)
+        description_seen, generation_seen = self._key
+        structurer = self._structurer
+        if (
+            structurer is None
+            or description is not description_seen
+            or generation != generation_seen
+        ):
+            structurer = RowStructurer(
+                self._converter,
+                self.cls,
+                [d[0] for d in description],
+                json_decoders(
+                    ty.cast(type, self.cls), self._converter, self._json_columns
+                ),
+            )
+            self._key = (description, generation)
+            self._structurer = structurer
+        return structurer
+
+
+def cat_row_factory(
+    cls: ty.Type[C],
+    *,
+    json_columns: ty.Iterable[str] = (),
+    converter: Converter = _TYPECATS_DEFAULT_CONVERTER,
+) -> ty.Callable[[sqlite3.Cursor, ty.Sequence[ty.Any]], C]:
+    """A sqlite3 row_factory that makes a Cat of each row."""
+    structurers = _CursorStructurer(cls, converter, json_columns)
+
+    def cat_row(cursor: sqlite3.Cursor, row: ty.Sequence[ty.Any]) -> C:
+        return structurers.for_description(cursor.description).struc(row)
+
+    return cat_row
+
+
+def iter_cats(
+    cursor: sqlite3.Cursor,
+    cls: ty.Type[C],
+    *,
+    size: ty.Optional[int] = None,
+    json_columns: ty.Iterable[str] = (),
+    converter: Converter = _TYPECATS_DEFAULT_CONVERTER,
+) -> ty.Iterator[C]:
+    """Yields a Cat per row of an executed cursor, fetching `size` rows at a time.
+
+    The cursor must return plain rows (tuples or sqlite3.Row).
+    """
+    structurer = _CursorStructurer(cls, converter, json_columns).for_description(
+        cursor.description
+    )
+    size = size or cursor.arraysize
+    while True:
+        rows = cursor.fetchmany(size)
+        if not rows:
+            return
+        for row in rows:
+            yield structurer.struc(row)
@@ -1,12 +1,21 @@
+"""Deprecated, and to be removed in the next release; typecats no longer
+uses it. Use `contextvar.set`/`contextvar.reset` directly."""
+
 import contextlib as cl
 import contextvars as cv
 import typing as ty
+import warnings
 
 T = ty.TypeVar("T")
 
 
 @cl.contextmanager
 def stack_context(contextvar: cv.ContextVar[T], value: T) -> ty.Iterator[None]:
+    warnings.warn(
+        "typecats.stack_context is deprecated and will be removed in the next release",
+        DeprecationWarning,
+        stacklevel=3,
+    )
     try:
         token = contextvar.set(value)
         yield
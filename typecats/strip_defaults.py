@@ -1,18 +1,35 @@
 from __future__ import annotations
 
+import contextvars as cv
 import typing as ty
+import warnings
 from functools import lru_cache
-import contextvars as cv
 
 import attr
 from attr import has as is_attrs_class
 
 from typing import Literal
 
-ShouldStripDefaults = cv.ContextVar("TypecatsShouldStripDefaults", default=False)
+_MISSING = object()
 
+# Deprecated; see __getattr__. Set while a TypecatsConverter unstructures
+# with strip_defaults, and honored if set by callers.
+_SHOULD_STRIP_DEFAULTS: cv.ContextVar[bool] = cv.ContextVar(
+    "TypecatsShouldStripDefaults", default=False
+)
 
-_MISSING = object()
+
+def __getattr__(name: str) -> ty.Any:
+    if name == "ShouldStripDefaults":
+        warnings.warn(
+            "typecats.strip_defaults.ShouldStripDefaults is deprecated and will be "
+            "removed in the next release; use unstruc(strip_defaults=True), or "
+            "register hooks as factories that take the converter.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return _SHOULD_STRIP_DEFAULTS
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 @lru_cache(128)
@@ -0,0 +1,135 @@
+"""An opt-in, size-bounded cache of structured frozen Cats keyed on their input.
+
+Enable with `@Cat(frozen=True, struc_cache_size=256)`. Structuring a
+payload that is structurally identical to a recently structured one
+returns the already-built (immutable) instance instead of structuring
+it again. Payloads containing anything other than mappings, lists,
+tuples and str/int/float/bool/bytes/None scalars are never cached.
+
+The cache is emptied when the converter's structure hooks change (its
+structure_generation), since cached instances were built with the old
+hooks.
+"""
+
+import threading
+import typing as ty
+from collections import OrderedDict
+
+from .types import C, StrucInput
+
+_STRUC_CACHE_ATTR = "__typecats_struc_cache__"
+
+_SCALARS = (str, int, float, bool, bytes, type(None))
+
+
+class StrucCacheInfo(ty.NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _Uncacheable(Exception):
+    pass
+
+
+def _canonical(value: ty.Any) -> ty.Hashable:
+    # The type is part of the key so that e.g. 1, 1.0 and True,
+    # which compare (and hash) equal, are not conflated.
+    if isinstance(value, _SCALARS):
+        return (type(value), value)
+    if isinstance(value, ty.Mapping):
+        return (dict, frozenset((k, _canonical(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_canonical(v) for v in value))
+    raise _Uncacheable()
+
+
+def canonical_key(d: ty.Any) -> ty.Optional[ty.Hashable]:
+    """A hashable key that is equal for structurally identical payloads, or
+    None if the payload contains values that cannot be keyed safely.
+    """
+    try:
+        return _canonical(d)
+    except (_Uncacheable, TypeError):
+        # TypeError: an unhashable mapping key
+        return None
+
+
+class StrucCache(ty.Generic[C]):
+    """A thread-safe LRU cache of structured objects keyed on their canonical input."""
+
+    def __init__(self, maxsize: int):
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be positive; got {maxsize}")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache: ty.OrderedDict[ty.Hashable, C] = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation: ty.Optional[int] = None
+
+    def struc(
+        self, d: StrucInput, struc: ty.Callable[[StrucInput], C], generation: int = 0
+    ) -> C:
+        """Structures d with struc, unless an identical payload was cached.
+
+        generation identifies the hooks struc uses; cached instances from
+        another generation are discarded.
+        """
+        key = canonical_key(d)
+        if key is None:
+            return struc(d)
+        with self._lock:
+            if generation != self._generation:
+                self._cache.clear()
+                self._generation = generation
+            res = self._cache.get(key)
+            if res is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return res
+            self.misses += 1
+        res = struc(d)
+        with self._lock:
+            if generation != self._generation:
+                return res  # the hooks changed while structuring
+            self._cache[key] = res
+            if len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        return res
+
+    def info(self) -> StrucCacheInfo:
+        return StrucCacheInfo(self.hits, self.misses, self.maxsize, len(self._cache))
+
+    def invalidate(self) -> None:
+        """Discards the cached instances, keeping the hit and miss counts."""
+        with self._lock:
+            self._cache.clear()
+            self._generation = None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+def make_struc_cache(
+    cls: type, maxsize: int, attrs_kwargs: ty.Mapping[str, ty.Any]
+) -> StrucCache:
+    if not attrs_kwargs.get("frozen"):
+        raise TypeError(
+            f"Cannot share structured instances of mutable Cat {cls.__name__}"
+        )
+    if dict in cls.__mro__:
+        raise TypeError(
+            f"Cannot share structured instances of Wildcat {cls.__name__}; "
+            "its dict part is mutable"
+        )
+    return StrucCache(maxsize)
+
+
+def get_struc_cache(cls: type) -> ty.Optional[StrucCache]:
+    """The struc cache of a Cat defined with struc_cache_size, if any."""
+    return vars(cls).get(_STRUC_CACHE_ATTR)
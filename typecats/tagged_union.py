@@ -0,0 +1,126 @@
+"""Structuring Unions of Cats that are discriminated by a Literal field.
+
+    @Cat
+    class Created:
+        kind: Literal["created"]
+        id: str
+
+    @Cat
+    class Deleted:
+        kind: Literal["deleted"]
+        id: str
+
+    Event = Union[Created, Deleted]
+
+A TypecatsConverter structures `Event` by looking up the value of
+`kind` in a tag -> class index built once, when the hook is generated,
+rather than trying each member. A union qualifies when every member
+(other than None) is an attrs class with a Literal field of the same
+name, and no Literal value belongs to more than one member.
+"""
+
+import enum
+import types
+import typing as ty
+
+import attr
+from attr import has as is_attrs_class
+from cattrs import Converter
+
+from .exceptions import UnknownUnionTagError
+
+
+def _union_members(typ: ty.Any) -> ty.Optional[ty.Tuple[type, ...]]:
+    """The non-None members of a Union."""
+    if ty.get_origin(typ) not in (ty.Union, types.UnionType):
+        return None
+    return tuple(a for a in ty.get_args(typ) if a is not type(None))
+
+
+def _literal_fields(member: type) -> ty.Dict[str, ty.Tuple[ty.Any, ...]]:
+    core = ty.get_origin(member) or member
+    fields = attr.fields(core)
+    if any(isinstance(a.type, str) for a in fields):
+        attr.resolve_types(core)
+        fields = attr.fields(core)
+    return {
+        a.name: ty.get_args(a.type)
+        for a in fields
+        if ty.get_origin(a.type) is ty.Literal
+    }
+
+
+def _tag_values(values: ty.Iterable[ty.Any]) -> ty.Iterator[ty.Any]:
+    for value in values:
+        yield value
+        if isinstance(value, enum.Enum):
+            # payloads carry the value of an Enum literal
+            yield value.value
+
+
+def find_union_tag(
+    typ: ty.Any,
+) -> ty.Optional[ty.Tuple[str, ty.Dict[ty.Any, type]]]:
+    """The discriminating field name of a Union of attrs classes and its tag -> member index,
+    or None if the Union is not discriminated by a Literal field.
+    """
+    members = _union_members(typ)
+    if (
+        members is None
+        or len(members) < 2
+        or not all(is_attrs_class(ty.get_origin(m) or m) for m in members)
+    ):
+        return None
+    literals = [_literal_fields(m) for m in members]
+    for name in literals[0]:
+        if not all(name in fields for fields in literals):
+            continue
+        index: ty.Dict[ty.Any, type] = dict()
+        for member, fields in zip(members, literals):
+            for value in _tag_values(fields[name]):
+                if index.setdefault(value, member) is not member:
+                    break
+            else:
+                continue
+            break
+        else:
+            return name, index
+    return None
+
+
+def is_tagged_cat_union(typ: ty.Any) -> bool:
+    return find_union_tag(typ) is not None
+
+
+def make_tagged_union_structure_fn(
+    converter: Converter, typ: ty.Any
+) -> ty.Callable[[ty.Any, ty.Any], ty.Any]:
+    found = find_union_tag(typ)
+    assert found is not None, f"{typ} is not a tagged union"
+    name, index = found
+    allows_none = type(None) in ty.get_args(typ)
+    key = name
+    if getattr(converter, "use_alias", False):
+        first = next(iter(index.values()))
+        key = attr.fields_dict(ty.get_origin(first) or first)[name].alias or name
+    hooks = {tag: (converter.get_structure_hook(m), m) for tag, m in index.items()}
+    expected = ", ".join(repr(tag) for tag in index)
+
+    def unknown_tag(obj: ty.Any) -> UnknownUnionTagError:
+        if isinstance(obj, ty.Mapping) and key in obj:
+            problem = f"Unknown {key!r} tag {obj[key]!r}"
+        else:
+            problem = f"Missing {key!r} tag"
+        msg = f"{problem} for {typ}; expected one of {expected}"
+        return UnknownUnionTagError(msg, [ValueError(msg)], typ)
+
+    def structure_tagged_union(obj: ty.Any, _type: ty.Any) -> ty.Any:
+        if obj is None and allows_none:
+            return None
+        try:
+            hook, member = hooks[obj[key]]
+        except (KeyError, TypeError):
+            raise unknown_tag(obj) from None
+        return hook(obj, member)
+
+    return structure_tagged_union
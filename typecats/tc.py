@@ -1,14 +1,41 @@
 """Utilities for using attrs types with cattrs"""
 
+import enum
 import typing as ty
+from concurrent.futures import Executor
 from functools import partial
 
 import attr
 import cattrs
 
+from .aio import DEFAULT_BUDGET_MS, StrucMethod, astruc_iter, astruc_many
+from .batch import struc_many
 from .attrs_shim import make_disallow_empties_transformer
+from .columns import CatColumns, struc_columns
+from .compact import CompactCodec
+from .changes import (
+    _TRACKS_CHANGES_ATTR,
+    get_changes,
+    inherits_change_tracking,
+    make_change_tracking_kwargs,
+    mixin_wildcat_change_tracking,
+    tracks_changes,
+)
 from .constants import CLASSES_INCOMPATIBLE_WITH_ATTRS
 from .converter import TypecatsConverter
+from .enums import RAISE, EnumUnknown, register_enum_hooks
+from .strip_defaults import _SHOULD_STRIP_DEFAULTS
+from .struc_cache import _STRUC_CACHE_ATTR, get_struc_cache, make_struc_cache
+from .unstruc_cache import (
+    _CACHES_UNSTRUC_ATTR,
+    check_unstruc_cacheable,
+    check_unstruc_fields_immutable,
+)
+from .limits import StructuringLimits
+from .pickling import install_reduce
+from .projection import Projection
+from .rows import RowStructurer
+from .slow import SlowStructuringHook
 from .wildcat import (
     mixin_wildcat_post_attrs_methods,
     setup_warnings_for_dangerous_dict_subclass_operations,
@@ -21,8 +48,6 @@ from .exceptions import (
     TypecatsCommonExceptionHook,
     StructuringError,
 )
-from .strip_defaults import ShouldStripDefaults
-from .stack_context import stack_context
 
 
 class TypeCat:
@@ -35,14 +60,89 @@ class TypeCat:
     """
 
     @classmethod
-    def struc(cls, d: StrucInput) -> ty.Self:
+    def struc(
+        cls,
+        d: StrucInput,
+        *,
+        only: ty.Optional[ty.AbstractSet[str]] = None,
+        limits: ty.Optional[StructuringLimits] = None,
+    ) -> ty.Self:
+        raise NotImplementedError
+
+    @classmethod
+    def try_struc(
+        cls,
+        d: ty.Optional[StrucInput],
+        *,
+        only: ty.Optional[ty.AbstractSet[str]] = None,
+        limits: ty.Optional[StructuringLimits] = None,
+    ) -> ty.Optional[ty.Self]:
+        raise NotImplementedError
+
+    @classmethod
+    def projection(cls, *names: str) -> Projection[ty.Self]:
+        raise NotImplementedError
+
+    @classmethod
+    def struc_columns(cls, records: ty.Iterable[StrucInput]) -> CatColumns[ty.Self]:
+        raise NotImplementedError
+
+    @classmethod
+    def struc_many(
+        cls,
+        items: ty.Iterable[StrucInput],
+        *,
+        threads: int = 1,
+        executor: ty.Optional[Executor] = None,
+    ) -> ty.List[ty.Self]:
+        raise NotImplementedError
+
+    @classmethod
+    def struc_row(
+        cls, row: ty.Sequence[ty.Any], *, columns: ty.Optional[ty.Sequence[str]] = None
+    ) -> ty.Self:
+        raise NotImplementedError
+
+    @classmethod
+    def struc_compact(cls, payload: ty.Sequence[ty.Any]) -> ty.Self:
+        raise NotImplementedError
+
+    @classmethod
+    def struc_rows(
+        cls,
+        rows: ty.Iterable[ty.Sequence[ty.Any]],
+        *,
+        columns: ty.Optional[ty.Sequence[str]] = None,
+    ) -> ty.List[ty.Self]:
+        raise NotImplementedError
+
+    @classmethod
+    async def astruc_many(
+        cls,
+        items: ty.Iterable[StrucInput],
+        *,
+        budget_ms: float = DEFAULT_BUDGET_MS,
+        executor: ty.Optional[Executor] = None,
+        offload_above: int = 0,
+    ) -> ty.List[ty.Self]:
         raise NotImplementedError
 
     @classmethod
-    def try_struc(cls, d: ty.Optional[StrucInput]) -> ty.Optional[ty.Self]:
+    def astruc_iter(
+        cls, items: ty.Iterable[StrucInput], *, budget_ms: float = DEFAULT_BUDGET_MS
+    ) -> ty.AsyncIterator[ty.Self]:
         raise NotImplementedError
 
-    def unstruc(self, *, strip_defaults: bool = False) -> dict[str, ty.Any]:
+    def unstruc(
+        self,
+        *,
+        strip_defaults: bool = False,
+        include: ty.Optional[ty.AbstractSet[str]] = None,
+        exclude: ty.Optional[ty.AbstractSet[str]] = None,
+    ) -> dict[str, ty.Any]:
+        raise NotImplementedError
+
+    def unstruc_compact(self, *, strip_defaults: bool = False) -> list:
         raise NotImplementedError
 
 
@@ -63,9 +163,17 @@ def make_struc(
 
 
 def make_unstruc(converter: TypecatsConverter):
-    def _unstruc(obj: ty.Any, *, strip_defaults: bool = False) -> ty.Any:
+    def _unstruc(
+        obj: ty.Any,
+        *,
+        strip_defaults: bool = False,
+        include: ty.Optional[ty.AbstractSet[str]] = None,
+        exclude: ty.Optional[ty.AbstractSet[str]] = None,
+    ) -> ty.Any:
         """A wrapper for cattrs unstructure using the internal converter."""
-        return converter.unstructure(obj, strip_defaults=strip_defaults)
+        return converter.unstructure(
+            obj, strip_defaults=strip_defaults, include=include, exclude=exclude
+        )
 
     return _unstruc
 
@@ -97,6 +205,27 @@ unstruc = make_unstruc(_TYPECATS_DEFAULT_CONVERTER)
 try_struc = partial(_try_struc, struc)
 
 
+def set_structuring_limits(limits: ty.Optional[StructuringLimits]) -> None:
+    """Applies StructuringLimits to everything structured by the default converter.
+    See TypecatsConverter.set_structuring_limits.
+    """
+    _TYPECATS_DEFAULT_CONVERTER.set_structuring_limits(limits)
+
+
+def set_slow_structuring_hook(
+    hook: ty.Optional[SlowStructuringHook],
+    *,
+    threshold_ms: ty.Optional[float] = None,
+    max_payload_nodes: ty.Optional[int] = None,
+) -> None:
+    """Reports slow or oversized struc/unstruc calls on the default converter.
+    See TypecatsConverter.set_slow_structuring_hook.
+    """
+    _TYPECATS_DEFAULT_CONVERTER.set_slow_structuring_hook(
+        hook, threshold_ms=threshold_ms, max_payload_nodes=max_payload_nodes
+    )
+
+
 def get_default_converter() -> TypecatsConverter:
     """Intended only for advanced uses"""
     return _TYPECATS_DEFAULT_CONVERTER
@@ -126,11 +255,10 @@ def set_detailed_validation_mode_not_threadsafe(enabled=True):
     """
     Controls the cattrs converter detailed validation mode.
     Cattrs claims a 25% performance improvement from disabling detailed validation mode, YMMV.
-    WARNING: Not thread safe.
+    WARNING: Structuring concurrently with this call may still use hooks from the old mode.
     You should only call this once, preferrably at the start of your application.
     """
-    _TYPECATS_DEFAULT_CONVERTER.detailed_validation = enabled
-    _TYPECATS_DEFAULT_CONVERTER._structure_func.clear_cache()
+    _TYPECATS_DEFAULT_CONVERTER.set_detailed_validation(enabled)
 
 
 # Overloads disambiguate the bare (@Cat) and factory (@Cat(...)) call forms.
@@ -149,6 +277,10 @@ def Cat(
     auto_attribs: bool = ...,
     disallow_empties: bool = ...,
     converter: TypecatsConverter = ...,
+    track_changes: bool = ...,
+    cache_unstruc: bool = ...,
+    struc_cache_size: int = ...,
+    enum_unknown: EnumUnknown = ...,
     **kwargs: ty.Any,
 ) -> ty.Type[C]: ...
 
@@ -166,6 +298,10 @@ def Cat(
     auto_attribs: bool = ...,
     disallow_empties: bool = ...,
     converter: TypecatsConverter = ...,
+    track_changes: bool = ...,
+    cache_unstruc: bool = ...,
+    struc_cache_size: int = ...,
+    enum_unknown: EnumUnknown = ...,
     **kwargs: ty.Any,
 ) -> ty.Callable[[ty.Type[C]], ty.Type[C]]: ...
 
@@ -175,6 +311,10 @@ def Cat(
     auto_attribs=True,
     disallow_empties=True,
     converter: TypecatsConverter = _TYPECATS_DEFAULT_CONVERTER,
+    track_changes: bool = False,
+    cache_unstruc: bool = False,
+    struc_cache_size: int = 0,
+    enum_unknown: EnumUnknown = RAISE,
     **kwargs,
 ):
     """A Cat knows how to take care of itself.
@@ -201,28 +341,68 @@ def Cat(
     default Converter. You may supply your own TypecatsConverter instance
     via the `converter` keyword argument.
 
+    Mutable Cats may opt in to `track_changes`, which records the
+    attributes (and Wildcat keys) changed after structuring, and adds an
+    `unstruc_changes` method that unstructures only those keys. Cat
+    subclasses of such a Cat track changes too.
+
+    Frozen Cats with immutable attribute types may opt in to
+    `cache_unstruc`, which computes the unstructured form of each
+    instance only once and returns that same dict every time, and to a
+    `struc_cache_size`, which returns an already-structured instance
+    for payloads identical to one of the most recently structured.
+
+    Cats pickle compactly and unpickle without running validators,
+    unless they define their own pickling; see typecats.pickling.
+
+    Enum Cats structure from their values with a precomputed lookup;
+    `enum_unknown` chooses what unknown values structure to (by
+    default they raise). See typecats.enums.
+
     """
 
     def _skip_attrs(cls) -> bool:
         return issubclass(cls, CLASSES_INCOMPATIBLE_WITH_ATTRS)
 
     def make_cat(cls: ty.Type[C]) -> ty.Type[C]:
+        if issubclass(cls, enum.Enum):
+            register_enum_hooks(converter, cls, enum_unknown)
+        elif enum_unknown != RAISE:
+            raise TypeError("enum_unknown only applies to Enum Cats")
         if _skip_attrs(cls):
             set_struc_converter(cls, converter)
             set_unstruc_converter(cls, converter)
             return cls
 
         user_transformer = kwargs.get("field_transformer")
+        attrs_kwargs = {k: v for k, v in kwargs.items() if k != "field_transformer"}
+        tracking = track_changes or inherits_change_tracking(cls)
+        if tracking:
+            attrs_kwargs = make_change_tracking_kwargs(cls, attrs_kwargs)
+        if cache_unstruc:
+            check_unstruc_cacheable(cls, attrs_kwargs)
+        if struc_cache_size:
+            struc_cache = make_struc_cache(cls, struc_cache_size, attrs_kwargs)
         cls = attr.attrs(
             cls,
             auto_attribs=auto_attribs,
             field_transformer=make_disallow_empties_transformer(
                 disallow_empties, user_transformer
             ),
-            **{k: v for k, v in kwargs.items() if k != "field_transformer"},
+            **attrs_kwargs,
         )
         if is_wildcat(cls):
             setup_warnings_for_dangerous_dict_subclass_operations(cls)
+        install_reduce(cls)
+        if cache_unstruc:
+            check_unstruc_fields_immutable(cls)
+            setattr(cls, _CACHES_UNSTRUC_ATTR, True)
+        if struc_cache_size:
+            setattr(cls, _STRUC_CACHE_ATTR, struc_cache)
+        if tracking:
+            setattr(cls, _TRACKS_CHANGES_ATTR, True)
+            if is_wildcat(cls):
+                mixin_wildcat_change_tracking(cls)
 
         set_struc_converter(cls, converter)
         set_unstruc_converter(cls, converter)
@@ -239,7 +419,35 @@ def Cat(
 
 STRUCTURE_NAME = "struc"
 TRY_STRUCTURE_NAME = "try_struc"
+PROJECTION_NAME = "projection"
+STRUCTURE_COLUMNS_NAME = "struc_columns"
+STRUCTURE_MANY_NAME = "struc_many"
+STRUCTURE_ROW_NAME = "struc_row"
+STRUCTURE_ROWS_NAME = "struc_rows"
+ASYNC_STRUCTURE_MANY_NAME = "astruc_many"
+ASYNC_STRUCTURE_ITER_NAME = "astruc_iter"
 UNSTRUCTURE_NAME = "unstruc"
+UNSTRUCTURE_CHANGES_NAME = "unstruc_changes"
+STRUCTURE_COMPACT_NAME = "struc_compact"
+UNSTRUCTURE_COMPACT_NAME = "unstruc_compact"
+
+
+def _make_resolved_structure(
+    converter: TypecatsConverter, cls: ty.Type[C]
+) -> ty.Callable[[StrucInput], C]:
+    resolved: ty.Tuple[int, ty.Any] = (-1, None)
+
+    def structure_resolved(d: StrucInput) -> C:
+        nonlocal resolved
+        generation, hook = resolved
+        if generation != converter.structure_generation:
+            # read the generation first, so a concurrent change re-resolves next time
+            generation = converter.structure_generation
+            hook = converter.get_structure_hook(cls)
+            resolved = (generation, hook)
+        return hook(d, cls)
+
+    return structure_resolved
 
 
 def set_struc_converter(
@@ -254,18 +462,92 @@ def set_struc_converter(
     reset that here. By default, it is defined by the converter
     keyword argument to the Cat decorator.
 
+    Passing `only` (a set of attribute names) to either method
+    structures only those attributes; see `Projection`.
+
+    Passing `limits` applies StructuringLimits to that call; this
+    requires a TypecatsConverter.
+
+    Cats defined with `struc_cache_size` consult their StrucCache first.
+
+    With a TypecatsConverter, the structure hook for the class is
+    resolved once and reused until the converter's hooks change.
+
+    `struc_columns` structures many records into a columnar CatColumns,
+    `struc_many` structures many records across threads,
+    `struc_row`/`struc_rows` structure tuples whose values are in the
+    order of `columns` (by default, the order of the attributes),
+    `struc_compact` structures the output of `unstruc_compact`, and
+    `astruc_many`/`astruc_iter` structure many records without
+    blocking a running event loop.
+
     """
 
-    def struc_cat(d: StrucInput) -> C:
+    def projection(*names: str) -> Projection[C]:
+        if isinstance(converter, TypecatsConverter):
+            return converter.projection(cls, set(names))
+        return Projection(converter, cls, set(names))
+
+    struc_cache = get_struc_cache(cls)
+    if struc_cache is not None:
+        struc_cache.invalidate()  # built by the previous converter
+
+    def _structure_dispatched(d: StrucInput) -> C:
+        return converter.structure(d, cls)
+
+    _structure_whole = (
+        _make_resolved_structure(converter, cls)
+        if isinstance(converter, TypecatsConverter)
+        else _structure_dispatched
+    )
+
+    def _structure_limited(
+        d: StrucInput,
+        only: ty.Optional[ty.AbstractSet[str]],
+        limits: StructuringLimits,
+    ) -> C:
+        if not isinstance(converter, TypecatsConverter):
+            raise TypeError("Structuring limits require a TypecatsConverter")
+        limited = converter.limited(limits)
+        if only is not None:
+            return limited.projection(cls, set(only)).struc(d)
+        return limited.structure(d, cls)
+
+    def _structure(
+        d: StrucInput,
+        only: ty.Optional[ty.AbstractSet[str]],
+        limits: ty.Optional[StructuringLimits] = None,
+    ) -> C:
+        if limits is not None:
+            return _structure_limited(d, only, limits)
+        if only is not None:
+            return projection(*only).struc(d)
+        if struc_cache is not None:
+            return struc_cache.struc(
+                d, _structure_whole, getattr(converter, "structure_generation", 0)
+            )
+        return _structure_whole(d)
+
+    def struc_cat(
+        d: StrucInput,
+        *,
+        only: ty.Optional[ty.AbstractSet[str]] = None,
+        limits: ty.Optional[StructuringLimits] = None,
+    ) -> C:
         try:
-            return converter.structure(d, cls)
+            return _structure(d, only, limits)
         except StructuringError as e:
             hook_common_errors(e, d, cls, _extract_typecats_stack_if_any(e))
             raise e
 
-    def try_struc_cat(d: ty.Optional[StrucInput]) -> ty.Optional[C]:
+    def try_struc_cat(
+        d: ty.Optional[StrucInput],
+        *,
+        only: ty.Optional[ty.AbstractSet[str]] = None,
+        limits: ty.Optional[StructuringLimits] = None,
+    ) -> ty.Optional[C]:
         try:
-            return converter.structure(d, cls)
+            return _structure(d, only, limits)  # type: ignore[arg-type]
         except StructuringError:
             return None
         except Exception as e:
@@ -276,6 +558,111 @@ def set_struc_converter(
 
     setattr(cls, STRUCTURE_NAME, staticmethod(struc_cat))
     setattr(cls, TRY_STRUCTURE_NAME, staticmethod(try_struc_cat))
+    setattr(cls, PROJECTION_NAME, staticmethod(projection))
+
+    def struc_columns_cat(records: ty.Iterable[StrucInput]) -> CatColumns[C]:
+        try:
+            return struc_columns(converter, cls, records)
+        except StructuringError as e:
+            hook_common_errors(e, records, cls, _extract_typecats_stack_if_any(e))
+            raise e
+
+    setattr(cls, STRUCTURE_COLUMNS_NAME, staticmethod(struc_columns_cat))
+
+    def struc_many_cat(
+        items: ty.Iterable[StrucInput],
+        *,
+        threads: int = 1,
+        executor: ty.Optional[Executor] = None,
+    ) -> ty.List[C]:
+        return struc_many(struc_cat, items, threads=threads, executor=executor)
+
+    setattr(cls, STRUCTURE_MANY_NAME, staticmethod(struc_many_cat))
+
+    row_structurers: ty.Dict[ty.Tuple[str, ...], RowStructurer[C]] = dict()
+
+    def row_structurer(columns: ty.Optional[ty.Sequence[str]]) -> RowStructurer[C]:
+        if columns is None:
+            use_alias = getattr(converter, "use_alias", False)
+            columns = [
+                a.alias if use_alias else a.name
+                for a in attr.fields(ty.cast(type, cls))
+                if a.init
+            ]
+        if isinstance(converter, TypecatsConverter):
+            return converter.row_structurer(cls, columns)
+        key = tuple(columns)
+        if key not in row_structurers:
+            row_structurers[key] = RowStructurer(converter, cls, key)
+        return row_structurers[key]
+
+    def struc_row_cat(
+        row: ty.Sequence[ty.Any], *, columns: ty.Optional[ty.Sequence[str]] = None
+    ) -> C:
+        try:
+            return row_structurer(columns).struc(row)
+        except StructuringError as e:
+            hook_common_errors(e, row, cls, _extract_typecats_stack_if_any(e))
+            raise e
+
+    def struc_rows_cat(
+        rows: ty.Iterable[ty.Sequence[ty.Any]],
+        *,
+        columns: ty.Optional[ty.Sequence[str]] = None,
+    ) -> ty.List[C]:
+        struc = row_structurer(columns).struc
+        res: ty.List[C] = list()
+        append = res.append
+        for row in rows:
+            try:
+                append(struc(row))
+            except StructuringError as e:
+                hook_common_errors(e, row, cls, _extract_typecats_stack_if_any(e))
+                raise e
+        return res
+
+    setattr(cls, STRUCTURE_ROW_NAME, staticmethod(struc_row_cat))
+
+    compact_codecs: ty.List[CompactCodec] = list()
+
+    def struc_compact_cat(payload: ty.Sequence[ty.Any]) -> C:
+        if isinstance(converter, TypecatsConverter):
+            codec = converter.compact_codec()
+        else:
+            if not compact_codecs:
+                compact_codecs.append(CompactCodec(converter))
+            codec = compact_codecs[0]
+        try:
+            return codec.decode(payload, cls)
+        except StructuringError as e:
+            hook_common_errors(e, payload, cls, _extract_typecats_stack_if_any(e))
+            raise e
+
+    setattr(cls, STRUCTURE_COMPACT_NAME, staticmethod(struc_compact_cat))
+    setattr(cls, STRUCTURE_ROWS_NAME, staticmethod(struc_rows_cat))
+
+    def astruc_many_cat(
+        items: ty.Iterable[StrucInput],
+        *,
+        budget_ms: float = DEFAULT_BUDGET_MS,
+        executor: ty.Optional[Executor] = None,
+        offload_above: int = 0,
+    ) -> ty.Awaitable[ty.List[C]]:
+        return astruc_many(
+            StrucMethod(cls),
+            items,
+            budget_ms=budget_ms,
+            executor=executor,
+            offload_above=offload_above,
+        )
+
+    def astruc_iter_cat(
+        items: ty.Iterable[StrucInput], *, budget_ms: float = DEFAULT_BUDGET_MS
+    ) -> ty.AsyncIterator[C]:
+        return astruc_iter(struc_cat, items, budget_ms=budget_ms)
+
+    setattr(cls, ASYNC_STRUCTURE_MANY_NAME, staticmethod(astruc_many_cat))
+    setattr(cls, ASYNC_STRUCTURE_ITER_NAME, staticmethod(astruc_iter_cat))
 
 
 def set_unstruc_converter(
@@ -286,26 +673,90 @@ def set_unstruc_converter(
     can reset it here. By default, it is defined by the converter
     keyword argument on the Cat decorator.
 
-    The converter must be a TypecatsConverter; strip_defaults behavior
-    relies on the ShouldStripDefaults context var being honored during
-    unstructuring, which is only guaranteed for TypecatsConverter.
+    The converter must be a TypecatsConverter, which provides the
+    strip_defaults and include/exclude behavior.
+
+    `include` and `exclude` limit the top-level keys of the result;
+    attributes that are left out are never unstructured.
+
+    The unstructure hook for the class is resolved once and reused
+    until the converter's hooks change.
+
+    Cats that track changes also get `unstruc_changes`, which
+    unstructures only the changed keys.
+
+    `unstruc_compact` produces the positional form read by
+    `struc_compact`; see typecats.compact.
     """
     if not isinstance(converter, TypecatsConverter):
         raise TypeError(
             f"set_unstruc_converter requires a TypecatsConverter; got {type(converter)}"
         )
 
-    def _unstruc(obj, *, strip_defaults: bool = False):
-        with stack_context(ShouldStripDefaults, strip_defaults):
-            return converter.unstructure(obj)
+    resolved: ty.Tuple[int, ty.Any] = (-1, None)
+
+    def _unstruc(
+        obj,
+        *,
+        strip_defaults: bool = False,
+        include: ty.Optional[ty.AbstractSet[str]] = None,
+        exclude: ty.Optional[ty.AbstractSet[str]] = None,
+    ):
+        nonlocal resolved
+        if (
+            strip_defaults
+            or include is not None
+            or exclude is not None
+            or obj.__class__ is not cls
+            or _SHOULD_STRIP_DEFAULTS.get()
+        ):
+            return converter.unstructure(
+                obj, strip_defaults=strip_defaults, include=include, exclude=exclude
+            )
+        generation, hook = resolved
+        if generation != converter.unstructure_generation:
+            generation = converter.unstructure_generation
+            hook = converter.get_unstructure_hook(cls)
+            resolved = (generation, hook)
+        return hook(obj)
 
     setattr(cls, UNSTRUCTURE_NAME, _unstruc)
 
+    if tracks_changes(cls):
+
+        def _unstruc_changes(obj, *, strip_defaults: bool = False):
+            if not tracks_changes(obj.__class__):
+                raise TypeError(
+                    f"{obj.__class__.__name__} does not track changes; "
+                    "decorate it with @Cat rather than attrs"
+                )
+            changes = get_changes(obj)
+            res = converter.unstructure(
+                obj, strip_defaults=strip_defaults, include=changes
+            )
+            if strip_defaults:
+                # a change back to the default is still a change; only the
+                # values of changed attributes have their defaults stripped.
+                for a in attr.fields(type(obj)):
+                    key = a.alias if converter.use_alias else a.name
+                    if a.name in changes and key not in res:
+                        res[key] = converter.unstructure(
+                            getattr(obj, a.name), a.type, strip_defaults=True
+                        )
+            return res
+
+        setattr(cls, UNSTRUCTURE_CHANGES_NAME, _unstruc_changes)
+
+    def _unstruc_compact(obj, *, strip_defaults: bool = False) -> list:
+        return converter.compact_codec().encode(obj, cls, strip_defaults=strip_defaults)
+
+    setattr(cls, UNSTRUCTURE_COMPACT_NAME, _unstruc_compact)
+
 
 def unstruc_strip_defaults(obj: ty.Any) -> ty.Any:
     """A functional-ish interface for stripping defaults.
 
-    Note that if you need to use a specific converter,
-    you'll want to dig in and set this context directly.
+    To use a specific converter, call its
+    unstructure(obj, strip_defaults=True) instead.
     """
     return _TYPECATS_DEFAULT_CONVERTER.unstructure(obj, strip_defaults=True)
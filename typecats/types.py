@@ -1,3 +1,4 @@
+import types
 import typing as ty
 
 import attr
@@ -19,3 +20,29 @@ StructureHook = ty.Callable[[ty.Any, ty.Type[C]], C]
 
 StrucInput = ty.Mapping[str, ty.Any]
 UnstrucOutput = dict[str, ty.Any]
+
+
+def is_union(typ: ty.Any) -> bool:
+    """Whether typ is a Union, as either Union[X, Y] or X | Y."""
+    return ty.get_origin(typ) in (ty.Union, types.UnionType)
+
+
+def optional_arg(typ: ty.Any) -> ty.Any:
+    """The X of Optional[X] (or X | None), or None if typ is not an Optional of one type."""
+    args = ty.get_args(typ)
+    if is_union(typ) and len(args) == 2 and type(None) in args:
+        return args[0] if args[1] is type(None) else args[1]
+    return None
+
+
+@attr.s(frozen=True)
+class _Frozen:
+    pass
+
+
+_FROZEN_SETATTR = _Frozen.__setattr__
+
+
+def is_frozen_attrs(cls: type) -> bool:
+    """Whether cls is an attrs class that is frozen, itself or through a base class."""
+    return attr.has(cls) and cls.__setattr__ is _FROZEN_SETATTR
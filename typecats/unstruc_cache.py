@@ -0,0 +1,125 @@
+"""Opt-in memoization of unstruc results for frozen Cats.
+
+Enable with `@Cat(frozen=True, cache_unstruc=True)`. The unstructured
+attributes of such an object can never change, so they are computed once
+per instance (separately for plain and strip_defaults unstructuring).
+The untyped part of a Wildcat can still be mutated, so it is always
+unstructured afresh.
+
+The attribute types of the Cat, followed recursively, must not be
+mutable: lists, dicts, sets (and the abstract Sequence, Mapping and Set,
+which cattrs structures to them), Wildcats and attrs classes that are not
+frozen are rejected with a TypeError when the Cat is decorated. Use
+tuples, frozensets and frozen Cats instead.
+
+The cached result is shared: every call returns the same dict, which
+must not be modified.
+
+Cached results are tagged with a token of the converter that produced
+them, which the converter replaces whenever its unstructure hooks
+change; a result from another converter, or from older hooks, is
+recomputed.
+"""
+
+import collections
+import collections.abc as abc
+import typing as ty
+
+import attr
+
+from .types import is_frozen_attrs
+
+_CACHES_UNSTRUC_ATTR = "__typecats_caches_unstruc__"
+_CACHE_SLOTS = ("__typecats_unstruc", "__typecats_unstruc_stripped")
+
+_MUTABLE_TYPES = (list, dict, set, bytearray, collections.deque)
+# structured by cattrs to lists, dicts and sets
+_MUTABLE_ABCS = (
+    abc.Collection,
+    abc.Iterable,
+    abc.Mapping,
+    abc.MutableMapping,
+    abc.MutableSequence,
+    abc.MutableSet,
+    abc.Sequence,
+    abc.Set,
+)
+
+
+def caches_unstruc(cls: type) -> bool:
+    return getattr(ty.get_origin(cls) or cls, _CACHES_UNSTRUC_ATTR, False)
+
+
+def check_unstruc_cacheable(cls: type, attrs_kwargs: ty.Mapping[str, ty.Any]) -> None:
+    if not attrs_kwargs.get("frozen"):
+        raise TypeError(f"Cannot cache unstruc for mutable Cat {cls.__name__}")
+    if attrs_kwargs.get("slots"):
+        raise TypeError(f"Cannot cache unstruc for slotted Cat {cls.__name__}")
+
+
+def _resolved_fields(cls: type) -> ty.Tuple[attr.Attribute, ...]:
+    try:
+        # the class may refer to itself, before its name is bound
+        attr.resolve_types(cls, localns={cls.__name__: cls})
+    except NameError as e:
+        raise TypeError(
+            f"Cannot cache unstruc for a Cat with unresolvable attribute types: {e}"
+        ) from e
+    return attr.fields(cls)
+
+
+def _mutable_type(typ: ty.Any, seen: ty.Set[type]) -> ty.Optional[ty.Any]:
+    """The first mutable type found in typ, or None."""
+    origin = ty.get_origin(typ)
+    if origin is ty.Literal or origin is abc.Callable:
+        return None
+    args = ty.get_args(typ)
+    if origin is ty.Annotated:
+        return _mutable_type(args[0], seen)
+    base = origin or typ
+    if base in _MUTABLE_ABCS:
+        return typ
+    if isinstance(base, type):
+        if issubclass(base, _MUTABLE_TYPES):  # Wildcats too
+            return typ
+        if attr.has(base) and base not in seen:
+            seen.add(base)
+            if not is_frozen_attrs(base):
+                return base
+            for a in _resolved_fields(base):
+                found = _mutable_type(a.type, seen)
+                if found is not None:
+                    return found
+    for arg in args:
+        found = _mutable_type(arg, seen)
+        if found is not None:
+            return found
+    return None
+
+
+def check_unstruc_fields_immutable(cls: type) -> None:
+    """Raises a TypeError if an attribute of the attrs class cls may be mutated."""
+    seen = {cls}
+    for a in _resolved_fields(cls):
+        found = _mutable_type(a.type, seen)
+        if found is not None:
+            raise TypeError(
+                f"Cannot cache unstruc for Cat {cls.__name__}: attribute {a.name} "
+                f"may hold a mutable {getattr(found, '__name__', found)}"
+            )
+
+
+def get_cached(
+    obj: ty.Any, stripped: bool, token: object
+) -> ty.Optional[ty.Dict[str, ty.Any]]:
+    cached = obj.__dict__.get(_CACHE_SLOTS[stripped])
+    if cached is None or cached[0] is not token:
+        return None
+    return cached[1]
+
+
+def set_cached(
+    obj: ty.Any, stripped: bool, token: object, res: ty.Dict[str, ty.Any]
+) -> None:
+    # frozen attrs classes forbid normal attribute assignment
+    object.__setattr__(obj, _CACHE_SLOTS[stripped], (token, res))
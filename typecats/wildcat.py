@@ -23,7 +23,10 @@ def is_wildcat(cls: object) -> bool:
 
 
 def enrich_structured_wildcat(
-    wildcat: MWC, prestructured_obj_dict: ty.Mapping[ty.Any, ty.Any], Type: type
+    wildcat: MWC,
+    prestructured_obj_dict: ty.Mapping[ty.Any, ty.Any],
+    Type: type,
+    attrs_names: ty.Optional[ty.AbstractSet[str]] = None,
 ) -> None:
     """A Wildcat is a Cat (an attrs class) that additionally allows
     arbitrary key-value access as though it were a dict for data that
@@ -37,24 +40,35 @@ def enrich_structured_wildcat(
     unknown keys while still letting your code reason about the types
     that you do know about.
 
+    `attrs_names` may be passed by callers that have already computed
+    the attribute names of Type.
     """
+    if attrs_names is None:
+        attrs_names = get_attrs_names(Type)
     wildcat.update(
         {
             key: prestructured_obj_dict[key]
             for key in prestructured_obj_dict
-            if key not in get_attrs_names(Type)
+            if key not in attrs_names
         }
     )
 
 
 def enrich_unstructured_wildcat(
-    converter: Converter, obj: WC, unstructured_obj_dict: dict
+    converter: Converter,
+    obj: WC,
+    unstructured_obj_dict: dict,
+    keep: ty.Optional[ty.Callable[[ty.Any], bool]] = None,
 ) -> dict:
+    """Adds the untyped (dict) part of a Wildcat to its unstructured attributes.
+
+    If provided, `keep` decides which untyped keys are included.
+    """
     wildcat_attrs_names = get_attrs_names(type(obj))
     wildcat_nonattrs_dict = {
         key: converter.unstructure(obj[key])
         for key in obj
-        if key not in wildcat_attrs_names
+        if key not in wildcat_attrs_names and (keep is None or keep(key))
     }
     # note that typed entries take absolute precedence over untyped in case of collisions.
     # these collisions should generally be prevented at runtime by the wildcat